@@ -0,0 +1,275 @@
+"""
+Vectorized person-to-household aggregation of household characteristics.
+
+Persons are mapped to household rows with one sort of the household IDs, and
+each feature is then a NumPy scatter or bincount over that mapping. Missing
+values and dtypes follow what the equivalent pandas groupby/reindex would
+give, so the output matches the original implementation exactly.
+"""
+
+import numpy as np
+
+
+def household_index(household_id, person_household_id):
+    """
+    Map each person to the row of their household.
+
+    Parameters:
+    -----------
+    household_id : np.ndarray
+        Household IDs, one per household row
+    person_household_id : np.ndarray
+        Household ID of each person
+
+    Returns:
+    --------
+    np.ndarray
+        Household row of each person, or -1 if their household is unknown
+    """
+    order = np.argsort(household_id, kind="stable")
+    sorted_ids = household_id[order]
+    position = np.searchsorted(sorted_ids, person_household_id)
+    position = np.minimum(position, len(sorted_ids) - 1)
+    found = sorted_ids[position] == person_household_id
+    return np.where(found, order[position], -1)
+
+
+def _reindexed(values, present):
+    """
+    Give household values the dtype pandas reindexing would, with NaN for
+    households in which no value was present.
+    """
+    if present.all():
+        return values
+    if values.dtype.kind == "f":
+        result = values.copy()
+    else:
+        result = values.astype(np.float64)
+    result[~present] = np.nan
+    return result
+
+
+def first_per_household(values, person_household, selected, n_households):
+    """
+    Take the first non-missing value, in person order, among selected persons
+    of each household.
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Person-level values
+    person_household : np.ndarray
+        Household row of each person, from household_index
+    selected : np.ndarray
+        Boolean mask of persons to take values from
+    n_households : int
+        Number of household rows
+
+    Returns:
+    --------
+    tuple
+        (household values, boolean mask of households that had a value)
+    """
+    selected = selected & (person_household >= 0)
+    if values.dtype.kind == "f":
+        selected &= ~np.isnan(values)
+    persons = np.flatnonzero(selected)
+    # np.unique returns the first occurrence, and persons is in person order
+    households, first = np.unique(person_household[persons], return_index=True)
+    result = np.zeros(n_households, dtype=values.dtype)
+    result[households] = values[persons[first]]
+    present = np.zeros(n_households, dtype=bool)
+    present[households] = True
+    return result, present
+
+
+def rank_dependents(person_household, age, is_dependent, n_households):
+    """
+    Rank dependents within their household by age, breaking ties by person
+    order, like pandas rank(method="first").
+
+    Returns:
+    --------
+    tuple
+        (person positions of ranked dependents, their household rows,
+        zero-based ranks, number of dependents in each household row)
+    """
+    dependents = np.flatnonzero(is_dependent & (person_household >= 0))
+    households = person_household[dependents]
+    counts = np.bincount(households, minlength=n_households)
+
+    # Dependents with unknown ages are counted but not ranked
+    if age.dtype.kind == "f":
+        known = ~np.isnan(age[dependents])
+        dependents, households = dependents[known], households[known]
+
+    # Sort by household, then age, then person order
+    order = np.lexsort((dependents, age[dependents], households))
+    dependents, households = dependents[order], households[order]
+    group_start = np.searchsorted(households, households)
+    ranks = np.arange(len(households)) - group_start
+    return dependents, households, ranks, counts
+
+
+def dependent_age_matrix(
+    ages, households, ranks, num_dependents, max_dependents, n_households
+):
+    """
+    Pivot ranked dependent ages into one row per dependent position.
+
+    Ages are scattered into a preallocated (max_dependents, n_households)
+    array in one pass. Positions a household has no age for are NaN, except
+    that positions within its Number of Dependents are filled with 10.
+
+    Parameters:
+    -----------
+    ages : np.ndarray
+        Age of each ranked dependent
+    households : np.ndarray
+        Household row of each ranked dependent
+    ranks : np.ndarray
+        Zero-based rank of each dependent within their household
+    num_dependents : np.ndarray
+        Number of dependents of each household
+    max_dependents : int
+        Number of dependent positions
+    n_households : int
+        Number of household rows
+
+    Returns:
+    --------
+    list
+        One household array per dependent position, youngest first
+    """
+    dtype = ages.dtype if ages.dtype.kind == "f" else np.float64
+    matrix = np.full((max_dependents, n_households), np.nan, dtype=dtype)
+    matrix[ranks, households] = ages
+    present = ~np.isnan(matrix)
+    # Fill with 10 only for households that have at least i+1 dependents
+    fill = ~present & (num_dependents > np.arange(max_dependents)[:, None])
+    matrix[fill] = 10
+
+    columns = list(matrix)
+    if ages.dtype.kind != "f":
+        # Like a pandas reindex, integer ages stay integers in positions
+        # every household has an age for
+        for i in np.flatnonzero(present.all(axis=1)):
+            columns[i] = columns[i].astype(ages.dtype)
+    return columns
+
+
+def aggregate_household_features(household_id, person, num_dependents):
+    """
+    Derive household characteristics from the person table.
+
+    Ages, marital status and dependents come from the first tax unit of each
+    household (the one with the lowest tax unit ID among heads). Missing
+    spouse ages of married households are filled with 40, and missing ages
+    of dependents counted in Number of Dependents with 10.
+
+    Parameters:
+    -----------
+    household_id : np.ndarray
+        Household IDs, one per household row
+    person : dict or pd.DataFrame
+        Person-level columns household_id, tax_unit_id, age, is_head,
+        is_spouse, is_dependent, is_married and ssn_card_type
+    num_dependents : np.ndarray
+        Number of dependents of each household
+
+    Returns:
+    --------
+    dict
+        Household arrays num_tax_units, is_married, age_head, age_spouse,
+        ssn_citizen_ead and ssn_other_none, dependent_ages (a list with one
+        array per dependent position) and the person-level mask
+        is_first_tax_unit
+    """
+    n = len(household_id)
+    person_household = household_index(household_id, np.asarray(person["household_id"]))
+    tax_unit_id = np.asarray(person["tax_unit_id"])
+    age = np.asarray(person["age"])
+    is_head = np.asarray(person["is_head"], dtype=bool)
+    is_spouse = np.asarray(person["is_spouse"], dtype=bool)
+    is_dependent = np.asarray(person["is_dependent"], dtype=bool)
+    known = person_household >= 0
+
+    # Count tax units per household, and find the first one, from the
+    # unique (household, tax unit) pairs of heads
+    heads = np.flatnonzero(is_head & known)
+    head_units = np.unique(
+        np.rec.fromarrays([person_household[heads], tax_unit_id[heads]])
+    )
+    head_unit_households = head_units.f0
+    num_tax_units = np.bincount(head_unit_households, minlength=n)
+    has_head = num_tax_units > 0
+    if not has_head.all():
+        num_tax_units = num_tax_units.astype(np.float64)
+        num_tax_units[~has_head] = 1
+    households, first = np.unique(head_unit_households, return_index=True)
+    first_tax_unit = np.zeros(n, dtype=tax_unit_id.dtype)
+    first_tax_unit[households] = head_units.f1[first]
+
+    safe_household = np.where(known, person_household, 0)
+    is_first_tax_unit = (
+        known
+        & has_head[safe_household]
+        & (tax_unit_id == first_tax_unit[safe_household])
+    )
+
+    # Married status of the head of the first tax unit
+    married, present = first_per_household(
+        np.asarray(person["is_married"], dtype=bool),
+        person_household,
+        is_first_tax_unit & is_head,
+        n,
+    )
+    is_married = married & present
+
+    # Head and spouse ages from the first tax unit
+    age_head = _reindexed(
+        *first_per_household(age, person_household, is_first_tax_unit & is_head, n)
+    )
+    age_spouse = _reindexed(
+        *first_per_household(age, person_household, is_first_tax_unit & is_spouse, n)
+    )
+    # Fill missing spouse ages with 40 only if married
+    age_spouse = np.where(np.isnan(age_spouse) & is_married, 40, age_spouse)
+
+    # Dependent ages from the first tax unit, youngest first
+    dependents, dependent_households, ranks, dependent_counts = rank_dependents(
+        person_household, age, is_first_tax_unit & is_dependent, n
+    )
+    max_dependents = int(dependent_counts.max()) if n else 0
+    dependent_ages = dependent_age_matrix(
+        age[dependents],
+        dependent_households,
+        ranks,
+        num_dependents,
+        max_dependents,
+        n,
+    )
+
+    # SSN card type household counts
+    ssn_card_type = np.asarray(person["ssn_card_type"])
+    ssn_citizen_ead = np.bincount(
+        person_household[
+            known & np.isin(ssn_card_type, ["CITIZEN", "NON_CITIZEN_VALID_EAD"])
+        ],
+        minlength=n,
+    )
+    ssn_other_none = np.bincount(
+        person_household[known & np.isin(ssn_card_type, ["OTHER_NON_CITIZEN", "NONE"])],
+        minlength=n,
+    )
+
+    return {
+        "num_tax_units": num_tax_units,
+        "is_married": is_married,
+        "age_head": age_head,
+        "age_spouse": age_spouse,
+        "dependent_ages": dependent_ages,
+        "ssn_citizen_ead": ssn_citizen_ead,
+        "ssn_other_none": ssn_other_none,
+        "is_first_tax_unit": is_first_tax_unit,
+    }
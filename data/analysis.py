@@ -2,377 +2,569 @@
 Core analysis functions for tax reform impact calculations.
 """
 
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
 import pandas as pd
 import numpy as np
-from policyengine_us import Microsimulation
 
+from aggregation import aggregate_household_features
+from checkpoint import RunCheckpoint, baseline_fingerprint, step_fingerprints
+from datasets import shard_dataset
+from engine import microsimulation_class, reform_class
+from instrumentation import add_records, collect, peak_rss_bytes, record_arrays, stage
+from reforms import merge_parameter_dicts, merge_reforms, reform_parameter_dicts
+
+DATASET = "hf://policyengine/policyengine-us-data/enhanced_cps_2024.h5"
+
+# Output columns calculated directly from the baseline, mapped to households,
+# in output order. Columns derived from the person table are inserted in
+# calculate_baseline_snapshot.
+HOUSEHOLD_VARIABLES = {
+    "Household ID": "household_id",
+    "State": "state_code",
+    "Household Size": "household_size",
+    "Number of Dependents": "tax_unit_dependents",
+    "Employment Income": "irs_employment_income",
+    "Self-Employment Income": "self_employment_income",
+    "Capital Gains": "capital_gains",
+    "Dividend Income": "dividend_income",
+    "Farm Income": "farm_income",
+    "Taxable Interest Income": "taxable_interest_income",
+    "Rental Income": "rental_income",
+    "Taxable Unemployment Compensation": "taxable_unemployment_compensation",
+    "Miscellaneous Income": "miscellaneous_income",
+    "Taxable Retirement Distributions": "taxable_retirement_distributions",
+    "Taxable Pension Income": "taxable_pension_income",
+    "Taxable Social Security": "taxable_social_security",
+    "Property Taxes": "real_estate_taxes",
+    "State Income Tax": "state_income_tax",
+    "Tip Income": "tip_income",
+    "Overtime Income": "fsla_overtime_premium",
+    "Auto Loan Interest": "auto_loan_interest",
+    "Social Security Benefits": "social_security",
+    "Gross Income": "irs_gross_income",
+    "Adjusted Gross Income": "adjusted_gross_income",
+    "Market Income": "household_market_income",
+    "Baseline Federal Tax Liability": "income_tax",
+    "Baseline Net Income": "household_net_income_including_health_benefits",
+    "Baseline Benefits": "household_benefits",
+    "Baseline Medicaid": "medicaid",
+    "Baseline ACA PTC": "aca_ptc",
+    "Baseline CHIP": "chip",
+    "Household Weight": "household_weight",
+}
+
+# Person table columns used to derive household characteristics
+PERSON_VARIABLES = {
+    "household_id": "household_id",
+    "tax_unit_id": "tax_unit_id",
+    "age": "age",
+    "is_dependent": "is_tax_unit_dependent",
+    "is_head": "is_tax_unit_head",
+    "is_spouse": "is_tax_unit_spouse",
+    "is_married": "is_married",
+    "ssn_card_type": "ssn_card_type",
+}
+
+# Household variables calculated for every step of a reform stack
+STEP_VARIABLES = [
+    "income_tax",
+    "state_income_tax",
+    "household_net_income_including_health_benefits",
+    "household_benefits",
+    "medicaid",
+    "aca_ptc",
+    "chip",
+]
+
+
+@dataclass
+class BaselineSnapshot:
+    """
+    Baseline values needed to stack reform packages on one baseline.
 
-def calculate_stacked_household_impacts(reforms, baseline_reform, year):
+    A snapshot is computed once per baseline and year, and can be passed to
+    several calls of calculate_stacked_household_impacts.
     """
-    Calculate tax and income changes for each household after each reform is stacked.
+
+    year: int
+    dataset: str
+    # Household characteristics and baseline columns, in output order
+    household_columns: dict
+    # Person-level table used to derive household characteristics
+    person: pd.DataFrame
+    income_tax: np.ndarray
+    state_income_tax: np.ndarray
+    net_income: np.ndarray
+    total_benefits: np.ndarray
+
+
+def build_simulation(reform, dataset=DATASET):
+    """
+    Create the simulation of a reform on a dataset.
+
+    Datasets are normally a path or URL read by Microsimulation. Objects
+    with a simulation method, such as synthetic.SyntheticDataset, build
+    their own simulations instead, so the analysis can run offline.
+    """
+    if hasattr(dataset, "simulation"):
+        return dataset.simulation(reform)
+    return microsimulation_class()(reform=reform, dataset=dataset)
+
+
+def extract_variables(simulation, variables, map_to, year):
+    """
+    Calculate several variables onto one entity in a single pass.
+
+    Values are returned as plain arrays, skipping the weighted series that
+    Microsimulation.calculate builds by default, and each variable is only
+    calculated once even if it feeds several columns.
+
+    Parameters:
+    -----------
+    simulation : Microsimulation
+        Simulation to calculate from
+    variables : dict
+        Column names to variable names, e.g. HOUSEHOLD_VARIABLES
+    map_to : str
+        Entity to map every variable to, "household" or "person"
+    year : int
+        Tax year to calculate
+
+    Returns:
+    --------
+    dict
+        Column names to arrays, in the order of variables
+    """
+    calculated = {}
+    columns = {}
+    for column, variable in variables.items():
+        if variable not in calculated:
+            calculated[variable] = simulation.calculate(
+                variable, map_to=map_to, period=year, use_weights=False
+            )
+        columns[column] = calculated[variable]
+    return columns
+
+
+def calculate_baseline_snapshot(baseline_reform, year, dataset=DATASET):
+    """
+    Simulate the baseline and collect everything the stacked runs need from it.
 
     Parameters:
     -----------
-    reforms : dict
-        Dictionary of reform names to Reform objects
     baseline_reform : Reform
         The baseline reform to compare against
     year : int
         Tax year to analyze
+    dataset : str or SyntheticDataset
+        Dataset to simulate
 
     Returns:
     --------
-    pd.DataFrame
-        DataFrame with household impacts
+    BaselineSnapshot
+        Household characteristics, person table and baseline arrays
     """
 
-    dataset_path = "hf://policyengine/policyengine-us-data/enhanced_cps_2024.h5"
-
     # Calculate baseline values
     print("Calculating baseline values...")
-    baseline = Microsimulation(reform=baseline_reform, dataset=dataset_path)
-
-    # Get household-level baseline values
-    baseline_income_tax = baseline.calculate(
-        "income_tax", map_to="household", period=year
-    ).values
-    baseline_net_income = baseline.calculate(
-        "household_net_income_including_health_benefits",
-        map_to="household",
-        period=year,
-    ).values
-
-    # Get Benefit values
-    baseline_benefits = baseline.calculate(
-        "household_benefits", map_to="household", period=year
-    ).values
-    medicaid_benefits = baseline.calculate(
-        "medicaid", map_to="household", period=year
-    ).values
-    ptc_benefits = baseline.calculate("aca_ptc", map_to="household", period=year).values
-    chip_benefits = baseline.calculate("chip", map_to="household", period=year).values
-    total_benefits = (
-        medicaid_benefits + ptc_benefits + chip_benefits + baseline_benefits
-    )
+    with stage("simulation"):
+        baseline = build_simulation(baseline_reform, dataset)
+    return baseline_snapshot(baseline, year, dataset)
 
-    # Get household-level characteristics
-    household_id = baseline.calculate(
-        "household_id", map_to="household", period=year
-    ).values
-    state = baseline.calculate("state_code", map_to="household", period=year).values
-    household_size = baseline.calculate(
-        "household_size", map_to="household", period=year
-    ).values
-    num_dependents = baseline.calculate(
-        "tax_unit_dependents", map_to="household", period=year
-    ).values
-    employment_income = baseline.calculate(
-        "irs_employment_income", map_to="household", period=year
-    ).values
-    self_employment_income = baseline.calculate(
-        "self_employment_income", map_to="household", period=year
-    ).values
-    capital_gains = baseline.calculate(
-        "capital_gains", map_to="household", period=year
-    ).values
-    property_taxes = baseline.calculate(
-        "real_estate_taxes", map_to="household", period=year
-    ).values
-    state_income_tax = baseline.calculate(
-        "state_income_tax", map_to="household", period=year
-    ).values
-    tip_income = baseline.calculate(
-        "tip_income", map_to="household", period=year
-    ).values
-    overtime_income = baseline.calculate(
-        "fsla_overtime_premium", map_to="household", period=year
-    ).values
-    auto_loan_interest = baseline.calculate(
-        "auto_loan_interest", map_to="household", period=year
-    ).values
-    household_weight = baseline.calculate(
-        "household_weight", map_to="household", period=year
-    ).values
-    gross_income = baseline.calculate(
-        "irs_gross_income", map_to="household", period=year
-    ).values
-    agi = baseline.calculate(
-        "adjusted_gross_income", map_to="household", period=year
-    ).values
-    social_security_benefits = baseline.calculate(
-        "social_security", map_to="household", period=year
-    ).values
-    dividend_income = baseline.calculate(
-        "dividend_income", map_to="household", period=year
-    ).values
-    farm_income = baseline.calculate(
-        "farm_income", map_to="household", period=year
-    ).values
-    taxable_interest_income = baseline.calculate(
-        "taxable_interest_income", map_to="household", period=year
-    ).values
-    rental_income = baseline.calculate(
-        "rental_income", map_to="household", period=year
-    ).values
-    taxable_unemployment_compensation = baseline.calculate(
-        "taxable_unemployment_compensation", map_to="household", period=year
-    ).values
-    household_market_income = baseline.calculate(
-        "household_market_income", map_to="household", period=year
-    ).values
-    miscellaneous_income = baseline.calculate(
-        "miscellaneous_income", map_to="household", period=year
-    ).values
-    taxable_retirement_distributions = baseline.calculate(
-        "taxable_retirement_distributions", map_to="household", period=year
-    ).values
-    taxable_pension_income = baseline.calculate(
-        "taxable_pension_income", map_to="household", period=year
-    ).values
-    taxable_social_security = baseline.calculate(
-        "taxable_social_security", map_to="household", period=year
-    ).values
-
-    # Get person-level values
-    age = baseline.calculate("age", map_to="person", period=year).values
-    person_household = baseline.calculate(
-        "household_id", map_to="person", period=year
-    ).values
-    is_head = baseline.calculate(
-        "is_tax_unit_head", map_to="person", period=year
-    ).values
-    is_spouse = baseline.calculate(
-        "is_tax_unit_spouse", map_to="person", period=year
-    ).values
-    is_dependent = baseline.calculate(
-        "is_tax_unit_dependent", map_to="person", period=year
-    ).values
-    tax_unit_id = baseline.calculate("tax_unit_id", map_to="person", period=year).values
-    is_married = baseline.calculate("is_married", map_to="person", period=year).values
-    # Add ssn_card_type
-    ssn_card_type = baseline.calculate(
-        "ssn_card_type", map_to="person", period=year
-    ).values
-
-    # Create a DataFrame with person-level data
-    person_df = pd.DataFrame(
-        {
-            "household_id": person_household,
-            "tax_unit_id": tax_unit_id,
-            "age": age,
-            "is_dependent": is_dependent,
-            "is_head": is_head,
-            "is_spouse": is_spouse,
-            "is_married": is_married,
-            "ssn_card_type": ssn_card_type,
-        }
-    )
 
-    # Count tax units per household
-    tax_units_per_household = (
-        person_df[person_df["is_head"]].groupby("household_id")["tax_unit_id"].nunique()
-    )
-    num_tax_units = tax_units_per_household.reindex(household_id).fillna(1).values
+def calculate_baseline_snapshots(baseline_reform, years, dataset=DATASET):
+    """
+    Simulate the baseline once and collect a snapshot of it for every year.
 
-    # Identify the first tax unit in each household
-    # First, get all tax unit heads and sort by household_id and tax_unit_id
-    tax_unit_heads = person_df[person_df["is_head"]].sort_values(
-        ["household_id", "tax_unit_id"]
-    )
-    first_tax_unit_per_household = tax_unit_heads.groupby("household_id")[
-        "tax_unit_id"
-    ].first()
+    Parameters:
+    -----------
+    baseline_reform : Reform
+        The baseline reform to compare against
+    years : list
+        Tax years to analyze
+    dataset : str or SyntheticDataset
+        Dataset to simulate
 
-    # Create a mapping of household_id to first tax_unit_id
-    first_tax_unit_map = first_tax_unit_per_household.to_dict()
+    Returns:
+    --------
+    dict
+        Years to BaselineSnapshot
+    """
+    print(f"Calculating baseline values for {len(years)} years...")
+    with stage("simulation"):
+        baseline = build_simulation(baseline_reform, dataset)
+    return {year: baseline_snapshot(baseline, year, dataset) for year in years}
 
-    # Filter person_df to only include people from the first tax unit in each household
-    person_df["is_first_tax_unit"] = person_df.apply(
-        lambda row: row["tax_unit_id"] == first_tax_unit_map.get(row["household_id"]),
-        axis=1,
-    )
 
-    # Now get ages only from the first tax unit
-    first_tu_df = person_df[person_df["is_first_tax_unit"]]
+def baseline_snapshot(baseline, year, dataset=DATASET):
+    """
+    Collect everything the stacked runs need from a baseline simulation.
 
-    # Get married status from first tax unit only
-    # Use the head's married status from the first tax unit
-    married_status = (
-        first_tu_df[first_tu_df["is_head"]]
-        .groupby("household_id")["is_married"]
-        .first()
-    )
-    is_married = married_status.reindex(household_id).fillna(False).values.astype(bool)
+    Parameters:
+    -----------
+    baseline : Microsimulation
+        Simulation of the baseline reform
+    year : int
+        Tax year to calculate
+    dataset : str or SyntheticDataset
+        Dataset simulated
 
-    # Get head ages (from first tax unit only)
-    head_ages = (
-        first_tu_df[first_tu_df["is_head"]].groupby("household_id")["age"].first()
-    )
-    age_head = head_ages.reindex(household_id).values
+    Returns:
+    --------
+    BaselineSnapshot
+        Household characteristics, person table and baseline arrays
+    """
+    with stage("variables", year=year) as record:
+        household = extract_variables(baseline, HOUSEHOLD_VARIABLES, "household", year)
+        person_df = pd.DataFrame(
+            extract_variables(baseline, PERSON_VARIABLES, "person", year)
+        )
+        record_arrays(
+            record,
+            [*household.values(), *(person_df[column].values for column in person_df)],
+        )
 
-    # Get spouse ages (from first tax unit only)
-    spouse_ages = (
-        first_tu_df[first_tu_df["is_spouse"]].groupby("household_id")["age"].first()
+    household_id = household["Household ID"]
+    num_dependents = household["Number of Dependents"]
+    baseline_income_tax = household["Baseline Federal Tax Liability"]
+    baseline_net_income = household["Baseline Net Income"]
+    state_income_tax = household["State Income Tax"]
+    total_benefits = (
+        household["Baseline Medicaid"]
+        + household["Baseline ACA PTC"]
+        + household["Baseline CHIP"]
+        + household["Baseline Benefits"]
     )
-    age_spouse = spouse_ages.reindex(household_id).values
 
-    # Fill missing spouse ages with 40 only if married
-    age_spouse = np.where(
-        pd.isna(age_spouse) & is_married,  # If age is NaN AND household is married
-        40,  # Fill with 40
-        age_spouse,  # Otherwise keep original value (including NaN)
-    )
+    # Household characteristics from the person table
+    with stage("person aggregation") as record:
+        features = aggregate_household_features(household_id, person_df, num_dependents)
+        record_arrays(record, features["dependent_ages"])
+    person_df["is_first_tax_unit"] = features["is_first_tax_unit"]
+    dependent_age_columns = {
+        f"Age of Dependent {i+1}": ages
+        for i, ages in enumerate(features["dependent_ages"])
+    }
 
-    # Get dependent ages (from first tax unit only)
-    dependents_df = first_tu_df[first_tu_df["is_dependent"]].copy()
-    dependents_df["dep_rank"] = dependents_df.groupby("household_id")["age"].rank(
-        method="first"
+    # Columns derived from the person table and baseline values, each placed
+    # after the HOUSEHOLD_VARIABLES column it follows in the output
+    derived_columns = {
+        "Household Size": {
+            "Number of Tax Units": features["num_tax_units"],
+            "Age of Head": features["age_head"],
+            "Age of Spouse": features["age_spouse"],
+            **dependent_age_columns,  # Add dependent ages from first tax unit
+        },
+        "Number of Dependents": {
+            "Is Married": features["is_married"],
+            "Num with SSN Card (Citizen/EAD)": features["ssn_citizen_ead"],
+            "Num with SSN Card (Other/None)": features["ssn_other_none"],
+        },
+        "Baseline CHIP": {"Baseline Total Benefits": total_benefits},
+    }
+    household_columns = {}
+    for column, values in household.items():
+        household_columns[column] = values
+        household_columns.update(derived_columns.get(column, {}))
+
+    return BaselineSnapshot(
+        year=year,
+        dataset=dataset,
+        household_columns=household_columns,
+        person=person_df,
+        income_tax=baseline_income_tax,
+        state_income_tax=state_income_tax,
+        net_income=baseline_net_income,
+        total_benefits=total_benefits,
     )
 
-    # Determine max number of dependents (in first tax units)
-    max_dependents = (
-        int(dependents_df.groupby("household_id").size().max())
-        if len(dependents_df) > 0
-        else 0
-    )
 
-    # Create a dictionary to hold dependent age columns
-    dependent_age_columns = {}
+def simulate_step(reform, year, dataset=DATASET, cache=None):
+    """
+    Calculate the household arrays compared at each step of a reform stack.
 
-    # Create each dependent age column
-    for i in range(max_dependents):
-        # Get the i-th dependent for each household
-        ith_dependent = (
-            dependents_df[dependents_df["dep_rank"] == i + 1]
-            .groupby("household_id")["age"]
-            .first()
-        )
-        dependent_age_columns[f"Age of Dependent {i+1}"] = ith_dependent.reindex(
-            household_id
-        ).values
-
-    # Fill NA values with 10 only for households that have that many dependents
-    for i in range(max_dependents):
-        col_name = f"Age of Dependent {i+1}"
-        # Only fill with 10 if the household has at least i+1 dependents
-        mask = pd.isna(dependent_age_columns[col_name]) & (num_dependents > i)
-        dependent_age_columns[col_name] = np.where(
-            mask,
-            10,  # Fill with 10
-            dependent_age_columns[col_name],  # Keep original value (including NaN)
-        )
+    Parameters:
+    -----------
+    reform : Reform or tuple
+        Reform, or nested tuple of stacked reforms, to simulate
+    year : int
+        Tax year to analyze
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+    cache : SimulationCache, optional
+        On-disk cache consulted before, and filled after, simulating
 
-    # --- SSN Card Type household counts ---
-    # CITIZEN or NON_CITIZEN_VALID_EAD
-    ssn_citizen_ead = (
-        person_df[person_df["ssn_card_type"].isin(["CITIZEN", "NON_CITIZEN_VALID_EAD"])]
-        .groupby("household_id")
-        .size()
-    )
-    # OTHER_NON_CITIZEN or NONE
-    ssn_other_none = (
-        person_df[person_df["ssn_card_type"].isin(["OTHER_NON_CITIZEN", "NONE"])]
-        .groupby("household_id")
-        .size()
+    Returns:
+    --------
+    dict
+        STEP_VARIABLES names to household-level arrays
+    """
+    return simulate_step_years(reform, [year], dataset, cache)[year]
+
+
+def simulate_step_years(reform, years, dataset=DATASET, cache=None):
+    """
+    Calculate the household arrays of a reform step for several years from
+    one simulation, so the tax-benefit system is built once for all of them.
+
+    Parameters are as for simulate_step, with years the tax years to
+    calculate. Years found in the cache are not calculated.
+
+    Returns:
+    --------
+    dict
+        Years to STEP_VARIABLES names to household-level arrays
+    """
+    values = {}
+    keys = {}
+    if cache is not None:
+        for year in years:
+            keys[year] = cache.key(reform, dataset, year, STEP_VARIABLES)
+            with stage("cache lookup", year=year) as record:
+                cached = cache.get(keys[year])
+                record["hit"] = cached is not None
+            if cached is not None:
+                print("  Loaded from cache")
+                values[year] = cached
+    missing = [year for year in years if year not in values]
+    if not missing:
+        return values
+
+    with stage("simulation"):
+        simulation = build_simulation(reform, dataset)
+    for year in missing:
+        with stage("variables", year=year) as record:
+            values[year] = extract_variables(
+                simulation,
+                {variable: variable for variable in STEP_VARIABLES},
+                "household",
+                year,
+            )
+            record_arrays(record, values[year])
+        if cache is not None:
+            cache.put(keys[year], values[year])
+    return {year: values[year] for year in years}
+
+
+def _change(reformed_values, previous_values, dtype):
+    """Difference of two household arrays, stored as dtype."""
+    return (reformed_values - previous_values).astype(dtype, copy=False)
+
+
+def _percentage_change(change, baseline_values, dtype):
+    """Percentage change against the absolute baseline, zero where it is zero."""
+    pct_change = np.zeros(len(baseline_values), dtype=dtype)
+    np.divide(
+        change,
+        np.abs(baseline_values),
+        out=pct_change,
+        where=baseline_values != 0,
+        casting="same_kind",
     )
-    # Reindex to all households, fill missing with 0
-    ssn_citizen_ead = ssn_citizen_ead.reindex(household_id, fill_value=0).values
-    ssn_other_none = ssn_other_none.reindex(household_id, fill_value=0).values
-
-    # Initialize results dictionary
-    results = {
-        "Household ID": household_id,
-        "State": state,
-        "Household Size": household_size,
-        "Number of Tax Units": num_tax_units,
-        "Age of Head": age_head,
-        "Age of Spouse": age_spouse,
-        **dependent_age_columns,  # Add dependent ages from first tax unit
-        "Number of Dependents": num_dependents,
-        "Is Married": is_married,
-        "Num with SSN Card (Citizen/EAD)": ssn_citizen_ead,
-        "Num with SSN Card (Other/None)": ssn_other_none,
-        "Employment Income": employment_income,
-        "Self-Employment Income": self_employment_income,
-        "Capital Gains": capital_gains,
-        "Dividend Income": dividend_income,
-        "Farm Income": farm_income,
-        "Taxable Interest Income": taxable_interest_income,
-        "Rental Income": rental_income,
-        "Taxable Unemployment Compensation": taxable_unemployment_compensation,
-        "Miscellaneous Income": miscellaneous_income,
-        "Taxable Retirement Distributions": taxable_retirement_distributions,
-        "Taxable Pension Income": taxable_pension_income,
-        "Taxable Social Security": taxable_social_security,
-        "Property Taxes": property_taxes,
-        "State Income Tax": state_income_tax,
-        "Tip Income": tip_income,
-        "Overtime Income": overtime_income,
-        "Auto Loan Interest": auto_loan_interest,
-        "Social Security Benefits": social_security_benefits,
-        "Gross Income": gross_income,
-        "Adjusted Gross Income": agi,
-        "Market Income": household_market_income,
-        "Baseline Federal Tax Liability": baseline_income_tax,
-        "Baseline Net Income": baseline_net_income,
-        "Baseline Benefits": baseline_benefits,
-        "Baseline Medicaid": medicaid_benefits,
-        "Baseline ACA PTC": ptc_benefits,
-        "Baseline CHIP": chip_benefits,
-        "Baseline Total Benefits": total_benefits,
-        "Household Weight": household_weight,
-    }
+    pct_change *= 100
+    return pct_change
+
+
+def calculate_stacked_household_impacts(
+    reforms,
+    baseline_reform,
+    year,
+    baseline=None,
+    dataset=DATASET,
+    cache=None,
+    checkpoint_dir=None,
+    resume=False,
+    sink=None,
+    change_dtype=np.float64,
+    incremental=False,
+    step_values=None,
+):
+    """
+    Calculate tax and income changes for each household after each reform is stacked.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline reform to compare against
+    year : int
+        Tax year to analyze
+    baseline : BaselineSnapshot, optional
+        Precomputed snapshot of baseline_reform. Computed here if not given.
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+    cache : SimulationCache, optional
+        On-disk cache of per-step simulation outputs
+    checkpoint_dir : str, optional
+        Run directory in which every completed reform step is checkpointed
+    resume : bool
+        Continue the run checkpointed in checkpoint_dir after its last
+        completed reform, instead of starting over. Completed steps whose
+        baseline, year, dataset or parameters changed since are simulated
+        again, as in incremental runs.
+    sink : ColumnSink, optional
+        Store that each column is written to as soon as it is computed,
+        instead of collecting all columns in memory
+    change_dtype : np.dtype
+        Dtype of the change and percentage change columns. float32 halves
+        their memory and output size.
+    incremental : bool
+        Reuse the steps checkpointed in checkpoint_dir up to the first reform
+        whose parameters, or whose predecessors' parameters, changed since,
+        and simulate only from there on
+    step_values : list, optional
+        simulate_step outputs of every reform step for year, calculated
+        beforehand, e.g. with those of other years from one simulation
+
+    Returns:
+    --------
+    pd.DataFrame or ColumnSink
+        DataFrame with household impacts, or sink if one was given
+    """
+
+    checkpoint = None
+    completed_steps = []
+    fingerprints = [None] * len(reforms)
+    if checkpoint_dir is not None:
+        checkpoint = RunCheckpoint(checkpoint_dir)
+        stack_fingerprint = baseline_fingerprint(baseline_reform, dataset, year)
+        fingerprints = step_fingerprints(baseline_reform, reforms, dataset, year)
+        if resume:
+            completed_steps = checkpoint.completed_steps()
+            if completed_steps != list(reforms)[: len(completed_steps)]:
+                raise ValueError(
+                    f"Checkpoint in {checkpoint_dir} was made with a different "
+                    f"reform stack: {completed_steps}"
+                )
+            # Steps are only reused if the baseline, year, dataset and
+            # reform parameters they were simulated with are unchanged
+            reusable = checkpoint.reusable_steps(stack_fingerprint, fingerprints)
+            if reusable < len(completed_steps):
+                print(
+                    f"Checkpoint in {checkpoint_dir} is out of date after "
+                    f"{reusable} of {len(completed_steps)} completed reforms, "
+                    f"re-simulating from there"
+                )
+                checkpoint.truncate(reusable)
+                completed_steps = checkpoint.completed_steps()
+            if baseline is None:
+                baseline = checkpoint.load_baseline(stack_fingerprint)
+            print(
+                f"Resuming after {len(completed_steps)} of {len(reforms)} "
+                f"completed reforms"
+            )
+        elif incremental:
+            reusable = checkpoint.reusable_steps(stack_fingerprint, fingerprints)
+            checkpoint.truncate(reusable)
+            completed_steps = checkpoint.completed_steps()
+            if baseline is None:
+                baseline = checkpoint.load_baseline(stack_fingerprint)
+            print(f"Reusing {reusable} unchanged of {len(reforms)} reform steps")
+        else:
+            checkpoint.clear()
+    elif resume or incremental:
+        raise ValueError("Resuming or incremental runs require a checkpoint_dir")
+
+    if baseline is None:
+        baseline = calculate_baseline_snapshot(baseline_reform, year, dataset)
+    elif baseline.year != year or baseline.dataset != dataset:
+        raise ValueError(
+            f"Baseline snapshot is for {baseline.year} on {baseline.dataset}, "
+            f"not {year} on {dataset}"
+        )
+    if checkpoint is not None and not completed_steps:
+        checkpoint.save_baseline(baseline, stack_fingerprint)
+
+    baseline_income_tax = baseline.income_tax
+    state_income_tax = baseline.state_income_tax
+    baseline_net_income = baseline.net_income
+    total_benefits = baseline.total_benefits
+
+    # Initialize results, held in memory or streamed to disk column by column
+    if sink is None:
+        results = dict(baseline.household_columns)
+    else:
+        results = sink
+        for column, values in baseline.household_columns.items():
+            results[column] = values
 
     # Track cumulative values
-    cumulative_reform = baseline_reform
-    previous_income_tax = baseline_income_tax.copy()
-    previous_state_income_tax = state_income_tax.copy()
-    previous_net_income = baseline_net_income.copy()
-    previous_total_benefits = total_benefits.copy()
+    stacked_reforms = [baseline_reform]
+    # Arrays are never modified in place, so tracking them by reference
+    # avoids copying four household arrays per step
+    previous_income_tax = baseline_income_tax
+    previous_state_income_tax = state_income_tax
+    previous_net_income = baseline_net_income
+    previous_total_benefits = total_benefits
 
     # Apply each reform sequentially
-    for reform_name, reform in reforms.items():
-        print(f"Processing {reform_name}...")
-
+    for index, (reform_name, reform) in enumerate(reforms.items()):
         # Stack the reform
-        cumulative_reform = (cumulative_reform, reform)
-
-        # Calculate with cumulative reforms
-        reformed = Microsimulation(reform=cumulative_reform, dataset=dataset_path)
-
-        # Get reformed values
-        reformed_income_tax = reformed.calculate(
-            "income_tax", map_to="household", period=year
-        ).values
-        reformed_state_income_tax = reformed.calculate(
-            "state_income_tax", map_to="household", period=year
-        ).values
-        reformed_net_income = reformed.calculate(
-            "household_net_income_including_health_benefits",
-            map_to="household",
-            period=year,
-        ).values
-        reformed_benefits = reformed.calculate(
-            "household_benefits", map_to="household", period=year
-        ).values
-        reformed_medicaid = reformed.calculate(
-            "medicaid", map_to="household", period=year
-        ).values
-        reformed_ptc = reformed.calculate(
-            "aca_ptc", map_to="household", period=year
-        ).values
-        reformed_chip = reformed.calculate(
-            "chip", map_to="household", period=year
-        ).values
-        reformed_total_benefits = (
-            reformed_medicaid + reformed_ptc + reformed_chip + reformed_benefits
-        )
+        stacked_reforms.append(reform)
+
+        if index < len(completed_steps):
+            # Restore the step from its checkpoint. Its changes are taken
+            # again from the cumulative arrays, so that they have this run's
+            # change_dtype whatever the checkpointed run's was.
+            step = checkpoint.load_step(index)
+            reformed_income_tax = step["income_tax"]
+            reformed_state_income_tax = step["state_income_tax"]
+            reformed_total_benefits = step["total_benefits"]
+            reformed_net_income = step["net_income"]
+        else:
+            if step_values is not None:
+                reformed = step_values[index]
+            else:
+                print(f"Processing {reform_name}...")
+
+                # Calculate with cumulative reforms, merged into one flat reform
+                with stage("reform step", reform=reform_name, step=index + 1):
+                    reformed = simulate_step(
+                        merge_reforms(*stacked_reforms), year, dataset, cache
+                    )
+
+            # Get reformed values
+            reformed_income_tax = reformed["income_tax"]
+            reformed_state_income_tax = reformed["state_income_tax"]
+            reformed_net_income = reformed[
+                "household_net_income_including_health_benefits"
+            ]
+            reformed_benefits = reformed["household_benefits"]
+            reformed_medicaid = reformed["medicaid"]
+            reformed_ptc = reformed["aca_ptc"]
+            reformed_chip = reformed["chip"]
+            reformed_total_benefits = (
+                reformed_medicaid + reformed_ptc + reformed_chip + reformed_benefits
+            )
+
+            if checkpoint is not None:
+                checkpoint.save_step(
+                    index,
+                    reform_name,
+                    {
+                        "income_tax": reformed_income_tax,
+                        "state_income_tax": reformed_state_income_tax,
+                        "total_benefits": reformed_total_benefits,
+                        "net_income": reformed_net_income,
+                    },
+                    fingerprint=fingerprints[index],
+                )
 
         # Calculate incremental changes (from previous state)
-        tax_change = reformed_income_tax - previous_income_tax
-        state_tax_change = reformed_state_income_tax - previous_state_income_tax
-        benefits_change = reformed_total_benefits - previous_total_benefits
-        net_income_change = reformed_net_income - previous_net_income
+        tax_change = _change(reformed_income_tax, previous_income_tax, change_dtype)
+        state_tax_change = _change(
+            reformed_state_income_tax, previous_state_income_tax, change_dtype
+        )
+        benefits_change = _change(
+            reformed_total_benefits, previous_total_benefits, change_dtype
+        )
+        net_income_change = _change(
+            reformed_net_income, previous_net_income, change_dtype
+        )
 
         # Store results
         results[f"Change in federal tax liability after {reform_name}"] = tax_change
@@ -381,61 +573,295 @@ def calculate_stacked_household_impacts(reforms, baseline_reform, year):
         results[f"Change in net income after {reform_name}"] = net_income_change
 
         # Update previous values for next iteration
-        previous_income_tax = reformed_income_tax.copy()
-        previous_state_income_tax = reformed_state_income_tax.copy()
-        previous_total_benefits = reformed_total_benefits.copy()
-        previous_net_income = reformed_net_income.copy()
+        previous_income_tax = reformed_income_tax
+        previous_state_income_tax = reformed_state_income_tax
+        previous_total_benefits = reformed_total_benefits
+        previous_net_income = reformed_net_income
 
     # Add final total changes (from baseline to fully reformed)
-    results[f"Total change in federal tax liability"] = (
-        previous_income_tax - baseline_income_tax
-    )
-    results[f"Total change in state tax liability"] = (
-        previous_state_income_tax - state_income_tax
-    )
-    results[f"Total change in benefits"] = previous_total_benefits - total_benefits
-    results[f"Total change in net income"] = previous_net_income - baseline_net_income
-
-    # Calculate percentage changes
-    # For tax: handle cases where baseline tax is zero or negative
-    pct_tax_change = np.zeros_like(baseline_income_tax)
-    mask = baseline_income_tax != 0
-    pct_tax_change[mask] = (
-        results[f"Total change in federal tax liability"][mask]
-        / np.abs(baseline_income_tax[mask])
-    ) * 100
-
-    results[f"Percentage change in federal tax liability"] = pct_tax_change
-
-    # For net income: handle cases where baseline net income is zero
-    pct_net_income_change = np.zeros_like(baseline_net_income)
-    mask = baseline_net_income != 0
-    pct_net_income_change[mask] = (
-        results[f"Total change in net income"][mask] / np.abs(baseline_net_income[mask])
-    ) * 100
-
-    results[f"Percentage change in net income"] = pct_net_income_change
-
-    # Calculate percentage changes for state tax
-    pct_state_tax_change = np.zeros_like(state_income_tax)
-    mask = state_income_tax != 0
-    pct_state_tax_change[mask] = (
-        results[f"Total change in state tax liability"][mask]
-        / np.abs(state_income_tax[mask])
-    ) * 100
-
-    results[f"Percentage change in state tax liability"] = pct_state_tax_change
-
-    # For benefits: handle cases where baseline benefits is zero
-    pct_benefits_change = np.zeros_like(total_benefits)
-    mask = total_benefits != 0
-    pct_benefits_change[mask] = (
-        results[f"Total change in benefits"][mask] / np.abs(total_benefits[mask])
-    ) * 100
-
-    results[f"Percentage change in benefits"] = pct_benefits_change
+    totals = {
+        "federal tax liability": (previous_income_tax, baseline_income_tax),
+        "state tax liability": (previous_state_income_tax, state_income_tax),
+        "benefits": (previous_total_benefits, total_benefits),
+        "net income": (previous_net_income, baseline_net_income),
+    }
+    for label, (reformed_values, baseline_values) in totals.items():
+        results[f"Total change in {label}"] = _change(
+            reformed_values, baseline_values, change_dtype
+        )
+
+    # Calculate percentage changes, relative to the absolute baseline value.
+    # Households with a zero baseline value get zero.
+    for label in [
+        "federal tax liability",
+        "net income",
+        "state tax liability",
+        "benefits",
+    ]:
+        results[f"Percentage change in {label}"] = _percentage_change(
+            results[f"Total change in {label}"], totals[label][1], change_dtype
+        )
+
+    print(f"Peak RSS: {peak_rss_bytes() / 1024**2:,.0f} MB")
+
+    if sink is not None:
+        return sink
 
     # Create DataFrame
     df = pd.DataFrame(results)
 
     return df
+
+
+def _parameters(reform):
+    """Parameter dictionary of a reform, which can be sent to other processes."""
+    return merge_parameter_dicts(reform_parameter_dicts(reform))
+
+
+def _run_shard(reform_parameters, baseline_parameters, year, dataset, **kwargs):
+    """Run a whole reform stack on one shard, rebuilding the reforms first."""
+    Reform = reform_class()
+    reforms = {
+        name: Reform.from_dict(parameters, country_id="us")
+        for name, parameters in reform_parameters.items()
+    }
+    baseline_reform = Reform.from_dict(baseline_parameters, country_id="us")
+    return calculate_stacked_household_impacts(
+        reforms, baseline_reform, year, dataset=dataset, **kwargs
+    )
+
+
+def align_columns(results, columns, references=()):
+    """
+    Give a result set exactly the given columns, in their order.
+
+    A result set in which no household has a dependent at some position
+    lacks that "Age of Dependent" column. It is filled as
+    aggregate_household_features fills it: 10 for households whose Number
+    of Dependents covers the position, NaN otherwise.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame
+        Results from calculate_stacked_household_impacts
+    columns : list
+        Columns to give it
+    references : list
+        Other result sets, whose dtype a filled column takes if one of them
+        has it. float64 otherwise.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The results with the given columns
+    """
+    for column in columns:
+        if column in results:
+            continue
+        if not column.startswith("Age of Dependent "):
+            raise ValueError(f"Result sets differ in column '{column}'")
+        position = int(column[len("Age of Dependent ") :]) - 1
+        reference = next(
+            (frame[column] for frame in references if column in frame), None
+        )
+        dtype = np.float64
+        if reference is not None and reference.dtype.kind == "f":
+            dtype = reference.dtype
+        results[column] = np.where(
+            results["Number of Dependents"] > position, 10, np.nan
+        ).astype(dtype)
+    return results[columns]
+
+
+def concat_results(frames):
+    """
+    Concatenate result sets of different households or years, with the
+    columns of the widest, see align_columns.
+
+    Parameters:
+    -----------
+    frames : list
+        DataFrames from calculate_stacked_household_impacts
+
+    Returns:
+    --------
+    pd.DataFrame
+        Rows of every result set, in order, with a fresh index
+    """
+    columns = list(max(frames, key=lambda results: results.shape[1]).columns)
+    return pd.concat(
+        [align_columns(results, columns, frames) for results in frames],
+        ignore_index=True,
+    )
+
+
+def combine_shards(shard_results, shard_rows):
+    """
+    Concatenate the results of household shards in dataset order, the same
+    as those of the unsharded run.
+
+    Parameters:
+    -----------
+    shard_results : list
+        DataFrames from calculate_stacked_household_impacts, one per shard
+    shard_rows : list
+        Positions in the dataset of the households of each shard
+
+    Returns:
+    --------
+    pd.DataFrame
+        Results of every household, in dataset order
+    """
+    combined = concat_results(shard_results)
+    order = np.argsort(np.concatenate(shard_rows), kind="stable")
+    return combined.iloc[order].reset_index(drop=True)
+
+
+def calculate_multi_year_household_impacts(
+    reforms,
+    baseline_reform,
+    years,
+    baselines=None,
+    dataset=DATASET,
+    cache=None,
+    change_dtype=np.float64,
+):
+    """
+    Calculate stacked household impacts for several years.
+
+    The baseline and every reform step are simulated once, and each
+    simulation calculates all the years, so the tax-benefit system is built
+    once per step rather than once per step and year. The results of each
+    year are those of calculate_stacked_household_impacts for that year.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline reform to compare against
+    years : list
+        Tax years to analyze
+    baselines : dict, optional
+        Years to precomputed snapshots of baseline_reform, e.g. from
+        calculate_baseline_snapshots. Computed here if not given.
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+    cache : SimulationCache, optional
+        On-disk cache of per-step, per-year simulation outputs
+    change_dtype : np.dtype
+        Dtype of the change and percentage change columns
+
+    Returns:
+    --------
+    pd.DataFrame
+        Household impacts in long format: the rows of every year, in year
+        order, with the year in a leading Year column
+    """
+    years = list(years)
+    if baselines is None:
+        baselines = calculate_baseline_snapshots(baseline_reform, years, dataset)
+
+    step_values = {year: [] for year in years}
+    stacked_reforms = [baseline_reform]
+    for index, (reform_name, reform) in enumerate(reforms.items()):
+        stacked_reforms.append(reform)
+        print(f"Processing {reform_name} for {len(years)} years...")
+        with stage("reform step", reform=reform_name, step=index + 1):
+            values = simulate_step_years(
+                merge_reforms(*stacked_reforms), years, dataset, cache
+            )
+        for year in years:
+            step_values[year].append(values[year])
+
+    frames = []
+    for year in years:
+        results = calculate_stacked_household_impacts(
+            reforms,
+            baseline_reform,
+            year,
+            baseline=baselines[year],
+            dataset=dataset,
+            change_dtype=change_dtype,
+            step_values=step_values.pop(year),
+        )
+        results.insert(0, "Year", year)
+        frames.append(results)
+    return concat_results(frames)
+
+
+def calculate_sharded_household_impacts(
+    reforms,
+    baseline_reform,
+    year,
+    n_shards,
+    dataset=DATASET,
+    workers=None,
+    shard_dir=None,
+    cache=None,
+    change_dtype=np.float64,
+):
+    """
+    Calculate stacked household impacts on household shards in parallel.
+
+    The dataset is split into n_shards household-complete shards, the whole
+    reform stack runs on each in its own process, and the results are put
+    back together in dataset order. They are the same as those of
+    calculate_stacked_household_impacts on the whole dataset.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline reform to compare against
+    year : int
+        Tax year to analyze
+    n_shards : int
+        Number of household shards
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+    workers : int, optional
+        Number of processes. One per shard if not given.
+    shard_dir : str, optional
+        Directory to write h5 shards to. A temporary directory, removed
+        afterwards, if not given.
+    cache : SimulationCache, optional
+        On-disk cache of per-step simulation outputs, keyed by shard
+    change_dtype : np.dtype
+        Dtype of the change and percentage change columns
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with household impacts
+    """
+    reform_parameters = {name: _parameters(reform) for name, reform in reforms.items()}
+    baseline_parameters = _parameters(baseline_reform)
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        with stage("sharding", shards=n_shards):
+            shards = shard_dataset(dataset, n_shards, shard_dir or temporary_dir)
+        print(f"Running {len(reforms)} reforms on {len(shards)} household shards")
+        with ProcessPoolExecutor(max_workers=workers or len(shards)) as executor:
+            futures = [
+                executor.submit(
+                    collect,
+                    _run_shard,
+                    reform_parameters,
+                    baseline_parameters,
+                    year,
+                    shard,
+                    cache=cache,
+                    change_dtype=change_dtype,
+                )
+                for shard, _ in shards
+            ]
+            outputs = [future.result() for future in futures]
+    for index, (_, records) in enumerate(outputs, 1):
+        for record in records:
+            record["shard"] = index
+        add_records(records)
+    with stage("combining shards", shards=len(shards)):
+        return combine_shards(
+            [results for results, _ in outputs], [rows for _, rows in shards]
+        )
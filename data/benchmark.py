@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the tax reform impact analysis.
+
+Usage:
+    python benchmark.py reform-setup [--package senate] [--baseline tcja]
+    python benchmark.py analysis [--households 100000] [--calculate-seconds 0.5]
+    python benchmark.py import-time [--max-seconds 1]
+    python benchmark.py sharding [--households 100000] [--shards 2 4 8]
+        [--subset-fraction 0.5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from engine import ENGINE_MODULES, tax_benefit_system_class
+from reforms import BASELINES, PACKAGES, merge_reforms
+from synthetic import SyntheticDataset
+
+# Modules of the entry points that do not simulate, such as reform listing
+# and post-processing, which must import without the simulation engine
+FAST_IMPORTS = ["main", "reforms", "output", "samples", "summary"]
+
+_IMPORT_TIMER = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [name for name in {engine} if name in sys.modules]]))
+"""
+
+
+def _apply_reform(system, reform):
+    """Apply a reform, or nested tuple of reforms, the way a Simulation does."""
+    if isinstance(reform, tuple):
+        for part in reform:
+            _apply_reform(system, part)
+    else:
+        reform.apply(system)
+
+
+def benchmark_reform_setup(reforms, baseline_reform):
+    """
+    Time applying the cumulative reform at every step of a reform stack.
+
+    Each step is timed twice on a fresh tax-benefit system: once applying the
+    nested tuple of stacked reforms layer by layer, and once applying the
+    single reform from merge_reforms.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline the reforms are stacked on
+
+    Returns:
+    --------
+    list
+        (reform name, nested seconds, merged seconds) for each step
+    """
+    CountryTaxBenefitSystem = tax_benefit_system_class()
+
+    timings = []
+    stacked_reforms = [baseline_reform]
+    nested_reform = baseline_reform
+    print(f"{'Step':>4}  {'Nested':>8}  {'Merged':>8}  Reform")
+    for step, (reform_name, reform) in enumerate(reforms.items(), 1):
+        stacked_reforms.append(reform)
+        nested_reform = (nested_reform, reform)
+
+        system = CountryTaxBenefitSystem()
+        start = time.perf_counter()
+        _apply_reform(system, nested_reform)
+        nested_seconds = time.perf_counter() - start
+
+        system = CountryTaxBenefitSystem()
+        start = time.perf_counter()
+        _apply_reform(system, merge_reforms(*stacked_reforms))
+        merged_seconds = time.perf_counter() - start
+
+        timings.append((reform_name, nested_seconds, merged_seconds))
+        print(
+            f"{step:>4}  {nested_seconds:>7.3f}s  {merged_seconds:>7.3f}s  {reform_name}"
+        )
+    return timings
+
+
+def _best_time(function, repeat):
+    """Best wall time of repeat calls of function, and its last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_analysis(
+    reforms, baseline_reform, dataset, year=2026, repeat=3, formats=("csv",)
+):
+    """
+    Time the stages of an analysis on a synthetic dataset.
+
+    The simulation stages run on SyntheticMicrosimulation, so their time is
+    what the dataset's calculate_seconds makes it. The post-processing
+    stages run our own code on the resulting arrays and are timed on their
+    own, so that regressions in them are not hidden by simulation time.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline the reforms are stacked on
+    dataset : SyntheticDataset
+        Synthetic dataset to run on
+    year : int
+        Tax year to analyze
+    repeat : int
+        Number of runs of each post-processing stage; the best is reported
+    formats : list
+        Output formats to time writing
+
+    Returns:
+    --------
+    dict
+        Stage names to best wall seconds
+    """
+    from aggregation import (
+        aggregate_household_features,
+        dependent_age_matrix,
+        household_index,
+        rank_dependents,
+    )
+    from analysis import (
+        HOUSEHOLD_VARIABLES,
+        PERSON_VARIABLES,
+        _percentage_change,
+        build_simulation,
+        calculate_baseline_snapshot,
+        calculate_stacked_household_impacts,
+        extract_variables,
+    )
+    from output import write_results
+
+    timings = {}
+
+    def baseline_tables():
+        simulation = build_simulation(baseline_reform, dataset)
+        household = extract_variables(
+            simulation, HOUSEHOLD_VARIABLES, "household", year
+        )
+        person = pd.DataFrame(
+            extract_variables(simulation, PERSON_VARIABLES, "person", year)
+        )
+        return household, person
+
+    timings["baseline simulation"], (household, person) = _best_time(baseline_tables, 1)
+    household_id = household["Household ID"]
+    num_dependents = household["Number of Dependents"]
+
+    timings["person aggregation"], features = _best_time(
+        lambda: aggregate_household_features(household_id, person, num_dependents),
+        repeat,
+    )
+
+    def dependent_pivot():
+        n = len(household_id)
+        person_household = household_index(
+            household_id, np.asarray(person["household_id"])
+        )
+        age = np.asarray(person["age"])
+        dependents, households, ranks, counts = rank_dependents(
+            person_household,
+            age,
+            features["is_first_tax_unit"] & np.asarray(person["is_dependent"]),
+            n,
+        )
+        return dependent_age_matrix(
+            age[dependents], households, ranks, num_dependents, int(counts.max()), n
+        )
+
+    timings["dependent pivots"], _ = _best_time(dependent_pivot, repeat)
+
+    snapshot = calculate_baseline_snapshot(baseline_reform, year, dataset)
+    timings["stacked simulations"], results = _best_time(
+        lambda: calculate_stacked_household_impacts(
+            reforms, baseline_reform, year, baseline=snapshot, dataset=dataset
+        ),
+        1,
+    )
+
+    def percentage_changes():
+        return [
+            _percentage_change(
+                results[f"Total change in {label}"].values, baseline_values, np.float64
+            )
+            for label, baseline_values in [
+                ("federal tax liability", snapshot.income_tax),
+                ("net income", snapshot.net_income),
+                ("state tax liability", snapshot.state_income_tax),
+                ("benefits", snapshot.total_benefits),
+            ]
+        ]
+
+    timings["percentage changes"], _ = _best_time(percentage_changes, repeat)
+
+    columns = {column: results[column].values for column in results.columns}
+    timings["DataFrame assembly"], _ = _best_time(lambda: pd.DataFrame(columns), repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        output_name = os.path.join(directory, "results")
+        timings[f"writing {', '.join(formats)}"], _ = _best_time(
+            lambda: write_results(results, output_name, formats), 1
+        )
+
+    print(f"\n{len(household_id):,} households, {len(reforms)} reforms")
+    for stage, seconds in timings.items():
+        print(f"  {stage:<24} {seconds:>9.3f}s")
+    return timings
+
+
+def benchmark_sharding(reforms, baseline_reform, dataset, shard_counts, year=2026):
+    """
+    Time a reform stack run unsharded and on household shards, and check
+    that the sharded results are exactly the unsharded ones.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline the reforms are stacked on
+    dataset : SyntheticDataset
+        Synthetic dataset to run on
+    shard_counts : list
+        Numbers of shards to run with
+    year : int
+        Tax year to analyze
+
+    Returns:
+    --------
+    dict
+        Shard counts, 1 for unsharded, to (wall seconds, whether the results
+        match the unsharded ones)
+    """
+    from analysis import (
+        calculate_sharded_household_impacts,
+        calculate_stacked_household_impacts,
+    )
+
+    start = time.perf_counter()
+    expected = calculate_stacked_household_impacts(
+        reforms, baseline_reform, year, dataset=dataset
+    )
+    timings = {1: (time.perf_counter() - start, True)}
+    for n_shards in shard_counts:
+        start = time.perf_counter()
+        results = calculate_sharded_household_impacts(
+            reforms, baseline_reform, year, n_shards, dataset=dataset
+        )
+        seconds = time.perf_counter() - start
+        try:
+            pd.testing.assert_frame_equal(results, expected, check_exact=True)
+            matches = True
+        except AssertionError as error:
+            print(error)
+            matches = False
+        timings[n_shards] = (seconds, matches)
+
+    print(f"\n{len(expected):,} households, {len(reforms)} reforms")
+    for n_shards, (seconds, matches) in timings.items():
+        status = "matches" if matches else "DIFFERS from unsharded"
+        print(f"  {n_shards:>3} shards {seconds:>9.3f}s  {status}")
+    return timings
+
+
+def shard_cache_keys_differ(datasets, reform, n_shards, year=2026):
+    """
+    Check that no two shards of some datasets, e.g. a dataset and subsets of
+    it, share a simulation cache key.
+
+    Parameters:
+    -----------
+    datasets : list
+        Synthetic datasets to shard
+    reform : Reform
+        Reform to key the simulations of
+    n_shards : int
+        Number of shards of each dataset
+    year : int
+        Tax year of the simulations
+
+    Returns:
+    --------
+    bool
+        Whether every shard has its own key
+    """
+    from analysis import STEP_VARIABLES
+    from cache import SimulationCache
+    from datasets import shard_dataset
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SimulationCache(directory)
+        keys = [
+            cache.key(reform, shard, year, STEP_VARIABLES)
+            for dataset in datasets
+            for shard, _ in shard_dataset(dataset, n_shards)
+        ]
+    return len(set(keys)) == len(keys)
+
+
+def benchmark_import_time(modules=FAST_IMPORTS, repeat=5):
+    """
+    Time importing modules, each in a fresh interpreter.
+
+    Parameters:
+    -----------
+    modules : list
+        Names of the modules to import
+    repeat : int
+        Number of imports of each module; the best is reported
+
+    Returns:
+    --------
+    dict
+        Module names to (best seconds, engine modules the import loaded)
+    """
+    timings = {}
+    for module in modules:
+        code = _IMPORT_TIMER.format(module=module, engine=ENGINE_MODULES)
+        best = float("inf")
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            seconds, engine_loaded = json.loads(output.splitlines()[-1])
+            best = min(best, seconds)
+        timings[module] = (best, engine_loaded)
+        loaded = f"  loads {', '.join(engine_loaded)}" if engine_loaded else ""
+        print(f"  import {module:<20} {best:>7.3f}s{loaded}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    reform_setup = subparsers.add_parser(
+        "reform-setup",
+        help="Per-step reform setup time, nested tuples vs merged reforms",
+    )
+    reform_setup.add_argument("--package", choices=PACKAGES, default="senate")
+    reform_setup.add_argument("--baseline", choices=BASELINES, default="tcja")
+
+    analysis = subparsers.add_parser(
+        "analysis",
+        help="Stage timings of an analysis on a synthetic dataset",
+    )
+    analysis.add_argument("--package", choices=PACKAGES, default="senate")
+    analysis.add_argument("--baseline", choices=BASELINES, default="tcja")
+    analysis.add_argument(
+        "--households",
+        type=int,
+        default=10_000,
+        help="Number of synthetic households, e.g. 10000 to 10000000",
+    )
+    analysis.add_argument(
+        "--calculate-seconds",
+        type=float,
+        default=0.0,
+        help="Simulated time of each calculate call per million households",
+    )
+    analysis.add_argument(
+        "--reforms",
+        type=int,
+        help="Only stack the first this many reforms of the package",
+    )
+    analysis.add_argument("--repeat", type=int, default=3)
+    analysis.add_argument("--seed", type=int, default=0)
+    analysis.add_argument("--json", help="Also save the timings to this file")
+
+    import_time = subparsers.add_parser(
+        "import-time",
+        help="Import time of the entry points that do not simulate",
+    )
+    import_time.add_argument("--modules", nargs="+", default=FAST_IMPORTS)
+    import_time.add_argument("--repeat", type=int, default=5)
+    import_time.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Fail if any import takes longer than this or loads the engine",
+    )
+
+    sharding = subparsers.add_parser(
+        "sharding",
+        help="Sharded vs unsharded reform stack on a synthetic dataset",
+    )
+    sharding.add_argument("--package", choices=PACKAGES, default="senate")
+    sharding.add_argument("--baseline", choices=BASELINES, default="tcja")
+    sharding.add_argument("--households", type=int, default=10_000)
+    sharding.add_argument("--calculate-seconds", type=float, default=0.0)
+    sharding.add_argument("--reforms", type=int, default=5)
+    sharding.add_argument("--shards", type=int, nargs="+", default=[2, 4])
+    sharding.add_argument("--seed", type=int, default=0)
+    sharding.add_argument(
+        "--subset-fraction",
+        type=float,
+        default=0.5,
+        help="Also shard a random subset of this share of the households",
+    )
+
+    args = parser.parse_args()
+    if args.benchmark == "import-time":
+        timings = benchmark_import_time(args.modules, args.repeat)
+        if args.max_seconds is not None:
+            slow = [
+                module
+                for module, (seconds, engine_loaded) in timings.items()
+                if seconds > args.max_seconds or engine_loaded
+            ]
+            if slow:
+                parser.exit(1, f"Slow or engine-loading imports: {slow}\n")
+    elif args.benchmark == "reform-setup":
+        benchmark_reform_setup(PACKAGES[args.package](), BASELINES[args.baseline]())
+    elif args.benchmark == "analysis":
+        reforms = PACKAGES[args.package]()
+        if args.reforms is not None:
+            reforms = dict(list(reforms.items())[: args.reforms])
+        dataset = SyntheticDataset(
+            n_households=args.households,
+            seed=args.seed,
+            calculate_seconds=args.calculate_seconds,
+        )
+        timings = benchmark_analysis(
+            reforms, BASELINES[args.baseline](), dataset, repeat=args.repeat
+        )
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({"households": args.households, "timings": timings}, f)
+    elif args.benchmark == "sharding":
+        reforms = dict(list(PACKAGES[args.package]().items())[: args.reforms])
+        dataset = SyntheticDataset(
+            n_households=args.households,
+            seed=args.seed,
+            calculate_seconds=args.calculate_seconds,
+        )
+        from datasets import select_households, subset_dataset
+
+        baseline_reform = BASELINES[args.baseline]()
+        subset = subset_dataset(
+            dataset,
+            select_households(dataset, fraction=args.subset_fraction, seed=args.seed),
+        )
+        timings = {}
+        for label, shard_source in [("Dataset", dataset), ("Subset", subset)]:
+            print(f"\n{label}: {shard_source}")
+            for n_shards, (seconds, matches) in benchmark_sharding(
+                reforms, baseline_reform, shard_source, args.shards
+            ).items():
+                timings[label, n_shards] = (seconds, matches)
+        if not all(matches for _, matches in timings.values()):
+            parser.exit(1, "Sharded results differ from unsharded results\n")
+        if not all(
+            shard_cache_keys_differ([dataset, subset], baseline_reform, n_shards)
+            for n_shards in args.shards
+        ):
+            parser.exit(1, "Shards of the dataset and subset share cache keys\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Persistent on-disk cache of per-step simulation outputs.
+
+Entries are keyed by a hash of everything that determines a simulation's
+household arrays: the parameter dictionaries of every reform in the cumulative
+stack, the dataset, the year and the installed policyengine-us version. Each
+entry is one .npz file; the least recently used entries are evicted once the
+cache grows past its size limit.
+"""
+
+import hashlib
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+
+from reforms import reform_parameter_dicts
+
+# Bump when the stored arrays change meaning, to orphan old entries
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 20 * 1024**3
+
+
+def _model_version():
+    try:
+        return version("policyengine-us")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _dataset_identity(dataset):
+    """Describe a dataset so that a changed local file changes the key."""
+    identity = {"dataset": str(dataset)}
+    if isinstance(dataset, str) and os.path.exists(dataset):
+        stat = os.stat(dataset)
+        identity["size"] = stat.st_size
+        identity["mtime_ns"] = stat.st_mtime_ns
+    return identity
+
+
+class SimulationCache:
+    """
+    Content-addressed store of household arrays from stacked simulations.
+
+    Parameters:
+    -----------
+    directory : str
+        Directory holding the cache entries. Created if missing.
+    max_bytes : int
+        Total size above which least recently used entries are deleted
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, reform, dataset, year, variables):
+        """
+        Hash the inputs of a simulation into a cache key.
+
+        Parameters:
+        -----------
+        reform : Reform or tuple
+            Reform, or nested tuple of stacked reforms, being simulated
+        dataset : str
+            Dataset being simulated
+        year : int
+            Tax year calculated
+        variables : list
+            Names of the stored household variables
+
+        Returns:
+        --------
+        str
+            Hex digest identifying the entry
+        """
+        payload = json.dumps(
+            {
+                "format": CACHE_FORMAT_VERSION,
+                "model": _model_version(),
+                "reforms": reform_parameter_dicts(reform),
+                **_dataset_identity(dataset),
+                "year": year,
+                "variables": list(variables),
+            },
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key):
+        """Return the stored arrays for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        # Reads count as use for least-recently-used eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return arrays
+
+    def put(self, key, arrays):
+        """Store a dict of arrays under key, then evict down to max_bytes."""
+        path = self._path(key)
+        # Write under a process-unique name and rename, so concurrent runs
+        # never read a partially written entry
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
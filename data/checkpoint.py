@@ -0,0 +1,223 @@
+"""
+Per-step checkpoints of stacked reform runs, so a crashed run can resume.
+
+A run directory holds the pickled baseline snapshot, one .npz per completed
+reform step with the cumulative reformed arrays the step's changes are taken
+from, and progress.json listing the completed reforms in order.
+
+progress.json also holds a fingerprint of the baseline and of every step.
+A step's fingerprint hashes its reform's parameter dictionaries together
+with the fingerprint of the step before it, so it changes whenever that
+reform or any earlier one does. An incremental run reuses the steps whose
+fingerprints still match and re-simulates from the first that changed.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+
+from cache import _dataset_identity, _model_version
+from reforms import reform_parameter_dicts
+
+PROGRESS_FILE = "progress.json"
+BASELINE_FILE = "baseline.pkl"
+
+
+def _fingerprint(payload, previous=""):
+    payload = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256((previous + payload).encode()).hexdigest()
+
+
+def baseline_fingerprint(baseline_reform, dataset, year):
+    """Fingerprint of everything that determines a baseline snapshot."""
+    return _fingerprint(
+        {
+            "model": _model_version(),
+            "baseline": reform_parameter_dicts(baseline_reform),
+            **_dataset_identity(dataset),
+            "year": year,
+        }
+    )
+
+
+def step_fingerprints(baseline_reform, reforms, dataset, year):
+    """
+    Fingerprint every step of a reform stack.
+
+    Parameters:
+    -----------
+    baseline_reform : Reform
+        The baseline the reforms are stacked on
+    reforms : dict
+        Dictionary of reform names to Reform objects, in stacking order
+    dataset : str or SyntheticDataset
+        Dataset simulated
+    year : int
+        Tax year calculated
+
+    Returns:
+    --------
+    list
+        One fingerprint per reform, each covering the baseline and every
+        reform up to and including it
+    """
+    fingerprints = []
+    previous = baseline_fingerprint(baseline_reform, dataset, year)
+    for reform_name, reform in reforms.items():
+        previous = _fingerprint(
+            {"name": reform_name, "reform": reform_parameter_dicts(reform)}, previous
+        )
+        fingerprints.append(previous)
+    return fingerprints
+
+
+def _replace_atomically(path, write):
+    """Write a file under a temporary name, then rename it into place."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        write(f)
+    os.replace(temp_path, path)
+
+
+class RunCheckpoint:
+    """
+    Run directory of a stacked reform analysis.
+
+    Parameters:
+    -----------
+    directory : str
+        Directory holding the checkpoint files. Created if missing.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _step_path(self, index):
+        return self._path(f"step_{index:03d}.npz")
+
+    def clear(self):
+        """Forget any previous run stored in the directory."""
+        for name in os.listdir(self.directory):
+            if name in (PROGRESS_FILE, BASELINE_FILE) or (
+                name.startswith("step_") and name.endswith(".npz")
+            ):
+                os.remove(self._path(name))
+
+    def _progress(self):
+        try:
+            with open(self._path(PROGRESS_FILE)) as f:
+                progress = json.load(f)
+        except FileNotFoundError:
+            progress = {}
+        progress.setdefault("steps", [])
+        # Runs checkpointed before fingerprinting have none
+        progress.setdefault("fingerprints", [None] * len(progress["steps"]))
+        progress.setdefault("baseline", None)
+        return progress
+
+    def _write_progress(self, progress):
+        _replace_atomically(
+            self._path(PROGRESS_FILE),
+            lambda f: f.write(json.dumps(progress).encode()),
+        )
+
+    def completed_steps(self):
+        """Names of the reforms completed so far, in stacking order."""
+        return self._progress()["steps"]
+
+    def reusable_steps(self, baseline_fingerprint, fingerprints):
+        """
+        Count the completed steps that match a new run's fingerprints.
+
+        Parameters:
+        -----------
+        baseline_fingerprint : str
+            Fingerprint of the new run's baseline
+        fingerprints : list
+            Fingerprints of the new run's steps, from step_fingerprints
+
+        Returns:
+        --------
+        int
+            Length of the longest prefix of completed steps that the new run
+            can reuse, 0 if the baseline changed
+        """
+        progress = self._progress()
+        if progress["baseline"] != baseline_fingerprint:
+            return 0
+        reusable = 0
+        for stored, new in zip(progress["fingerprints"], fingerprints):
+            if stored is None or stored != new:
+                break
+            reusable += 1
+        return reusable
+
+    def truncate(self, n_steps):
+        """Forget every completed step after the first n_steps."""
+        progress = self._progress()
+        for index in range(n_steps, len(progress["steps"])):
+            if os.path.exists(self._step_path(index)):
+                os.remove(self._step_path(index))
+        progress["steps"] = progress["steps"][:n_steps]
+        progress["fingerprints"] = progress["fingerprints"][:n_steps]
+        self._write_progress(progress)
+
+    def load_baseline(self, fingerprint=None):
+        """
+        Return the saved BaselineSnapshot, or None if there is none or, when
+        fingerprint is given, it was saved with a different fingerprint.
+        """
+        if fingerprint is not None and self._progress()["baseline"] != fingerprint:
+            return None
+        try:
+            with open(self._path(BASELINE_FILE), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_baseline(self, snapshot, fingerprint=None):
+        _replace_atomically(
+            self._path(BASELINE_FILE), lambda f: pickle.dump(snapshot, f)
+        )
+        progress = self._progress()
+        progress["baseline"] = fingerprint
+        self._write_progress(progress)
+
+    def load_step(self, index):
+        """Return the arrays saved for the index-th reform step."""
+        with np.load(self._step_path(index)) as data:
+            return {name: data[name] for name in data.files}
+
+    def save_step(self, index, reform_name, arrays, fingerprint=None):
+        """
+        Save the arrays of a completed reform step and mark it completed.
+
+        Parameters:
+        -----------
+        index : int
+            Position of the reform in the stack
+        reform_name : str
+            Name of the reform, checked against the stack on resume
+        arrays : dict
+            Arrays needed to continue the run from this step
+        fingerprint : str, optional
+            Fingerprint of the step, from step_fingerprints
+        """
+        progress = self._progress()
+        steps = progress["steps"]
+        if len(steps) != index:
+            raise ValueError(
+                f"Cannot checkpoint step {index} after {len(steps)} completed steps"
+            )
+        _replace_atomically(self._step_path(index), lambda f: np.savez(f, **arrays))
+        # Progress is written last, so a crash mid-step leaves it unrecorded
+        progress["steps"].append(reform_name)
+        progress["fingerprints"].append(fingerprint)
+        self._write_progress(progress)
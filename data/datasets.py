@@ -0,0 +1,323 @@
+"""
+Household-complete subsets and shards of simulation datasets.
+
+A subset keeps some households together with every person, tax unit, SPM
+unit, family and marital unit in them, so that each household simulates
+exactly as it does in the full dataset. Households keep their IDs and their
+order. Subsets are chosen by household ID, state or random fraction with
+select_households, or split into shards with shard_dataset.
+
+Enhanced CPS style h5 files are subset into new h5 files, in the same
+layout (one array per variable, or one group per variable with an array per
+period). Each variable is cut by its entity, read from the tax-benefit
+system. Synthetic datasets are subset in memory.
+"""
+
+import hashlib
+import os
+from dataclasses import replace
+
+import numpy as np
+
+from engine import tax_benefit_system_class
+from synthetic import SyntheticDataset, dataset_population
+
+# Group entities, linked to persons by person_<entity>_id
+GROUP_ENTITIES = ["household", "tax_unit", "spm_unit", "family", "marital_unit"]
+
+# State codes to the FIPS codes of h5 datasets' state_fips variable
+STATE_FIPS = {
+    "AL": 1, "AK": 2, "AZ": 4, "AR": 5, "CA": 6, "CO": 8, "CT": 9, "DE": 10,
+    "DC": 11, "FL": 12, "GA": 13, "HI": 15, "ID": 16, "IL": 17, "IN": 18,
+    "IA": 19, "KS": 20, "KY": 21, "LA": 22, "ME": 23, "MD": 24, "MA": 25,
+    "MI": 26, "MN": 27, "MS": 28, "MO": 29, "MT": 30, "NE": 31, "NV": 32,
+    "NH": 33, "NJ": 34, "NM": 35, "NY": 36, "NC": 37, "ND": 38, "OH": 39,
+    "OK": 40, "OR": 41, "PA": 42, "RI": 44, "SC": 45, "SD": 46, "TN": 47,
+    "TX": 48, "UT": 49, "VT": 50, "VA": 51, "WA": 53, "WV": 54, "WI": 55,
+    "WY": 56,
+}  # fmt: skip
+
+
+def dataset_from_spec(spec):
+    """
+    Dataset named by a command-line spec: a path or URL of an h5 file, or
+    "synthetic:<households>[:<seed>]" for a synthetic dataset.
+    """
+    if spec.startswith("synthetic:"):
+        _, *values = spec.split(":")
+        return SyntheticDataset(*map(int, values))
+    return spec
+
+
+def _is_synthetic(dataset):
+    return hasattr(dataset, "simulation")
+
+
+def local_dataset_path(dataset):
+    """Local path of a dataset file, downloading hf:// datasets first."""
+    if dataset.startswith("hf://"):
+        from policyengine_core.tools.hugging_face import (
+            download_huggingface_dataset,
+            parse_hf_url,
+        )
+
+        owner, repo, filename, version = parse_hf_url(dataset)
+        return download_huggingface_dataset(
+            repo=f"{owner}/{repo}", repo_filename=filename, version=version
+        )
+    return dataset
+
+
+def _read(item):
+    """Array of an h5 variable, from its first period if it has several."""
+    import h5py
+
+    if isinstance(item, h5py.Group):
+        item = item[next(iter(item))]
+    return item[...]
+
+
+def household_ids(dataset):
+    """Household IDs of a dataset, in its household order."""
+    if _is_synthetic(dataset):
+        return dataset_population(dataset)[0]["household_id"]
+    import h5py
+
+    with h5py.File(local_dataset_path(dataset), "r") as f:
+        return _read(f["household_id"])
+
+
+def household_states(dataset):
+    """State code of every household of a dataset, in its household order."""
+    if _is_synthetic(dataset):
+        return dataset_population(dataset)[0]["state_code"].astype(str)
+    import h5py
+
+    with h5py.File(local_dataset_path(dataset), "r") as f:
+        fips = _read(f["state_fips"])
+    codes = np.full(max(STATE_FIPS.values()) + 1, "", dtype=object)
+    for code, number in STATE_FIPS.items():
+        codes[number] = code
+    return codes[fips.astype(np.int64)].astype(str)
+
+
+def select_households(dataset, ids=None, states=None, fraction=None, seed=0):
+    """
+    Choose households of a dataset by ID, state and random fraction.
+
+    Households must meet every criterion given. The fraction is drawn
+    uniformly from those meeting the others, without regard to weights, so
+    weighted totals of a fraction are not population totals.
+
+    Parameters:
+    -----------
+    dataset : str or SyntheticDataset
+        Dataset to choose from
+    ids : list, optional
+        Household IDs to keep
+    states : list, optional
+        State codes, e.g. ["CA", "NY"], whose households to keep
+    fraction : float, optional
+        Share of households to keep at random, e.g. 0.01
+    seed : int
+        Seed of the random fraction
+
+    Returns:
+    --------
+    np.ndarray
+        Positions of the chosen households, in increasing order
+    """
+    all_ids = household_ids(dataset)
+    chosen = np.ones(len(all_ids), dtype=bool)
+    if ids is not None:
+        chosen &= np.isin(all_ids, np.asarray(ids))
+        unknown = np.setdiff1d(np.asarray(ids), all_ids)
+        if len(unknown):
+            raise ValueError(f"No households with IDs {unknown.tolist()}")
+    if states is not None:
+        unknown = sorted(set(states) - set(STATE_FIPS))
+        if unknown:
+            raise ValueError(f"Unknown state codes {unknown}")
+        chosen &= np.isin(household_states(dataset), list(states))
+    rows = np.flatnonzero(chosen)
+    if fraction is not None:
+        if not 0 < fraction <= 1:
+            raise ValueError(f"Fraction must be in (0, 1], not {fraction}")
+        size = max(1, round(fraction * len(rows))) if len(rows) else 0
+        rng = np.random.default_rng(seed)
+        rows = np.sort(rng.choice(rows, size, replace=False))
+    if not len(rows):
+        raise ValueError("No households match the subset")
+    return rows
+
+
+def variable_entities(variables):
+    """Entity key of each variable, from the tax-benefit system."""
+    system = tax_benefit_system_class()()
+    return {
+        variable: system.variables[variable].entity.key
+        for variable in variables
+        if variable in system.variables
+    }
+
+
+def entity_masks(f, household_rows):
+    """
+    Rows of every entity in the households at household_rows of an h5 file.
+
+    Returns:
+    --------
+    dict
+        Entity keys, including "person", to boolean row masks
+    """
+    ids = _read(f["household_id"])
+    kept = np.zeros(len(ids), dtype=bool)
+    kept[household_rows] = True
+    person_household = _read(f["person_household_id"])
+    persons = np.isin(person_household, ids[kept])
+    masks = {"person": persons, "household": kept}
+    for entity in GROUP_ENTITIES[1:]:
+        if f"{entity}_id" in f and f"person_{entity}_id" in f:
+            entity_ids = _read(f[f"{entity}_id"])
+            linked = _read(f[f"person_{entity}_id"])[persons]
+            masks[entity] = np.isin(entity_ids, linked)
+    return masks
+
+
+def subset_h5(path, household_rows, output_path, entities=None):
+    """
+    Write the households at household_rows of an h5 dataset to a new file.
+
+    Parameters:
+    -----------
+    path : str
+        Local path of the dataset
+    household_rows : np.ndarray
+        Positions of the households to keep
+    output_path : str
+        Path of the subset file
+    entities : dict, optional
+        Variable names to entity keys. Read from the tax-benefit system if
+        not given.
+
+    Returns:
+    --------
+    str
+        output_path
+    """
+    import h5py
+
+    # Written under a temporary name, so that processes subsetting the same
+    # households never read a partial file
+    partial_path = f"{output_path}.{os.getpid()}.partial"
+    with h5py.File(path, "r") as f, h5py.File(partial_path, "w") as out:
+        masks = entity_masks(f, household_rows)
+        if entities is None:
+            entities = variable_entities(list(f))
+        # Variables the system does not know are matched to the one entity
+        # with as many rows, if there is one
+        sizes = {}
+        for entity, mask in masks.items():
+            sizes.setdefault(len(mask), []).append(entity)
+
+        def cut(name, values):
+            entity = entities.get(name)
+            if entity is None:
+                candidates = sizes.get(len(values), [])
+                if len(candidates) != 1:
+                    raise ValueError(f"Cannot tell the entity of '{name}'")
+                entity = candidates[0]
+            return values[masks[entity]]
+
+        for name, item in f.items():
+            if isinstance(item, h5py.Group):
+                group = out.create_group(name)
+                for period, values in item.items():
+                    group.create_dataset(period, data=cut(name, values[...]))
+            else:
+                out.create_dataset(name, data=cut(name, item[...]))
+    os.replace(partial_path, output_path)
+    return output_path
+
+
+def subset_dataset(dataset, household_rows, directory=None, label=None):
+    """
+    Keep the households at some positions of a dataset.
+
+    Parameters:
+    -----------
+    dataset : str or SyntheticDataset
+        Path or URL of an h5 dataset, or a synthetic dataset
+    household_rows : np.ndarray
+        Positions of the households to keep, in increasing order
+    directory : str, optional
+        Directory to write h5 subsets to. Not used for synthetic datasets.
+    label : str, optional
+        Name of the subset, e.g. "shard 1 of 4", after the name of dataset if
+        it is a subset itself. A digest of the rows if not given.
+
+    Returns:
+    --------
+    str or SyntheticDataset
+        Path of the subset file, or the synthetic subset
+    """
+    household_rows = np.asarray(household_rows, dtype=np.int64)
+    if label is None:
+        digest = hashlib.sha256(household_rows.tobytes()).hexdigest()[:12]
+        label = f"{len(household_rows)} households {digest}"
+    if _is_synthetic(dataset):
+        if dataset.households is not None:
+            household_rows = np.asarray(dataset.households)[household_rows]
+            # The label identifies the subset in cache keys and fingerprints,
+            # so a subset of a subset names its parent too
+            label = f"{dataset.subset} / {label}"
+        return replace(dataset, households=tuple(household_rows.tolist()), subset=label)
+    if directory is None:
+        raise ValueError("Subsetting an h5 dataset requires a directory")
+    os.makedirs(directory, exist_ok=True)
+    path = local_dataset_path(dataset)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    output_path = os.path.join(directory, f"{stem}_{label.replace(' ', '_')}.h5")
+    if os.path.exists(output_path) and os.path.getmtime(
+        output_path
+    ) >= os.path.getmtime(path):
+        # Written from the same households of the same file before
+        return output_path
+    print(f"Writing {len(household_rows):,} households to '{output_path}'")
+    return subset_h5(path, household_rows, output_path)
+
+
+def shard_rows(n_households, n_shards):
+    """Split household positions into n_shards contiguous, nonempty blocks."""
+    n_shards = max(1, min(n_shards, n_households))
+    return np.array_split(np.arange(n_households), n_shards)
+
+
+def shard_dataset(dataset, n_shards, directory=None):
+    """
+    Split a dataset into household-complete shards.
+
+    Parameters:
+    -----------
+    dataset : str or SyntheticDataset
+        Dataset to split
+    n_shards : int
+        Number of shards. Fewer if the dataset has fewer households.
+    directory : str, optional
+        Directory to write h5 shards to
+
+    Returns:
+    --------
+    list
+        (shard dataset, household positions in dataset) pairs
+    """
+    blocks = shard_rows(len(household_ids(dataset)), n_shards)
+    return [
+        (
+            subset_dataset(
+                dataset, rows, directory, label=f"shard {i} of {len(blocks)}"
+            ),
+            rows,
+        )
+        for i, rows in enumerate(blocks, 1)
+    ]
@@ -0,0 +1,33 @@
+"""
+Lazy access to the simulation engine.
+
+Importing policyengine_us loads the whole tax-benefit system and its
+parameter tree, and policyengine_core alone takes seconds to import. The
+engine is therefore only imported when a reform is built or a simulation
+run, so that listing reforms and post-processing existing results start
+quickly. benchmark.py import-time checks that they stay that way.
+"""
+
+# Modules whose import means the engine was loaded
+ENGINE_MODULES = ["policyengine_core", "policyengine_us"]
+
+
+def reform_class():
+    """policyengine_core's Reform, imported on first use."""
+    from policyengine_core.reforms import Reform
+
+    return Reform
+
+
+def microsimulation_class():
+    """policyengine_us's Microsimulation, imported on first use."""
+    from policyengine_us import Microsimulation
+
+    return Microsimulation
+
+
+def tax_benefit_system_class():
+    """policyengine_us's CountryTaxBenefitSystem, imported on first use."""
+    from policyengine_us import CountryTaxBenefitSystem
+
+    return CountryTaxBenefitSystem
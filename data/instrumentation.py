@@ -0,0 +1,140 @@
+"""
+Resource measurements and run reports for analysis runs.
+
+Stages of a run are wrapped in the stage context manager, which records
+their wall time, CPU time, the peak RSS of the process when they end and,
+if given, the size of the arrays they produced:
+
+    with stage("simulation", reform=reform_name) as record:
+        values = ...
+        record_arrays(record, values)
+
+Records of nested stages carry the path of the stages they ran in, e.g.
+"analysis/reform step/simulation". collect gathers the records of one call
+so they can be returned from worker processes, and write_run_report saves
+them all as JSON.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+# Names of the stages open in this process, outermost first
+_open_stages = []
+# Records of the stages finished in this process
+_records = []
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process so far, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def stage(name, **labels):
+    """
+    Record the resources used by the code run in the with block.
+
+    Parameters:
+    -----------
+    name : str
+        Stage name, e.g. "simulation"
+    **labels
+        Extra fields of the record, e.g. the reform name
+
+    Yields:
+    -------
+    dict
+        The record, for the block to add fields to
+    """
+    record = {"stage": "/".join(_open_stages + [name]), **labels}
+    _open_stages.append(name)
+    record["pid"] = os.getpid()
+    record["started"] = time.time()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield record
+    finally:
+        _open_stages.pop()
+        record["wall_seconds"] = time.perf_counter() - wall_start
+        record["cpu_seconds"] = time.process_time() - cpu_start
+        record["peak_rss_bytes"] = peak_rss_bytes()
+        _records.append(record)
+
+
+def record_arrays(record, arrays):
+    """Add the number and total size of a dict or list of arrays to a record."""
+    if isinstance(arrays, dict):
+        arrays = arrays.values()
+    sizes = [np.asarray(values).nbytes for values in arrays]
+    record["arrays"] = len(sizes)
+    record["array_bytes"] = int(sum(sizes))
+
+
+def collect(function, *args, **kwargs):
+    """
+    Call function and return its result with the stage records it made.
+
+    Used to bring the records of jobs run in worker processes back to the
+    process writing the report.
+    """
+    start = len(_records)
+    result = function(*args, **kwargs)
+    records = _records[start:]
+    del _records[start:]
+    return result, records
+
+
+def add_records(records):
+    """Add stage records made in another process, e.g. by collect, to this one's."""
+    _records.extend(records)
+
+
+def write_run_report(path, records, started, **info):
+    """
+    Write the stage records of a run as a JSON report.
+
+    Parameters:
+    -----------
+    path : str
+        Path of the report
+    records : list
+        Stage records, e.g. from collect
+    started : datetime
+        When the run started
+    **info
+        Run settings to include, e.g. the year and workers
+
+    Returns:
+    --------
+    str
+        Path of the report
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    report = {
+        **info,
+        "started": started.isoformat(timespec="seconds"),
+        "finished": datetime.now().isoformat(timespec="seconds"),
+        "wall_seconds": (datetime.now() - started).total_seconds(),
+        "cpu_seconds": usage.ru_utime
+        + usage.ru_stime
+        + children.ru_utime
+        + children.ru_stime,
+        "peak_rss_bytes": max(
+            [peak_rss_bytes()] + [record["peak_rss_bytes"] for record in records]
+        ),
+        "stages": sorted(records, key=lambda record: record["started"]),
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    return path
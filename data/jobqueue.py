@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+File-based job queue for spreading analysis sweeps over several machines.
+
+A coordinator writes one job per (baseline, package, year, shard) to a queue
+directory on a filesystem every machine mounts. Workers claim jobs, run
+calculate_stacked_household_impacts on their household shard and store the
+result. Once every job is done, merge puts each analysis back together from
+its shards and writes the outputs.
+
+Usage:
+    python jobqueue.py submit --queue-dir /shared/queue --years 2026 2027 --shards 8
+    python jobqueue.py work --queue-dir /shared/queue     # on every machine
+    python jobqueue.py status --queue-dir /shared/queue
+    python jobqueue.py merge --queue-dir /shared/queue --output-dir ../static
+
+Several workers on one host are just several work processes:
+
+    for i in 1 2 3 4; do python jobqueue.py work --queue-dir /tmp/queue & done
+
+Queue directory layout:
+    queue.json          the sweep: dataset, years, shards and analyses
+    jobs/<job>.json     job specifications
+    leases/<job>.json   claims of running jobs, with their expiry time
+    results/<job>.pkl   household results of finished jobs
+
+A worker claims a job by creating its lease file exclusively, and renews the
+lease while the job runs. If a worker dies, its lease expires and another
+worker takes the job over. A worker whose lease was lost, e.g. while it was
+stalled, discards its result and leaves the job to the lease holder. Results
+are written under a temporary name and renamed into place, so a job is done
+exactly when its result file exists. Lease expiry compares wall
+clocks, so the machines' clocks must agree to well within the lease time.
+"""
+
+import argparse
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from analysis import DATASET, calculate_stacked_household_impacts, combine_shards
+from datasets import dataset_from_spec, household_ids, shard_rows, subset_dataset
+from instrumentation import collect, stage, write_run_report
+from main import YEAR, select_analyses, select_reform_analyses
+from output import FORMATS, write_results
+from reforms import BASELINES, PACKAGES, select_reforms
+
+# Seconds a lease lasts without renewal
+LEASE_SECONDS = 600
+# Seconds between checks for claimable jobs while others are running
+POLL_SECONDS = 10
+
+
+def _write_json(path, payload):
+    """Write JSON atomically, so that readers never see a partial file."""
+    partial_path = f"{path}.{socket.gethostname()}.{os.getpid()}.partial"
+    with open(partial_path, "w") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(partial_path, path)
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _names(factories):
+    """Factories to their names in reforms.BASELINES or reforms.PACKAGES."""
+    return {factory: name for name, factory in factories.items()}
+
+
+def job_id(job):
+    return f"{job['output_name']}_{job['year']}_shard_{job['shard']}"
+
+
+class JobQueue:
+    """
+    Queue of analysis jobs in a shared directory.
+
+    Parameters:
+    -----------
+    directory : str
+        Queue directory, on a filesystem shared by every worker
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.jobs_dir = os.path.join(directory, "jobs")
+        self.leases_dir = os.path.join(directory, "leases")
+        self.results_dir = os.path.join(directory, "results")
+
+    def _path(self, kind, job):
+        directory = {
+            "job": self.jobs_dir,
+            "lease": self.leases_dir,
+            "result": self.results_dir,
+        }[kind]
+        suffix = ".pkl" if kind == "result" else ".json"
+        return os.path.join(directory, job_id(job) + suffix)
+
+    def sweep(self):
+        """Settings of the submitted sweep."""
+        sweep = _read_json(os.path.join(self.directory, "queue.json"))
+        if sweep is None:
+            raise FileNotFoundError(f"No jobs submitted to {self.directory}")
+        return sweep
+
+    def submit(
+        self,
+        baselines=None,
+        packages=None,
+        years=(YEAR,),
+        n_shards=1,
+        dataset=DATASET,
+        reform_names=None,
+        through=None,
+        change_dtype="float64",
+    ):
+        """
+        Write a job for every analysis, year and household shard.
+
+        Parameters:
+        -----------
+        baselines : list, optional
+            Names from reforms.BASELINES. All if not given.
+        packages : list, optional
+            Names from reforms.PACKAGES. All if not given.
+        years : list
+            Tax years to analyze
+        n_shards : int
+            Number of household shards of every analysis and year
+        dataset : str
+            Dataset spec, see datasets.dataset_from_spec
+        reform_names : list, optional
+            Only stack the reforms with these names
+        through : str, optional
+            Only stack each package up to and including this reform
+        change_dtype : str
+            Dtype of the change columns, float64 or float32
+
+        Returns:
+        --------
+        list
+            The jobs written
+        """
+        if os.path.exists(os.path.join(self.directory, "queue.json")):
+            raise FileExistsError(f"Jobs were already submitted to {self.directory}")
+        for directory in [self.jobs_dir, self.leases_dir, self.results_dir]:
+            os.makedirs(directory, exist_ok=True)
+        n_shards = len(
+            shard_rows(len(household_ids(dataset_from_spec(dataset))), n_shards)
+        )
+        baseline_names = _names(BASELINES)
+        package_names = _names(PACKAGES)
+        analyses = [
+            {
+                "title": analysis["title"],
+                "baseline": baseline_names[analysis["baseline"]],
+                "package": package_names[analysis["reforms"]],
+                "output_name": analysis["output_name"],
+            }
+            for analysis in select_reform_analyses(
+                select_analyses(baselines, packages), reform_names, through
+            )
+        ]
+        jobs = [
+            {
+                **analysis,
+                "year": year,
+                "shard": shard,
+                "shards": n_shards,
+                "dataset": dataset,
+                "reform_names": reform_names,
+                "through": through,
+                "change_dtype": change_dtype,
+            }
+            for analysis in analyses
+            for year in years
+            for shard in range(n_shards)
+        ]
+        for job in jobs:
+            _write_json(self._path("job", job), job)
+        # Written last, as workers only look for jobs once it exists
+        _write_json(
+            os.path.join(self.directory, "queue.json"),
+            {
+                "submitted": datetime.now().isoformat(timespec="seconds"),
+                "dataset": dataset,
+                "years": list(years),
+                "shards": n_shards,
+                "analyses": analyses,
+            },
+        )
+        print(f"Submitted {len(jobs)} jobs to {self.directory}")
+        return jobs
+
+    def jobs(self):
+        """Every job of the queue, in submission order."""
+        sweep = self.sweep()
+        return [
+            _read_json(
+                self._path(
+                    "job",
+                    {
+                        "output_name": analysis["output_name"],
+                        "year": year,
+                        "shard": shard,
+                    },
+                )
+            )
+            for analysis in sweep["analyses"]
+            for year in sweep["years"]
+            for shard in range(sweep["shards"])
+        ]
+
+    def is_done(self, job):
+        return os.path.exists(self._path("result", job))
+
+    def lease(self, job):
+        """The lease of a job, or None if it is not leased."""
+        return _read_json(self._path("lease", job))
+
+    def claim(self, job, worker, lease_seconds=LEASE_SECONDS):
+        """
+        Try to lease a job to a worker.
+
+        Creating the lease file exclusively decides between workers claiming
+        the same job. An expired lease is first moved aside by renaming,
+        which also only one worker can do.
+
+        Returns:
+        --------
+        bool
+            Whether the worker now holds the lease
+        """
+        path = self._path("lease", job)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            lease = _read_json(path)
+            if lease is None:
+                # Being written by the worker that just created it, unless
+                # that worker died before writing it
+                try:
+                    if time.time() - os.path.getmtime(path) < lease_seconds:
+                        return False
+                except FileNotFoundError:
+                    return False
+            elif lease["expires"] > time.time():
+                return False
+            expired_path = f"{path}.{worker}.expired"
+            try:
+                os.rename(path, expired_path)
+            except FileNotFoundError:
+                return False
+            lease = _read_json(expired_path)
+            if lease is not None and lease["expires"] > time.time():
+                # Another worker renewed or reclaimed the lease in between:
+                # put it back unless yet another lease was created since
+                try:
+                    os.link(expired_path, path)
+                except FileExistsError:
+                    pass
+                os.remove(expired_path)
+                return False
+            os.remove(expired_path)
+            print(f"Lease of {job_id(job)} expired, taking it over")
+            return self.claim(job, worker, lease_seconds)
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._lease(worker, lease_seconds), f)
+        return True
+
+    def _lease(self, worker, lease_seconds):
+        return {
+            "worker": worker,
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "expires": time.time() + lease_seconds,
+        }
+
+    def _take_lease(self, job, worker):
+        """
+        Move a worker's lease of a job aside, as claim moves expired leases.
+
+        Only one worker can rename the lease file, so checking the moved file
+        cannot race with another worker taking the job over. A lease of
+        another worker is put back.
+
+        Returns:
+        --------
+        str or None
+            Path the lease was moved to, or None if the worker does not hold it
+        """
+        path = self._path("lease", job)
+        held_path = f"{path}.{worker}.held"
+        try:
+            os.rename(path, held_path)
+        except FileNotFoundError:
+            return None
+        lease = _read_json(held_path)
+        if lease is None or lease["worker"] != worker:
+            try:
+                os.link(held_path, path)
+            except FileExistsError:
+                pass
+            os.remove(held_path)
+            return None
+        return held_path
+
+    def renew(self, job, worker, lease_seconds=LEASE_SECONDS):
+        """
+        Extend a worker's lease. Returns False if it no longer holds it,
+        including when another worker claimed the job while the lease was
+        moved aside.
+        """
+        held_path = self._take_lease(job, worker)
+        if held_path is None:
+            return False
+        _write_json(held_path, self._lease(worker, lease_seconds))
+        try:
+            os.link(held_path, self._path("lease", job))
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            os.remove(held_path)
+
+    def release(self, job, worker):
+        """Remove a worker's lease of a job."""
+        held_path = self._take_lease(job, worker)
+        if held_path is not None:
+            os.remove(held_path)
+
+    def complete(self, job, results, rows, records):
+        """Store the results of a job, which marks it done."""
+        path = self._path("result", job)
+        partial_path = f"{path}.{socket.gethostname()}.{os.getpid()}.partial"
+        pd.to_pickle(
+            {"job": job, "results": results, "rows": rows, "records": records},
+            partial_path,
+        )
+        os.replace(partial_path, path)
+
+    def status(self):
+        """
+        Count the jobs of the queue by state.
+
+        Returns:
+        --------
+        dict
+            Counts of done, running (live lease), expired (lease expired) and
+            pending jobs
+        """
+        counts = {"done": 0, "running": 0, "expired": 0, "pending": 0}
+        now = time.time()
+        for job in self.jobs():
+            lease = self.lease(job)
+            if self.is_done(job):
+                counts["done"] += 1
+            elif lease is None:
+                counts["pending"] += 1
+            elif lease["expires"] > now:
+                counts["running"] += 1
+            else:
+                counts["expired"] += 1
+        return counts
+
+
+def run_job(job, shard_dir=None):
+    """
+    Run the reform stack of one job on its household shard.
+
+    Returns:
+    --------
+    tuple
+        (results DataFrame, household positions of the shard in the dataset)
+    """
+    dataset = dataset_from_spec(job["dataset"])
+    rows = shard_rows(len(household_ids(dataset)), job["shards"])[job["shard"]]
+    if job["shards"] > 1:
+        dataset = subset_dataset(
+            dataset,
+            rows,
+            shard_dir,
+            label=f"shard {job['shard'] + 1} of {job['shards']}",
+        )
+    reforms = select_reforms(
+        PACKAGES[job["package"]](), job["reform_names"], job["through"]
+    )
+    with stage("job", job=job_id(job)):
+        results = calculate_stacked_household_impacts(
+            reforms,
+            BASELINES[job["baseline"]](),
+            job["year"],
+            dataset=dataset,
+            change_dtype=job["change_dtype"],
+        )
+    return results, rows
+
+
+def _renew_until(queue, job, worker, lease_seconds, finished, lost):
+    """
+    Renew a lease a few times per lease period until finished is set, or
+    set lost if the lease was lost.
+    """
+    while not finished.wait(lease_seconds / 4):
+        if not queue.renew(job, worker, lease_seconds):
+            print(f"Lost the lease of {job_id(job)}")
+            lost.set()
+            return
+
+
+def work(
+    queue_dir,
+    worker=None,
+    lease_seconds=LEASE_SECONDS,
+    poll_seconds=POLL_SECONDS,
+    max_jobs=None,
+):
+    """
+    Run jobs from a queue until every job is done.
+
+    While jobs remain that other workers hold, the worker waits and checks
+    again every poll_seconds, to take over the jobs of workers that die.
+
+    Parameters:
+    -----------
+    queue_dir : str
+        Queue directory
+    worker : str, optional
+        Worker name, unique across machines. Host and process ID if not given.
+    lease_seconds : float
+        Seconds a lease lasts without renewal
+    poll_seconds : float
+        Seconds between checks for claimable jobs
+    max_jobs : int, optional
+        Stop after running this many jobs
+
+    Returns:
+    --------
+    int
+        Number of jobs this worker ran
+    """
+    queue = JobQueue(queue_dir)
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    shard_dir = os.path.join(queue_dir, "shards")
+    completed = 0
+    while max_jobs is None or completed < max_jobs:
+        remaining = [job for job in queue.jobs() if not queue.is_done(job)]
+        if not remaining:
+            break
+        claimed = next(
+            (job for job in remaining if queue.claim(job, worker, lease_seconds)),
+            None,
+        )
+        if claimed is None:
+            time.sleep(poll_seconds)
+            continue
+        if queue.is_done(claimed):
+            # Finished by another worker between listing and claiming
+            queue.release(claimed, worker)
+            continue
+
+        print(f"[{worker}] Running {job_id(claimed)}")
+        finished = threading.Event()
+        lost = threading.Event()
+        renewer = threading.Thread(
+            target=_renew_until,
+            args=(queue, claimed, worker, lease_seconds, finished, lost),
+            daemon=True,
+        )
+        renewer.start()
+        try:
+            (results, rows), records = collect(run_job, claimed, shard_dir)
+            finished.set()
+            renewer.join()
+            # A worker that lost its lease leaves the job to the worker that
+            # holds it now, so that no job is published twice
+            if lost.is_set() or not queue.renew(claimed, worker, lease_seconds):
+                print(f"[{worker}] Discarding {job_id(claimed)}, leased elsewhere")
+                continue
+            queue.complete(claimed, results, rows, records)
+        finally:
+            finished.set()
+            renewer.join()
+            queue.release(claimed, worker)
+        completed += 1
+        print(f"[{worker}] Completed {job_id(claimed)}")
+    print(f"[{worker}] Ran {completed} jobs")
+    return completed
+
+
+def merge(queue_dir, output_dir=".", formats=("csv",), report_path="run_report.json"):
+    """
+    Assemble the results of every analysis and year from their shards.
+
+    Each result set is written as the analysis output name, followed by the
+    year when the sweep has several years.
+
+    Parameters:
+    -----------
+    queue_dir : str
+        Queue directory, with every job done
+    output_dir : str
+        Directory to write the results to
+    formats : list
+        Names from output.FORMATS to write
+    report_path : str, optional
+        Path, relative to output_dir, of the run report of every job's
+        stages. No report if None.
+
+    Returns:
+    --------
+    list
+        Paths of the written files
+    """
+    queue = JobQueue(queue_dir)
+    sweep = queue.sweep()
+    jobs = queue.jobs()
+    unfinished = [job_id(job) for job in jobs if not queue.is_done(job)]
+    if unfinished:
+        raise RuntimeError(f"{len(unfinished)} jobs are not done: {unfinished}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    records = []
+    for analysis in sweep["analyses"]:
+        for year in sweep["years"]:
+            shards = [
+                pd.read_pickle(queue._path("result", job))
+                for job in jobs
+                if job["output_name"] == analysis["output_name"] and job["year"] == year
+            ]
+            results = combine_shards(
+                [shard["results"] for shard in shards],
+                [np.asarray(shard["rows"]) for shard in shards],
+            )
+            for shard in shards:
+                records += shard["records"]
+            output_name = analysis["output_name"]
+            if len(sweep["years"]) > 1:
+                output_name += f"_{year}"
+            output_name = os.path.join(output_dir, output_name)
+            for path in write_results(results, output_name, formats):
+                print(f"Saved {analysis['title']} ({year}) to '{path}'")
+                paths.append(path)
+    if report_path:
+        path = write_run_report(
+            os.path.join(output_dir, report_path),
+            records,
+            datetime.fromisoformat(sweep["submitted"]),
+            dataset=sweep["dataset"],
+            years=sweep["years"],
+            shards=sweep["shards"],
+            jobs=len(jobs),
+        )
+        print(f"Saved run report to '{path}'")
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    submit = subparsers.add_parser("submit", help="Write the jobs of a sweep")
+    submit.add_argument("--queue-dir", required=True)
+    submit.add_argument("--baselines", nargs="+", choices=BASELINES)
+    submit.add_argument("--packages", nargs="+", choices=PACKAGES)
+    submit.add_argument("--years", nargs="+", type=int, default=[YEAR])
+    submit.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Household shards per analysis and year (default: 1)",
+    )
+    submit.add_argument(
+        "--dataset",
+        default=DATASET,
+        help="h5 dataset path or URL, or synthetic:<households>[:<seed>]",
+    )
+    reform_selection = submit.add_mutually_exclusive_group()
+    reform_selection.add_argument("--reforms", nargs="+", metavar="NAME")
+    reform_selection.add_argument("--through", metavar="NAME")
+    submit.add_argument(
+        "--change-dtype", choices=["float64", "float32"], default="float64"
+    )
+
+    worker = subparsers.add_parser("work", help="Run jobs until all are done")
+    worker.add_argument("--queue-dir", required=True)
+    worker.add_argument("--worker", help="Worker name (default: host-pid)")
+    worker.add_argument("--lease-seconds", type=float, default=LEASE_SECONDS)
+    worker.add_argument("--poll-seconds", type=float, default=POLL_SECONDS)
+    worker.add_argument("--max-jobs", type=int)
+
+    status = subparsers.add_parser("status", help="Count jobs by state")
+    status.add_argument("--queue-dir", required=True)
+
+    merger = subparsers.add_parser("merge", help="Write outputs of a finished sweep")
+    merger.add_argument("--queue-dir", required=True)
+    merger.add_argument("--output-dir", default=".")
+    merger.add_argument("--formats", nargs="+", choices=FORMATS, default=["csv"])
+    merger.add_argument("--report", default="run_report.json")
+
+    args = parser.parse_args()
+    if args.command == "submit":
+        JobQueue(args.queue_dir).submit(
+            baselines=args.baselines,
+            packages=args.packages,
+            years=args.years,
+            n_shards=args.shards,
+            dataset=args.dataset,
+            reform_names=args.reforms,
+            through=args.through,
+            change_dtype=args.change_dtype,
+        )
+    elif args.command == "work":
+        work(
+            args.queue_dir,
+            worker=args.worker,
+            lease_seconds=args.lease_seconds,
+            poll_seconds=args.poll_seconds,
+            max_jobs=args.max_jobs,
+        )
+    elif args.command == "status":
+        counts = JobQueue(args.queue_dir).status()
+        print(", ".join(f"{count} {state}" for state, count in counts.items()))
+    elif args.command == "merge":
+        merge(args.queue_dir, args.output_dir, args.formats, args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,134 +1,1030 @@
 #!/usr/bin/env python3
 """
 Main script for analyzing tax reform impacts.
-Analyzes 2026 tax year using enhanced CPS dataset.
+Analyzes the 2026 tax year by default, using the enhanced CPS dataset.
+
+Examples:
+    python main.py --packages senate
+    python main.py --baselines tcja --packages house --through "CTC Reform"
+    python main.py --year 2027 --output-dir ../static
+    python main.py --years 2026-2035 --packages senate
+    python main.py --list-reforms
+    python main.py --packages house --states CA NY --fraction 0.01
+    python main.py --from-results --output-dir ../static --summary-formats json
 """
 
+import argparse
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+
+import pandas as pd
+
 from reforms import (
+    BASELINES,
+    PACKAGES,
     tcja_reform,
     current_law_baseline,
     get_all_reforms,
     get_all_senate_finance_reforms,
+    select_reforms,
+)
+from analysis import (
+    DATASET,
+    align_columns,
+    calculate_baseline_snapshot,
+    calculate_baseline_snapshots,
+    calculate_multi_year_household_impacts,
+    calculate_sharded_household_impacts,
+    calculate_stacked_household_impacts,
+)
+from cache import DEFAULT_MAX_BYTES, SimulationCache
+from checkpoint import RunCheckpoint, baseline_fingerprint
+from datasets import (
+    STATE_FIPS,
+    dataset_from_spec,
+    household_ids,
+    select_households,
+    subset_dataset,
+)
+from instrumentation import collect, stage, write_run_report
+from output import (
+    FORMATS,
+    ColumnSink,
+    read_results,
+    write_results,
+    write_state_partitions,
+)
+from samples import SAMPLES_DIR, write_sample_tiers
+from shapley import (
+    ShapleyAttribution,
+    calculate_shapley_household_impacts,
+    write_shapley,
 )
-from analysis import calculate_stacked_household_impacts
+from summary import SUMMARY_FORMATS, write_summary
 
+YEAR = 2026
 
-def main():
-    print(f"Tax Reform Impact Analysis")
-    print(f"========================")
-    print(f"Analysis year: 2026")
-    print(f"Dataset: Enhanced CPS 2024")
-    print(f"Starting analysis at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+# Each analysis stacks one reform package on one baseline. Reforms are passed
+# as factories rather than Reform objects so that jobs can be sent to worker
+# processes.
+ANALYSES = [
+    {
+        "title": "House reforms vs Current Law baseline",
+        "baseline": current_law_baseline,
+        "reforms": get_all_reforms,
+        "output_name": "household_tax_income_changes_current_law_baseline",
+    },
+    {
+        "title": "Senate reforms vs Current Law baseline",
+        "baseline": current_law_baseline,
+        "reforms": get_all_senate_finance_reforms,
+        "output_name": "household_tax_income_changes_senate_current_law_baseline",
+    },
+    {
+        "title": "House reforms vs TCJA baseline",
+        "baseline": tcja_reform,
+        "reforms": get_all_reforms,
+        "output_name": "household_tax_income_changes_tcja_baseline",
+    },
+    {
+        "title": "Senate reforms vs TCJA baseline",
+        "baseline": tcja_reform,
+        "reforms": get_all_senate_finance_reforms,
+        "output_name": "household_tax_income_changes_senate_tcja_baseline",
+    },
+]
 
-    # Get reforms
-    reforms = get_all_reforms()
-    senate_reforms = get_all_senate_finance_reforms()
 
-    # Analysis 1: Current Law baseline
-    print("=" * 50)
-    print("ANALYSIS 1: Current Law Baseline")
-    print("=" * 50)
-    baseline_reform = current_law_baseline()
+def parse_years(value):
+    """Parse a year, e.g. "2026", or an inclusive range, e.g. "2026-2035"."""
+    try:
+        first, _, last = value.partition("-")
+        return list(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid year or year range '{value}'")
 
-    print(f"Analyzing {len(reforms)} reform components against Current Law baseline:")
-    for i, reform_name in enumerate(reforms.keys(), 1):
-        print(f"  {i}. {reform_name}")
-    print()
 
-    # Calculate household-level impacts with Current Law baseline
-    df_current_law = calculate_stacked_household_impacts(
-        reforms=reforms, baseline_reform=baseline_reform, year=2026
-    )
+def select_analyses(baselines=None, packages=None):
+    """
+    Select the entries of ANALYSES for some baselines and packages.
 
-    # Save Current Law baseline results
-    output_file_current_law = "household_tax_income_changes_current_law_baseline.csv"
-    df_current_law.to_csv(output_file_current_law, index=False)
-    print(f"\nSaved Current Law baseline results to '{output_file_current_law}'")
-    print(f"Total households analyzed: {len(df_current_law):,}")
+    Parameters:
+    -----------
+    baselines : list, optional
+        Names from reforms.BASELINES. All if not given.
+    packages : list, optional
+        Names from reforms.PACKAGES. All if not given.
 
-    # Display sample results
-    print(f"\nFirst 5 rows of Current Law baseline results:")
-    print(df_current_law.head())
+    Returns:
+    --------
+    list
+        Selected entries of ANALYSES, in their order there
+    """
+    baseline_factories = [BASELINES[name] for name in baselines or BASELINES]
+    package_factories = [PACKAGES[name] for name in packages or PACKAGES]
+    return [
+        analysis
+        for analysis in ANALYSES
+        if analysis["baseline"] in baseline_factories
+        and analysis["reforms"] in package_factories
+    ]
 
-    # Senate Finance analysis with Current Law baseline
-    print("\n" + "=" * 40)
-    print("Senate Finance Tax Reform Impact Analysis (Current Law Baseline)")
-    print("=" * 40)
-    print(f"Analyzing {len(senate_reforms)} Senate reform components:")
-    for i, reform_name in enumerate(senate_reforms.keys(), 1):
-        print(f"  {i}. {reform_name}")
-    print()
-    df_senate_current_law = calculate_stacked_household_impacts(
-        reforms=senate_reforms, baseline_reform=baseline_reform, year=2026
-    )
-    senate_output_file_current_law = (
-        "household_tax_income_changes_senate_current_law_baseline.csv"
-    )
-    df_senate_current_law.to_csv(senate_output_file_current_law, index=False)
-    print(
-        f"\nSaved Senate Current Law baseline results to '{senate_output_file_current_law}'"
-    )
-    print(f"Total households analyzed (Senate): {len(df_senate_current_law):,}")
-    print(f"\nFirst 5 rows of Senate Current Law baseline results:")
-    print(df_senate_current_law.head())
 
-    # Analysis 2: TCJA baseline
-    print("\n" + "=" * 50)
-    print("ANALYSIS 2: TCJA Baseline")
-    print("=" * 50)
-    tcja_baseline_reform = tcja_reform()
+def list_reforms(packages=None):
+    """
+    Print the reforms of each package and the parameters they change,
+    without building them or loading the simulation engine.
+    """
+    for package in packages or PACKAGES:
+        registry = PACKAGES[package]()
+        print(f"{package}:")
+        for step, name in enumerate(registry, 1):
+            print(f"  {step:>2}. {name}")
+            for path in registry.parameter_paths(name):
+                print(f"        {path}")
+
+
+def analysis_run_dir(analysis, run_dir):
+    """Checkpoint directory of one analysis inside a run directory."""
+    if run_dir is None:
+        return None
+    return os.path.join(run_dir, analysis["output_name"])
+
 
-    print(f"Analyzing {len(reforms)} reform components against TCJA baseline:")
+def write_derived_outputs(
+    results,
+    output_name,
+    formats=("csv",),
+    samples_dir=None,
+    summary_formats=(),
+    partition_by_state=False,
+):
+    """
+    Write the state partitions, sample tiers and summaries of a result set.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+    output_name : str
+        Output path of the results, without extension
+    formats : list
+        Formats, from output.FORMATS, to write state partitions in
+    samples_dir : str, optional
+        Directory to write the web app's sample tiers to
+    summary_formats : list
+        Formats, from summary.SUMMARY_FORMATS, to write the summary in
+    partition_by_state : bool
+        Write the results as one file per state, with a manifest
+    """
+    if partition_by_state:
+        with stage("state partitions", analysis=output_name):
+            path = write_state_partitions(results, output_name, formats)
+        print(f"Saved per-state results listed in '{path}'")
+    if samples_dir:
+        with stage("samples", analysis=output_name):
+            paths = write_sample_tiers(results, output_name, samples_dir)
+        for path in paths:
+            print(f"Saved sample to '{path}'")
+    if summary_formats:
+        with stage("summary", analysis=output_name):
+            paths = write_summary(results, output_name, summary_formats)
+        for path in paths:
+            print(f"Saved summary to '{path}'")
+
+
+def postprocess_results(
+    baselines=None,
+    packages=None,
+    output_dir=".",
+    formats=("csv",),
+    samples_dir=None,
+    summary_formats=(),
+    partition_by_state=False,
+):
+    """
+    Regenerate the state partitions, sample tiers and summaries of result
+    sets already in output_dir, without simulating.
+
+    Each result set is read from the first of formats found. Parameters are
+    as for main.
+    """
+    analyses = select_analyses(baselines, packages)
+    for analysis in analyses:
+        output_name = os.path.join(output_dir, analysis["output_name"])
+        print(f"{analysis['title']}: reading '{output_name}'")
+        results = read_results(output_name, formats)
+        write_derived_outputs(
+            results,
+            output_name,
+            formats,
+            samples_dir,
+            summary_formats,
+            partition_by_state,
+        )
+
+
+def match_columns(results, output_name):
+    """
+    Give the results of a subset run the columns of the full result set
+    saved as output_name, if there is one with the same reform columns.
+
+    A subset can lack "Age of Dependent" columns that the full dataset has,
+    see analysis.align_columns.
+    """
+    path = f"{output_name}.csv"
+    if isinstance(results, pd.DataFrame) and os.path.exists(path):
+        columns = list(pd.read_csv(path, nrows=0).columns)
+        missing = set(columns) - set(results.columns)
+        if set(results.columns) <= set(columns) and all(
+            column.startswith("Age of Dependent ") for column in missing
+        ):
+            return align_columns(results, columns)
+    return results
+
+
+def select_reform_analyses(analyses, reform_names=None, through=None):
+    """
+    Check a reform selection against the packages of some analyses, before
+    anything is simulated.
+
+    Analyses whose package has none of reform_names, or not through, are
+    skipped with a note, so that e.g. --through "CTC Reform" runs only the
+    House analyses.
+
+    Returns:
+    --------
+    list
+        The analyses with reforms selected
+
+    Raises:
+    -------
+    ValueError
+        If a selected name is in none of the packages
+    """
+    if reform_names is None and through is None:
+        return analyses
+    package_names = {
+        factory: list(factory())
+        for factory in dict.fromkeys(analysis["reforms"] for analysis in analyses)
+    }
+    available = {name for names in package_names.values() for name in names}
+    unknown = [
+        name
+        for name in (reform_names or []) + ([through] if through else [])
+        if name not in available
+    ]
+    if unknown:
+        raise ValueError(f"No reforms named {unknown} in the selected packages")
+    selected = []
+    for analysis in analyses:
+        names = package_names[analysis["reforms"]]
+        if through is not None and through not in names:
+            print(f"Skipping {analysis['title']}: no reform named '{through}'")
+        elif not select_reforms(dict.fromkeys(names), reform_names, through):
+            print(f"Skipping {analysis['title']}: none of the selected reforms")
+        else:
+            selected.append(analysis)
+    return selected
+
+
+def compute_baseline(
+    baseline,
+    year,
+    checkpoint_dirs=(),
+    resume=False,
+    incremental=False,
+    years=None,
+    dataset=DATASET,
+):
+    """
+    Simulate one baseline for sharing across the analyses stacked on it.
+
+    Parameters:
+    -----------
+    baseline : callable
+        Baseline reform factory, e.g. current_law_baseline
+    year : int
+        Tax year to analyze
+    checkpoint_dirs : list
+        Run directories of the analyses stacked on this baseline
+    resume, incremental : bool
+        Reuse a snapshot saved in one of checkpoint_dirs if its baseline,
+        year and dataset are unchanged
+    years : list, optional
+        Calculate these years, instead of year, from one simulation
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+
+    Returns:
+    --------
+    BaselineSnapshot or dict
+        Baseline values for year, or years to baseline values
+    """
+    if resume or incremental:
+        fingerprint = baseline_fingerprint(baseline(), dataset, year)
+        for checkpoint_dir in checkpoint_dirs:
+            snapshot = RunCheckpoint(checkpoint_dir).load_baseline(fingerprint)
+            if snapshot is not None:
+                print(f"Loaded {baseline.__name__} baseline from {checkpoint_dir}")
+                return snapshot
+
+    print(f"Calculating {baseline.__name__} baseline...")
+    with stage("baseline", baseline=baseline.__name__):
+        if years:
+            return calculate_baseline_snapshots(baseline(), years, dataset)
+        return calculate_baseline_snapshot(baseline(), year, dataset)
+
+
+def run_analysis(
+    analysis,
+    year,
+    baseline=None,
+    cache=None,
+    checkpoint_dir=None,
+    resume=False,
+    incremental=False,
+    stream_dir=None,
+    change_dtype="float64",
+    reform_names=None,
+    through=None,
+    shapley_permutations=None,
+    shapley_seed=0,
+    shards=1,
+    shard_dir=None,
+    years=None,
+    dataset=DATASET,
+):
+    """
+    Run one baseline × package analysis.
+
+    Parameters:
+    -----------
+    analysis : dict
+        Entry of ANALYSES
+    year : int
+        Tax year to analyze
+    baseline : BaselineSnapshot, optional
+        Precomputed snapshot of the analysis baseline
+    cache : SimulationCache, optional
+        On-disk cache of per-step simulation outputs
+    checkpoint_dir : str, optional
+        Run directory in which every completed reform step is checkpointed
+    resume : bool
+        Continue from the last reform completed in checkpoint_dir
+    incremental : bool
+        Reuse the steps in checkpoint_dir before the first changed reform
+    stream_dir : str, optional
+        Directory to stream result columns to as they are computed
+    change_dtype : str
+        Dtype of the change columns, float64 or float32
+    reform_names : list, optional
+        Only stack the reforms of the package with these names
+    through : str, optional
+        Only stack the package up to and including this reform
+    shapley_permutations : int, optional
+        Attribute impacts by Shapley values sampled over this many reform
+        orders instead of by stacking order
+    shapley_seed : int
+        Seed of the Shapley reform orders
+    shards : int
+        Run the stack on this many household shards in parallel processes
+    shard_dir : str, optional
+        Directory to write the dataset shards to. Temporary if not given.
+    years : list, optional
+        Analyze these years, instead of year, in one long result set, with
+        baseline the snapshots of every year
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+
+    Returns:
+    --------
+    pd.DataFrame, ColumnSink or ShapleyAttribution
+        Household impacts, in a ColumnSink if stream_dir was given, or
+        Shapley attributions if shapley_permutations was
+    """
+    reforms = select_reforms(analysis["reforms"](), reform_names, through)
+    if not reforms:
+        raise ValueError(f"No reforms of {analysis['title']} selected")
+    baseline_reform = analysis["baseline"]()
+
+    print(f"Analyzing {analysis['title']} ({len(reforms)} reform components):")
     for i, reform_name in enumerate(reforms.keys(), 1):
         print(f"  {i}. {reform_name}")
     print()
 
-    # Calculate household-level impacts with TCJA baseline
-    df_tcja = calculate_stacked_household_impacts(
-        reforms=reforms, baseline_reform=tcja_baseline_reform, year=2026
-    )
+    if shapley_permutations:
+        with stage("shapley", analysis=analysis["output_name"]):
+            return calculate_shapley_household_impacts(
+                reforms=reforms,
+                baseline_reform=baseline_reform,
+                year=year,
+                n_permutations=shapley_permutations,
+                seed=shapley_seed,
+                baseline=baseline,
+                dataset=dataset,
+                cache=cache,
+            )
 
-    # Save TCJA baseline results
-    output_file_tcja = "household_tax_income_changes_tcja_baseline.csv"
-    df_tcja.to_csv(output_file_tcja, index=False)
-    print(f"\nSaved TCJA baseline results to '{output_file_tcja}'")
-    print(f"Total households analyzed: {len(df_tcja):,}")
+    if years:
+        with stage("analysis", analysis=analysis["output_name"], years=years):
+            return calculate_multi_year_household_impacts(
+                reforms=reforms,
+                baseline_reform=baseline_reform,
+                years=years,
+                baselines=baseline,
+                dataset=dataset,
+                cache=cache,
+                change_dtype=change_dtype,
+            )
 
-    # Display sample results
-    print(f"\nFirst 5 rows of TCJA baseline results:")
-    print(df_tcja.head())
+    if shards > 1:
+        with stage("analysis", analysis=analysis["output_name"], shards=shards):
+            return calculate_sharded_household_impacts(
+                reforms=reforms,
+                baseline_reform=baseline_reform,
+                year=year,
+                n_shards=shards,
+                shard_dir=shard_dir,
+                dataset=dataset,
+                cache=cache,
+                change_dtype=change_dtype,
+            )
 
-    # Senate Finance analysis with TCJA baseline
-    print("\n" + "=" * 40)
-    print("Senate Finance Tax Reform Impact Analysis (TCJA Baseline)")
-    print("=" * 40)
-    print(f"Analyzing {len(senate_reforms)} Senate reform components:")
-    for i, reform_name in enumerate(senate_reforms.keys(), 1):
-        print(f"  {i}. {reform_name}")
-    print()
-    df_senate_tcja = calculate_stacked_household_impacts(
-        reforms=senate_reforms, baseline_reform=tcja_baseline_reform, year=2026
+    with stage("analysis", analysis=analysis["output_name"]):
+        return calculate_stacked_household_impacts(
+            reforms=reforms,
+            baseline_reform=baseline_reform,
+            year=year,
+            baseline=baseline,
+            dataset=dataset,
+            cache=cache,
+            checkpoint_dir=checkpoint_dir,
+            resume=resume,
+            incremental=incremental,
+            sink=ColumnSink(stream_dir) if stream_dir else None,
+            change_dtype=change_dtype,
+        )
+
+
+def main(
+    year=YEAR,
+    baselines=None,
+    packages=None,
+    reform_names=None,
+    through=None,
+    output_dir=".",
+    workers=1,
+    cache_dir=None,
+    cache_max_bytes=DEFAULT_MAX_BYTES,
+    run_dir=None,
+    resume=False,
+    incremental=False,
+    formats=("csv",),
+    stream_dir=None,
+    change_dtype="float64",
+    samples_dir=None,
+    summary_formats=(),
+    partition_by_state=False,
+    report_path="run_report.json",
+    shapley_permutations=None,
+    shapley_seed=0,
+    shards=1,
+    shard_dir=None,
+    years=None,
+    dataset=DATASET,
+    households=None,
+    states=None,
+    fraction=None,
+    subset_seed=0,
+    subset_dir=None,
+):
+    """
+    Run the selected analyses and save one spreadsheet per analysis.
+
+    Parameters:
+    -----------
+    year : int
+        Tax year to analyze
+    baselines : list, optional
+        Baselines to run, from reforms.BASELINES. All if not given.
+    packages : list, optional
+        Reform packages to run, from reforms.PACKAGES. All if not given.
+    reform_names : list, optional
+        Only stack the reforms with these names, from any selected package
+    through : str, optional
+        Only stack each package up to and including the reform of this name
+    output_dir : str
+        Directory to write the results and run report to
+    workers : int
+        Number of analyses to run concurrently in separate processes.
+        1 runs them one after another in this process.
+    cache_dir : str, optional
+        Directory of the per-step simulation cache. No caching if not given.
+    cache_max_bytes : int
+        Size above which least recently used cache entries are evicted
+    run_dir : str, optional
+        Directory in which each analysis checkpoints its completed reforms
+    resume : bool
+        Continue the analyses checkpointed in run_dir instead of starting over
+    incremental : bool
+        Reuse the reform steps checkpointed in run_dir up to the first reform
+        whose parameters changed since, and re-simulate only from there
+    formats : list
+        Output formats to write, from output.FORMATS. CSV is what the web
+        app reads.
+    stream_dir : str, optional
+        Directory to stream result columns to as they are computed, bounding
+        memory by one reform step instead of the whole run
+    change_dtype : str
+        Dtype of the change and percentage change columns. float32 halves
+        their memory, at about seven significant digits.
+    samples_dir : str, optional
+        Directory to write the web app's sample tiers of every result set
+        to, e.g. samples.SAMPLES_DIR
+    summary_formats : list
+        Formats, from summary.SUMMARY_FORMATS, to write the weighted
+        distributional summary of every result set in
+    partition_by_state : bool
+        Also write every result set as one file per state, with a manifest
+    report_path : str, optional
+        Path of the JSON report of the time and memory each stage and reform
+        step took, relative to output_dir. No report if None.
+    shapley_permutations : int, optional
+        Write Shapley attributions sampled over this many reform orders,
+        with convergence diagnostics, instead of stacked results
+    shapley_seed : int
+        Seed of the Shapley reform orders
+    shards : int
+        Run each reform stack on this many household shards in parallel
+        processes, each simulating its own baseline. Results are the same.
+    shard_dir : str, optional
+        Directory to write the dataset shards to. Temporary if not given.
+    years : list, optional
+        Analyze these years instead of year. Every simulation calculates all
+        of them, and each result set holds the rows of every year, with a
+        Year column.
+    dataset : str or SyntheticDataset
+        Dataset to simulate, e.g. from datasets.dataset_from_spec
+    households : list, optional
+        Only simulate the households with these IDs
+    states : list, optional
+        Only simulate the households of these states, e.g. ["CA", "NY"]
+    fraction : float, optional
+        Only simulate this share of the households, chosen at random, e.g.
+        0.01. Combined with household_ids or states, a share of those.
+    subset_seed : int
+        Seed of the random fraction
+    subset_dir : str, optional
+        Directory to write the subset dataset to. Temporary if not given.
+
+    Subset runs write each result set as <output name>_subset, next to the
+    full one, with the full one's columns if it exists, and the run report
+    as <report name>_subset.
+    """
+    if (resume or incremental) and run_dir is None:
+        raise ValueError("Resuming or incremental runs require a run_dir")
+    if years and (
+        run_dir
+        or stream_dir
+        or shapley_permutations
+        or shards > 1
+        or samples_dir
+        or summary_formats
+    ):
+        raise ValueError(
+            "Multi-year runs cannot be checkpointed, streamed, attributed by "
+            "Shapley values, sharded, sampled or summarized"
+        )
+    analyses = select_analyses(baselines, packages)
+    if not analyses:
+        raise ValueError(f"No analyses for baselines {baselines}, packages {packages}")
+    analyses = select_reform_analyses(analyses, reform_names, through)
+    subset = households is not None or states is not None or fraction is not None
+    if subset:
+        rows = select_households(dataset, households, states, fraction, subset_seed)
+        n_households = len(household_ids(dataset))
+        dataset = subset_dataset(
+            dataset,
+            rows,
+            subset_dir or os.path.join(tempfile.gettempdir(), "household_subsets"),
+        )
+    os.makedirs(output_dir, exist_ok=True)
+    cache = SimulationCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+    started = datetime.now()
+    print(f"Tax Reform Impact Analysis")
+    print(f"========================")
+    if years:
+        print(f"Analysis years: {', '.join(map(str, years))}")
+    else:
+        print(f"Analysis year: {year}")
+    if dataset is DATASET:
+        print(f"Dataset: Enhanced CPS 2024")
+    else:
+        print(f"Dataset: {dataset}")
+    if subset:
+        print(f"Subset: {len(rows):,} of {n_households:,} households")
+    print(f"Workers: {workers}")
+    print(f"Starting analysis at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+    # Each baseline is simulated once and shared by the packages stacked on
+    # it, except in sharded runs, where every shard simulates its own
+    baseline_factories = list(
+        dict.fromkeys(analysis["baseline"] for analysis in analyses)
     )
-    senate_output_file_tcja = "household_tax_income_changes_senate_tcja_baseline.csv"
-    df_senate_tcja.to_csv(senate_output_file_tcja, index=False)
-    print(f"\nSaved Senate TCJA baseline results to '{senate_output_file_tcja}'")
-    print(f"Total households analyzed (Senate): {len(df_senate_tcja):,}")
-    print(f"\nFirst 5 rows of Senate TCJA baseline results:")
-    print(df_senate_tcja.head())
+    baseline_jobs = [
+        dict(
+            baseline=baseline,
+            year=year,
+            checkpoint_dirs=[
+                analysis_run_dir(analysis, run_dir)
+                for analysis in analyses
+                if run_dir is not None and analysis["baseline"] is baseline
+            ],
+            resume=resume,
+            incremental=incremental,
+            years=years,
+            dataset=dataset,
+        )
+        for baseline in baseline_factories
+        if shards == 1
+    ]
+
+    def analysis_jobs(snapshots):
+        return [
+            dict(
+                analysis=analysis,
+                year=year,
+                baseline=snapshots.get(analysis["baseline"]),
+                cache=cache,
+                checkpoint_dir=analysis_run_dir(analysis, run_dir),
+                resume=resume,
+                incremental=incremental,
+                stream_dir=(
+                    os.path.join(stream_dir, analysis["output_name"])
+                    if stream_dir
+                    else None
+                ),
+                change_dtype=change_dtype,
+                reform_names=reform_names,
+                through=through,
+                shapley_permutations=shapley_permutations,
+                shapley_seed=shapley_seed,
+                shards=shards,
+                shard_dir=shard_dir,
+                years=years,
+                dataset=dataset,
+            )
+            for analysis in analyses
+        ]
+
+    def write_outputs(analysis, df):
+        print("\n" + "=" * 50)
+        print(analysis["title"])
+        print("=" * 50)
+        output_name = os.path.join(output_dir, analysis["output_name"])
+        if subset:
+            df = match_columns(df, output_name)
+            output_name += "_subset"
+        if isinstance(df, ShapleyAttribution):
+            with stage("write", analysis=output_name, formats=list(formats)):
+                for path in write_shapley(df, output_name, formats):
+                    print(f"Saved Shapley attributions to '{path}'")
+            print(df.diagnostics.to_string(index=False))
+            return
+        with stage("write", analysis=output_name, formats=list(formats)):
+            for path in write_results(df, output_name, formats):
+                print(f"Saved results to '{path}'")
+        write_derived_outputs(
+            df, output_name, formats, samples_dir, summary_formats, partition_by_state
+        )
+        print(f"Total households analyzed: {len(df):,}")
+        print(f"\nFirst 5 rows:")
+        print(df.head())
+
+    def finish(analysis, output):
+        # Each result set is written as soon as its analysis finishes, so a
+        # later analysis failing does not lose it
+        result, analysis_records = output
+        _, write_records = collect(write_outputs, analysis, result)
+        records.extend(analysis_records + write_records)
+
+    records = []
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(collect, compute_baseline, **job)
+                for job in baseline_jobs
+            ]
+            baseline_outputs = [future.result() for future in futures]
+            snapshots = dict(
+                zip(baseline_factories, (output for output, _ in baseline_outputs))
+            )
+            for _, baseline_records in baseline_outputs:
+                records.extend(baseline_records)
+            futures = {
+                executor.submit(collect, run_analysis, **job): job["analysis"]
+                for job in analysis_jobs(snapshots)
+            }
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+    else:
+        snapshots = {}
+        for baseline, job in zip(baseline_factories, baseline_jobs):
+            snapshots[baseline], baseline_records = collect(compute_baseline, **job)
+            records.extend(baseline_records)
+        for job in analysis_jobs(snapshots):
+            finish(job["analysis"], collect(run_analysis, **job))
 
     print(f"\n" + "=" * 50)
     print("SUMMARY")
     print("=" * 50)
-    print(f"Generated 4 spreadsheets:")
-    # print(f"  1. {output_file_current_law} - House reforms vs Current Law baseline")
-    print(
-        f"  2. {senate_output_file_current_law} - Senate reforms vs Current Law baseline"
-    )
-    # print(f"  3. {output_file_tcja} - House reforms vs TCJA baseline")
-    print(f"  4. {senate_output_file_tcja} - Senate reforms vs TCJA baseline")
+    print(f"Generated {len(analyses)} result sets ({', '.join(formats)}):")
+    for i, analysis in enumerate(analyses, 1):
+        print(f"  {i}. {analysis['output_name']} - {analysis['title']}")
+    if report_path:
+        report_path = os.path.join(output_dir, report_path)
+        if subset:
+            root, extension = os.path.splitext(report_path)
+            report_path = f"{root}_subset{extension}"
+        write_run_report(
+            report_path,
+            records,
+            started,
+            year=year,
+            years=years,
+            dataset=str(dataset),
+            workers=workers,
+            formats=list(formats),
+            analyses=[analysis["output_name"] for analysis in analyses],
+        )
+        print(f"\nSaved run report to '{report_path}'")
     print(f"\nAnalysis completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=YEAR,
+        help=f"Tax year to analyze (default: {YEAR})",
+    )
+    parser.add_argument(
+        "--years",
+        nargs="+",
+        type=parse_years,
+        metavar="YEAR",
+        help="Analyze several years, e.g. 2026-2035 or 2026 2030, into one "
+        "long result set with a Year column, instead of --year",
+    )
+    parser.add_argument(
+        "--baselines",
+        nargs="+",
+        choices=BASELINES,
+        help="Baselines to run (default: all)",
+    )
+    parser.add_argument(
+        "--packages",
+        nargs="+",
+        choices=PACKAGES,
+        help="Reform packages to run (default: all)",
+    )
+    reform_selection = parser.add_mutually_exclusive_group()
+    reform_selection.add_argument(
+        "--reforms",
+        nargs="+",
+        metavar="NAME",
+        help="Only stack the reforms with these names, in package order",
+    )
+    reform_selection.add_argument(
+        "--through",
+        metavar="NAME",
+        help="Only stack each package up to and including this reform",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory to write results to (default: current directory)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of analyses to run in parallel processes (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse per-step simulation outputs stored in this directory",
+    )
+    parser.add_argument(
+        "--cache-max-gb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 1024**3,
+        help="Evict least recently used cache entries above this size",
+    )
+    parser.add_argument(
+        "--run-dir",
+        help="Checkpoint every completed reform step in this directory",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run checkpointed in --run-dir after its last completed reform",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the reform steps in --run-dir before the first reform whose "
+        "parameters changed, and re-simulate only from there",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=FORMATS,
+        default=["csv"],
+        help="Output formats to write (default: csv)",
+    )
+    parser.add_argument(
+        "--stream-dir",
+        help="Stream result columns to this directory instead of holding them in memory",
+    )
+    parser.add_argument(
+        "--change-dtype",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Dtype of the change columns; float32 halves their memory (default: float64)",
+    )
+    parser.add_argument(
+        "--samples-dir",
+        nargs="?",
+        const=SAMPLES_DIR,
+        help="Write sample tiers of each result set for the web app's loader "
+        f"(default directory: {os.path.relpath(SAMPLES_DIR)})",
+    )
+    parser.add_argument(
+        "--summary-formats",
+        nargs="+",
+        choices=SUMMARY_FORMATS,
+        default=[],
+        help="Also write weighted summary tables per reform step in these formats",
+    )
+    parser.add_argument(
+        "--partition-by-state",
+        action="store_true",
+        help="Also write each result set as one file per state, with a manifest",
+    )
+    parser.add_argument(
+        "--report",
+        default="run_report.json",
+        help="Path of the JSON report of stage and reform step timings and memory "
+        "(default: run_report.json)",
+    )
+    parser.add_argument(
+        "--shapley",
+        type=int,
+        metavar="PERMUTATIONS",
+        help="Attribute impacts by Shapley values sampled over this many "
+        "reform orders, instead of by stacking order",
+    )
+    parser.add_argument(
+        "--shapley-seed",
+        type=int,
+        default=0,
+        help="Seed of the sampled Shapley reform orders (default: 0)",
+    )
+    parser.add_argument(
+        "--list-reforms",
+        action="store_true",
+        help="List the reforms of the selected packages and the parameters they "
+        "change, then exit",
+    )
+    parser.add_argument(
+        "--from-results",
+        action="store_true",
+        help="Write samples, summaries and state partitions from the result sets "
+        "already in --output-dir instead of simulating",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Run each reform stack on this many household shards in parallel "
+        "processes (default: 1, unsharded)",
+    )
+    parser.add_argument(
+        "--shard-dir",
+        help="Directory to write dataset shards to (default: a temporary directory)",
+    )
+    parser.add_argument(
+        "--dataset",
+        help="Dataset to simulate: a path or URL of an h5 file, or "
+        "synthetic:HOUSEHOLDS[:SEED] (default: Enhanced CPS 2024)",
+    )
+    parser.add_argument(
+        "--households",
+        nargs="+",
+        type=int,
+        metavar="ID",
+        help="Only simulate the households with these IDs, writing "
+        "<output name>_subset result sets",
+    )
+    parser.add_argument(
+        "--states",
+        nargs="+",
+        choices=STATE_FIPS,
+        metavar="STATE",
+        help="Only simulate the households of these states, e.g. CA NY",
+    )
+    parser.add_argument(
+        "--fraction",
+        type=float,
+        help="Only simulate this share of the households, chosen at random, "
+        "e.g. 0.01",
+    )
+    parser.add_argument(
+        "--subset-seed",
+        type=int,
+        default=0,
+        help="Seed of the random --fraction (default: 0)",
+    )
+    parser.add_argument(
+        "--subset-dir",
+        help="Directory to write the subset dataset to "
+        "(default: a temporary directory)",
+    )
+    args = parser.parse_args()
+    if args.list_reforms:
+        list_reforms(args.packages)
+        parser.exit()
+    if args.from_results:
+        postprocess_results(
+            baselines=args.baselines,
+            packages=args.packages,
+            output_dir=args.output_dir,
+            formats=args.formats,
+            samples_dir=args.samples_dir,
+            summary_formats=args.summary_formats,
+            partition_by_state=args.partition_by_state,
+        )
+        parser.exit()
+    if args.resume and args.run_dir is None:
+        parser.error("--resume requires --run-dir")
+    if args.incremental and args.run_dir is None:
+        parser.error("--incremental requires --run-dir")
+    if args.shapley is not None and args.shapley < 1:
+        parser.error("--shapley needs at least 1 permutation")
+    if args.shards > 1 and (args.run_dir or args.stream_dir or args.shapley):
+        parser.error(
+            "--shards cannot be combined with --run-dir, --stream-dir or --shapley"
+        )
+    years = sorted({year for years in args.years or [] for year in years})
+    if years and (
+        args.run_dir
+        or args.stream_dir
+        or args.shapley
+        or args.shards > 1
+        or args.samples_dir
+        or args.summary_formats
+    ):
+        parser.error(
+            "--years cannot be combined with --run-dir, --stream-dir, --shapley, "
+            "--shards, --samples-dir or --summary-formats"
+        )
+    main(
+        year=args.year,
+        baselines=args.baselines,
+        packages=args.packages,
+        reform_names=args.reforms,
+        through=args.through,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=int(args.cache_max_gb * 1024**3),
+        run_dir=args.run_dir,
+        resume=args.resume,
+        incremental=args.incremental,
+        formats=args.formats,
+        stream_dir=args.stream_dir,
+        change_dtype=args.change_dtype,
+        samples_dir=args.samples_dir,
+        summary_formats=args.summary_formats,
+        partition_by_state=args.partition_by_state,
+        report_path=args.report,
+        shapley_permutations=args.shapley,
+        shapley_seed=args.shapley_seed,
+        shards=args.shards,
+        shard_dir=args.shard_dir,
+        years=years or None,
+        dataset=dataset_from_spec(args.dataset) if args.dataset else DATASET,
+        households=args.households,
+        states=args.states,
+        fraction=args.fraction,
+        subset_seed=args.subset_seed,
+        subset_dir=args.subset_dir,
+    )
@@ -0,0 +1,370 @@
+"""
+Writers for household results in CSV and typed columnar formats.
+
+CSV stays the format the web app reads. Parquet and Feather (Arrow IPC)
+files are written with a declared schema, so dtypes survive a round trip:
+monetary change columns are float32, IDs and Year are integers, State is
+dictionary-encoded, Is Married is boolean and missing ages are nulls in
+integer columns.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Output format -> file extension
+FORMATS = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
+COUNT_COLUMNS = [
+    "Household Size",
+    "Number of Tax Units",
+    "Number of Dependents",
+    "Num with SSN Card (Citizen/EAD)",
+    "Num with SSN Card (Other/None)",
+]
+
+
+# Rows per chunk when assembling files from a ColumnSink
+CHUNK_ROWS = 100_000
+
+
+class ColumnSink:
+    """
+    Write-through store of result columns, one .npy file per column.
+
+    Used in place of the in-memory results dict of
+    calculate_stacked_household_impacts: every column is flushed to disk as
+    soon as it is assigned, and read back memory-mapped, so a run only holds
+    the columns of its current step in memory. Files are then assembled from
+    row chunks by write_results.
+
+    Parameters:
+    -----------
+    directory : str
+        Directory for the column files. Columns from a previous sink in the
+        same directory are deleted.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.columns = []
+        self.n_rows = 0
+        self._files = {}
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".npy") or name == self.MANIFEST:
+                os.remove(os.path.join(directory, name))
+
+    @classmethod
+    def open(cls, directory):
+        """Reopen a sink written earlier from its manifest."""
+        sink = cls.__new__(cls)
+        sink.directory = directory
+        with open(os.path.join(directory, cls.MANIFEST)) as f:
+            manifest = json.load(f)
+        sink.n_rows = manifest["n_rows"]
+        sink.columns = [column["name"] for column in manifest["columns"]]
+        sink._files = {column["name"]: column["file"] for column in manifest["columns"]}
+        return sink
+
+    def __setitem__(self, column, values):
+        values = np.asarray(values)
+        if values.dtype == object:
+            # Strings such as State codes are stored without pickling
+            values = values.astype(str)
+        if self.columns and len(values) != self.n_rows:
+            raise ValueError(
+                f"Column '{column}' has {len(values)} rows, expected {self.n_rows}"
+            )
+        if column not in self._files:
+            self._files[column] = f"{len(self.columns):04d}.npy"
+            self.columns.append(column)
+        self.n_rows = len(values)
+        np.save(os.path.join(self.directory, self._files[column]), values)
+        with open(os.path.join(self.directory, self.MANIFEST), "w") as f:
+            json.dump(
+                {
+                    "n_rows": self.n_rows,
+                    "columns": [
+                        {"name": name, "file": self._files[name]}
+                        for name in self.columns
+                    ],
+                },
+                f,
+            )
+
+    def __getitem__(self, column):
+        return np.load(os.path.join(self.directory, self._files[column]), mmap_mode="r")
+
+    def __len__(self):
+        return self.n_rows
+
+    def read(self, start=0, stop=None):
+        """Load rows start:stop of every column into a DataFrame."""
+        return pd.DataFrame(
+            {column: np.array(self[column][start:stop]) for column in self.columns}
+        )
+
+    def head(self, n=5):
+        return self.read(0, n)
+
+    def chunks(self, chunk_rows=CHUNK_ROWS):
+        """Yield the rows as consecutive DataFrames of at most chunk_rows."""
+        for start in range(0, max(self.n_rows, 1), chunk_rows):
+            yield self.read(start, start + chunk_rows)
+
+
+def _is_integral(values):
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return bool(np.all(values == np.round(values)))
+
+
+def results_schema(df):
+    """
+    Declare the Arrow schema of a results DataFrame.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+
+    Returns:
+    --------
+    pa.Schema
+        Field type for every column of df
+    """
+    import pyarrow as pa
+
+    fields = []
+    for column in df.columns:
+        if column.endswith(" ID"):
+            # Household, person and other entity IDs
+            field_type = pa.int64()
+        elif column == "Year":
+            field_type = pa.int16()
+        elif column == "State":
+            field_type = pa.dictionary(pa.int8(), pa.string())
+        elif column == "Is Married":
+            field_type = pa.bool_()
+        elif column.startswith("Age of"):
+            # Ages are whole years; anything else keeps its fractions
+            field_type = pa.int16() if _is_integral(df[column]) else pa.float32()
+        elif column in COUNT_COLUMNS:
+            field_type = pa.int32()
+        elif column.startswith(("Change in", "Total change in")):
+            field_type = pa.float32()
+        else:
+            field_type = pa.float64()
+        fields.append(pa.field(column, field_type))
+    return pa.schema(fields)
+
+
+def _dictionaries(results, schema):
+    """Sorted values of every dictionary-encoded column, across all rows."""
+    import pyarrow as pa
+
+    return {
+        field.name: np.unique(np.asarray(results[field.name]).astype(str))
+        for field in schema
+        if pa.types.is_dictionary(field.type)
+    }
+
+
+def to_arrow(df, schema=None, dictionaries=None):
+    """
+    Convert a results DataFrame to an Arrow table with results_schema.
+
+    dictionaries gives the values of dictionary-encoded columns; pass the
+    same ones for every chunk of a file, as Arrow IPC files allow only one
+    dictionary per column.
+    """
+    import pyarrow as pa
+
+    if schema is None:
+        schema = results_schema(df)
+    if dictionaries is None:
+        dictionaries = _dictionaries(df, schema)
+    columns = []
+    for field in schema:
+        values = df[field.name]
+        if pa.types.is_dictionary(field.type):
+            dictionary = dictionaries[field.name]
+            indices = np.searchsorted(dictionary, np.asarray(values).astype(str))
+            array = pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=field.type.index_type),
+                pa.array(dictionary, type=field.type.value_type),
+            )
+        elif pa.types.is_integer(field.type):
+            # Missing values (NaN ages) become nulls
+            array = pa.array(values, from_pandas=True).cast(field.type)
+        else:
+            array = pa.array(values, type=field.type, from_pandas=True)
+        columns.append(array)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_results(results, output_name, formats=("csv",), schema=None):
+    """
+    Write household results in one or more formats.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts. Results
+        in a ColumnSink are written in row chunks.
+    output_name : str
+        Output path without extension
+    formats : list
+        Names from FORMATS to write
+    schema : tuple, optional
+        (schema, dictionaries) to write typed formats with, so that parts of
+        one result set share a schema. Derived from results if not given.
+
+    Returns:
+    --------
+    list
+        Paths of the written files
+    """
+
+    def chunks():
+        if isinstance(results, ColumnSink):
+            return results.chunks()
+        return [results]
+
+    paths = []
+    for output_format in formats:
+        path = output_name + FORMATS[output_format]
+        if output_format == "csv":
+            for i, chunk in enumerate(chunks()):
+                chunk.to_csv(path, mode="a" if i else "w", header=not i, index=False)
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError(
+                    f"Writing {output_format} requires pyarrow: pip install pyarrow"
+                )
+            if schema is None:
+                arrow_schema = results_schema(results)
+                schema = (arrow_schema, _dictionaries(results, arrow_schema))
+            arrow_schema, dictionaries = schema
+            if output_format == "parquet":
+                writer = pq.ParquetWriter(path, arrow_schema, compression="zstd")
+            else:
+                writer = pa.ipc.new_file(
+                    path,
+                    arrow_schema,
+                    options=pa.ipc.IpcWriteOptions(compression="zstd"),
+                )
+            with writer:
+                for chunk in chunks():
+                    writer.write_table(to_arrow(chunk, arrow_schema, dictionaries))
+        paths.append(path)
+    return paths
+
+
+def read_results(output_name, formats=FORMATS):
+    """
+    Read household results written by write_results.
+
+    Parameters:
+    -----------
+    output_name : str
+        Output path without extension
+    formats : list
+        Names from FORMATS to look for, in order of preference
+
+    Returns:
+    --------
+    pd.DataFrame
+        Results from the first format found
+    """
+    for output_format in formats:
+        path = output_name + FORMATS[output_format]
+        if not os.path.exists(path):
+            continue
+        if output_format == "csv":
+            return pd.read_csv(path)
+        if output_format == "parquet":
+            return pd.read_parquet(path)
+        return pd.read_feather(path)
+    raise FileNotFoundError(f"No results found at '{output_name}' in {list(formats)}")
+
+
+def state_partitions(states):
+    """
+    Group rows by state with one stable sort.
+
+    Returns:
+    --------
+    dict
+        State codes, in sorted order, to their row positions in original order
+    """
+    states = np.asarray(states).astype(str)
+    order = np.argsort(states, kind="stable")
+    codes, starts = np.unique(states[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    return {code: order[start:end] for code, start, end in zip(codes, starts, ends)}
+
+
+def write_state_partitions(results, output_name, formats=("csv",)):
+    """
+    Write household results as one file per state, plus a manifest.
+
+    Files go to the directory <output_name>_by_state, named by state code,
+    e.g. CA.csv. manifest.json there lists the row count and file sizes of
+    every state, so a client can fetch only the states it needs.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+    output_name : str
+        Output path of the results, without extension
+    formats : list
+        Names from FORMATS to write
+
+    Returns:
+    --------
+    str
+        Path of the manifest
+    """
+    directory = output_name + "_by_state"
+    os.makedirs(directory, exist_ok=True)
+
+    schema = None
+    if any(output_format != "csv" for output_format in formats):
+        # One schema for all states, so the files read back as one dataset
+        arrow_schema = results_schema(results)
+        schema = (arrow_schema, _dictionaries(results, arrow_schema))
+
+    manifest = {"columns": list(results.columns), "rows": len(results), "states": {}}
+    for state, rows in state_partitions(results["State"]).items():
+        if isinstance(results, ColumnSink):
+            part = pd.DataFrame(
+                {column: results[column][rows] for column in results.columns}
+            )
+        else:
+            part = results.iloc[rows]
+        paths = write_results(part, os.path.join(directory, state), formats, schema)
+        manifest["states"][state] = {
+            "rows": len(rows),
+            "files": {
+                output_format: {
+                    "path": os.path.basename(path),
+                    "bytes": os.path.getsize(path),
+                }
+                for output_format, path in zip(formats, paths)
+            },
+        }
+
+    path = os.path.join(directory, "manifest.json")
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return path
@@ -1,5 +1,69 @@
+from collections.abc import Mapping
+from datetime import date, timedelta
+from functools import wraps
+
 import numpy as np
-from policyengine_core.reforms import Reform
+
+from engine import reform_class
+
+
+def reform_factory(parameters):
+    """
+    Turn a function returning a Reform.from_dict parameter dictionary into a
+    reform factory.
+
+    Calling the factory builds the Reform. The dictionary itself stays
+    available, without building anything, as factory.parameters().
+    """
+
+    @wraps(parameters)
+    def factory():
+        return reform_class().from_dict(parameters(), country_id="us")
+
+    factory.parameters = parameters
+    return factory
+
+
+class ReformRegistry(Mapping):
+    """
+    Reform names to Reforms, built from their factories on first access.
+
+    Iterating, listing names and reading parameter dictionaries build
+    nothing, so selecting part of a package only pays for the reforms that
+    run. Built reforms are cached, but not pickled: a registry sent to a
+    worker process rebuilds what it uses there.
+
+    Parameters:
+    -----------
+    factories : dict
+        Reform names, in stacking order, to reform factories
+    """
+
+    def __init__(self, factories):
+        self.factories = dict(factories)
+        self._reforms = {}
+
+    def __getitem__(self, name):
+        if name not in self._reforms:
+            self._reforms[name] = self.factories[name]()
+        return self._reforms[name]
+
+    def __iter__(self):
+        return iter(self.factories)
+
+    def __len__(self):
+        return len(self.factories)
+
+    def __getstate__(self):
+        return {**self.__dict__, "_reforms": {}}
+
+    def parameters(self, name):
+        """Parameter dictionary of a reform, without building it."""
+        return self.factories[name].parameters()
+
+    def parameter_paths(self, name):
+        """Paths of the parameters a reform changes."""
+        return list(self.parameters(name))
 
 
 def current_law_baseline():
@@ -7,1661 +71,1721 @@ def current_law_baseline():
     Returns a baseline with no reforms (current law).
     This represents the default PolicyEngine US baseline for 2026.
     """
-    return Reform.from_dict({})
+    return reform_class().from_dict({})
 
 
+@reform_factory
 def tcja_reform():
 
-    return Reform.from_dict(
-        {
-            "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
-            "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
-            "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
-            "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
-            "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
-            "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.2},
-            "gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0},
-            "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
-            "gov.irs.deductions.standard.amount.JOINT": {
-                "2026-01-01.2026-12-31": 30300,
-            },
-            "gov.irs.credits.ctc.amount.base[0].amount": {
-                "2026-01-01.2100-12-31": 2000
-            },
-            "gov.irs.deductions.standard.amount.SINGLE": {
-                "2026-01-01.2026-12-31": 15150,
-            },
-            "gov.irs.income.amt.exemption.amount.JOINT": {
-                "2026-01-01.2026-12-31": 139100,
-            },
-            "gov.irs.income.bracket.thresholds.3.JOINT": {
-                "2026-01-01.2026-12-31": 208300,
-            },
-            "gov.irs.income.bracket.thresholds.4.JOINT": {
-                "2026-01-01.2026-12-31": 397650,
-            },
-            "gov.irs.income.bracket.thresholds.5.JOINT": {
-                "2026-01-01.2026-12-31": 512950,
-            },
-            "gov.irs.income.bracket.thresholds.6.JOINT": {
-                "2026-01-01.2026-12-31": 769450,
-            },
-            "gov.irs.credits.ctc.amount.adult_dependent": {
-                "2026-01-01.2100-12-31": 500
-            },
-            "gov.irs.income.amt.exemption.amount.SINGLE": {
-                "2026-01-01.2026-12-31": 89400,
-            },
-            "gov.irs.income.bracket.thresholds.3.SINGLE": {
-                "2026-01-01.2026-12-31": 104900,
-            },
-            "gov.irs.income.bracket.thresholds.4.SINGLE": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.SINGLE": {
-                "2026-01-01.2026-12-31": 256450,
-            },
-            "gov.irs.income.bracket.thresholds.6.SINGLE": {
-                "2026-01-01.2026-12-31": 641200,
-            },
-            "gov.irs.deductions.itemized.casualty.active": {
-                "2026-01-01.2100-12-31": False
-            },
-            "gov.irs.deductions.standard.amount.SEPARATE": {
-                "2026-01-01.2026-12-31": 15150,
-            },
-            "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {
-                "2026-01-01.2100-12-31": 0.25
-            },
-            "gov.irs.deductions.qbi.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 409800,
-            },
-            "gov.irs.income.amt.exemption.amount.SEPARATE": {
-                "2026-01-01.2026-12-31": 69500,
-            },
-            "gov.irs.income.bracket.thresholds.3.SEPARATE": {
-                "2026-01-01.2026-12-31": 104900,
-            },
-            "gov.irs.income.bracket.thresholds.4.SEPARATE": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.SEPARATE": {
-                "2026-01-01.2026-12-31": 256450,
-            },
-            "gov.irs.income.bracket.thresholds.6.SEPARATE": {
-                "2026-01-01.2026-12-31": 384700,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.credits.ctc.refundable.individual_max": {
-                "2026-01-01.2026-12-31": 1800,
-            },
-            "gov.irs.deductions.qbi.phase_out.length.JOINT": {
-                "2026-01-01.2100-12-31": 100000
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 204900,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SINGLE": {
-                "2026-01-01.2100-12-31": 50000
-            },
-            "gov.irs.deductions.itemized.charity.ceiling.all": {
-                "2026-01-01.2100-12-31": 0.6
-            },
-            "gov.irs.deductions.itemized.limitation.agi_rate": {
-                "2026-01-01.2100-12-31": np.inf
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 204900,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SEPARATE": {
-                "2026-01-01.2100-12-31": 50000
-            },
-            "gov.irs.credits.ctc.refundable.phase_in.threshold": {
-                "2026-01-01.2100-12-31": 2500
-            },
-            "gov.irs.deductions.qbi.max.business_property.rate": {
-                "2026-01-01.2100-12-31": 0.025
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 1271900,
-            },
-            "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 30300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 635900,
-            },
-            "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 22700,
-            },
-            "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 139100,
-            },
-            "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 208300,
-            },
-            "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 397650,
-            },
-            "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 512950,
-            },
-            "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 769450,
-            },
-            "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 89400,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 635900,
-            },
-            "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 104900,
-            },
-            "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 256486,
-            },
-            "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 641200,
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 409800,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 100000
-            },
-            "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 204900,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.deductions.qbi.phase_out.length.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 50000
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
-                "2026-01-01.2100-12-31": 10000
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
-                "2026-01-01.2100-12-31": 10000
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
-                "2026-01-01.2100-12-31": 5000
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 1271900,
-            },
-            "gov.irs.deductions.itemized.reduction.applies": {
-                "2026-01-01.2100-12-31": False
-            },
-            "gov.irs.deductions.itemized.reduction.agi_threshold.SINGLE": {
-                "2026-01-01.2100-12-31": 0
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 635900,
-            },
-            "gov.irs.deductions.itemized.reduction.agi_threshold.JOINT": {
-                "2026-01-01.2100-12-31": 0
-            },
-            "gov.irs.deductions.itemized.reduction.agi_threshold.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 0
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 10_000
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 10_000
-            },
-            "gov.irs.deductions.itemized.reduction.agi_threshold.SEPARATE": {
-                "2026-01-01.2100-12-31": 0
-            },
-            "gov.irs.deductions.itemized.reduction.agi_threshold.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 0
-            },
-            "gov.irs.credits.estate.base": {
-                "2026-01-01.2026-12-31": 14200000,
-            },
-            "gov.irs.income.amt.exemption.separate_limit": {
-                "2026-01-01.2026-12-31": 913900,
-            },
-            "gov.irs.deductions.itemized.misc.applies": {
-                "2026-01-01.2100-12-31": False
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.JOINT": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SINGLE": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SEPARATE": {
-                "2026-01-01.2100-12-31": 375000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 750000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
+        "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
+        "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
+        "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
+        "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
+        "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.2},
+        "gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0},
+        "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
+        "gov.irs.deductions.standard.amount.JOINT": {
+            "2026-01-01.2026-12-31": 30300,
+        },
+        "gov.irs.credits.ctc.amount.base[0].amount": {"2026-01-01.2100-12-31": 2000},
+        "gov.irs.deductions.standard.amount.SINGLE": {
+            "2026-01-01.2026-12-31": 15150,
+        },
+        "gov.irs.income.amt.exemption.amount.JOINT": {
+            "2026-01-01.2026-12-31": 139100,
+        },
+        "gov.irs.income.bracket.thresholds.3.JOINT": {
+            "2026-01-01.2026-12-31": 208300,
+        },
+        "gov.irs.income.bracket.thresholds.4.JOINT": {
+            "2026-01-01.2026-12-31": 397650,
+        },
+        "gov.irs.income.bracket.thresholds.5.JOINT": {
+            "2026-01-01.2026-12-31": 512950,
+        },
+        "gov.irs.income.bracket.thresholds.6.JOINT": {
+            "2026-01-01.2026-12-31": 769450,
+        },
+        "gov.irs.credits.ctc.amount.adult_dependent": {"2026-01-01.2100-12-31": 500},
+        "gov.irs.income.amt.exemption.amount.SINGLE": {
+            "2026-01-01.2026-12-31": 89400,
+        },
+        "gov.irs.income.bracket.thresholds.3.SINGLE": {
+            "2026-01-01.2026-12-31": 104900,
+        },
+        "gov.irs.income.bracket.thresholds.4.SINGLE": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.SINGLE": {
+            "2026-01-01.2026-12-31": 256450,
+        },
+        "gov.irs.income.bracket.thresholds.6.SINGLE": {
+            "2026-01-01.2026-12-31": 641200,
+        },
+        "gov.irs.deductions.itemized.casualty.active": {"2026-01-01.2100-12-31": False},
+        "gov.irs.deductions.standard.amount.SEPARATE": {
+            "2026-01-01.2026-12-31": 15150,
+        },
+        "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {"2026-01-01.2100-12-31": 0.25},
+        "gov.irs.deductions.qbi.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 409800,
+        },
+        "gov.irs.income.amt.exemption.amount.SEPARATE": {
+            "2026-01-01.2026-12-31": 69500,
+        },
+        "gov.irs.income.bracket.thresholds.3.SEPARATE": {
+            "2026-01-01.2026-12-31": 104900,
+        },
+        "gov.irs.income.bracket.thresholds.4.SEPARATE": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.SEPARATE": {
+            "2026-01-01.2026-12-31": 256450,
+        },
+        "gov.irs.income.bracket.thresholds.6.SEPARATE": {
+            "2026-01-01.2026-12-31": 384700,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.credits.ctc.refundable.individual_max": {
+            "2026-01-01.2026-12-31": 1800,
+        },
+        "gov.irs.deductions.qbi.phase_out.length.JOINT": {
+            "2026-01-01.2100-12-31": 100000
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 204900,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SINGLE": {
+            "2026-01-01.2100-12-31": 50000
+        },
+        "gov.irs.deductions.itemized.charity.ceiling.all": {
+            "2026-01-01.2100-12-31": 0.6
+        },
+        "gov.irs.deductions.itemized.limitation.agi_rate": {
+            "2026-01-01.2100-12-31": np.inf
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 204900,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SEPARATE": {
+            "2026-01-01.2100-12-31": 50000
+        },
+        "gov.irs.credits.ctc.refundable.phase_in.threshold": {
+            "2026-01-01.2100-12-31": 2500
+        },
+        "gov.irs.deductions.qbi.max.business_property.rate": {
+            "2026-01-01.2100-12-31": 0.025
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 1271900,
+        },
+        "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 30300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 635900,
+        },
+        "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 22700,
+        },
+        "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 139100,
+        },
+        "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 208300,
+        },
+        "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 397650,
+        },
+        "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 512950,
+        },
+        "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 769450,
+        },
+        "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 89400,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 635900,
+        },
+        "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 104900,
+        },
+        "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 256486,
+        },
+        "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 641200,
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 409800,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 100000
+        },
+        "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 204900,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.deductions.qbi.phase_out.length.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 50000
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
+            "2026-01-01.2100-12-31": 10000
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
+            "2026-01-01.2100-12-31": 10000
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
+            "2026-01-01.2100-12-31": 5000
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 1271900,
+        },
+        "gov.irs.deductions.itemized.reduction.applies": {
+            "2026-01-01.2100-12-31": False
+        },
+        "gov.irs.deductions.itemized.reduction.agi_threshold.SINGLE": {
+            "2026-01-01.2100-12-31": 0
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 635900,
+        },
+        "gov.irs.deductions.itemized.reduction.agi_threshold.JOINT": {
+            "2026-01-01.2100-12-31": 0
+        },
+        "gov.irs.deductions.itemized.reduction.agi_threshold.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 0
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 10_000
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 10_000
+        },
+        "gov.irs.deductions.itemized.reduction.agi_threshold.SEPARATE": {
+            "2026-01-01.2100-12-31": 0
+        },
+        "gov.irs.deductions.itemized.reduction.agi_threshold.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 0
+        },
+        "gov.irs.credits.estate.base": {
+            "2026-01-01.2026-12-31": 14200000,
+        },
+        "gov.irs.income.amt.exemption.separate_limit": {
+            "2026-01-01.2026-12-31": 913900,
+        },
+        "gov.irs.deductions.itemized.misc.applies": {"2026-01-01.2100-12-31": False},
+        "gov.irs.deductions.itemized.interest.mortgage.cap.JOINT": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SINGLE": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SEPARATE": {
+            "2026-01-01.2100-12-31": 375000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 750000
+        },
+    }
 
 
+@reform_factory
 def hr1_tax_rate_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
-            "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
-            "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
-            "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
-            "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
-            "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 104900,
-            },
-            "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 256486,
-            },
-            "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 643950,
-            },
-            "gov.irs.income.bracket.thresholds.3.JOINT": {
-                "2026-01-01.2026-12-31": 208300,
-            },
-            "gov.irs.income.bracket.thresholds.4.JOINT": {
-                "2026-01-01.2026-12-31": 397650,
-            },
-            "gov.irs.income.bracket.thresholds.5.JOINT": {
-                "2026-01-01.2026-12-31": 512950,
-            },
-            "gov.irs.income.bracket.thresholds.6.JOINT": {
-                "2026-01-01.2026-12-31": 772750,
-            },
-            "gov.irs.income.bracket.thresholds.3.SEPARATE": {
-                "2026-01-01.2026-12-31": 104900,
-            },
-            "gov.irs.income.bracket.thresholds.4.SEPARATE": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.SEPARATE": {
-                "2026-01-01.2026-12-31": 256450,
-            },
-            "gov.irs.income.bracket.thresholds.6.SEPARATE": {
-                "2026-01-01.2026-12-31": 386350,
-            },
-            "gov.irs.income.bracket.thresholds.3.SINGLE": {
-                "2026-01-01.2026-12-31": 105475,
-            },
-            "gov.irs.income.bracket.thresholds.4.SINGLE": {
-                "2026-01-01.2026-12-31": 198800,
-            },
-            "gov.irs.income.bracket.thresholds.5.SINGLE": {
-                "2026-01-01.2026-12-31": 256450,
-            },
-            "gov.irs.income.bracket.thresholds.6.SINGLE": {
-                "2026-01-01.2026-12-31": 643950,
-            },
-            "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 208300,
-            },
-            "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 397650,
-            },
-            "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 512950,
-            },
-            "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 772750,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
+        "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
+        "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
+        "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
+        "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
+        "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 104900,
+        },
+        "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 256486,
+        },
+        "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 643950,
+        },
+        "gov.irs.income.bracket.thresholds.3.JOINT": {
+            "2026-01-01.2026-12-31": 208300,
+        },
+        "gov.irs.income.bracket.thresholds.4.JOINT": {
+            "2026-01-01.2026-12-31": 397650,
+        },
+        "gov.irs.income.bracket.thresholds.5.JOINT": {
+            "2026-01-01.2026-12-31": 512950,
+        },
+        "gov.irs.income.bracket.thresholds.6.JOINT": {
+            "2026-01-01.2026-12-31": 772750,
+        },
+        "gov.irs.income.bracket.thresholds.3.SEPARATE": {
+            "2026-01-01.2026-12-31": 104900,
+        },
+        "gov.irs.income.bracket.thresholds.4.SEPARATE": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.SEPARATE": {
+            "2026-01-01.2026-12-31": 256450,
+        },
+        "gov.irs.income.bracket.thresholds.6.SEPARATE": {
+            "2026-01-01.2026-12-31": 386350,
+        },
+        "gov.irs.income.bracket.thresholds.3.SINGLE": {
+            "2026-01-01.2026-12-31": 105475,
+        },
+        "gov.irs.income.bracket.thresholds.4.SINGLE": {
+            "2026-01-01.2026-12-31": 198800,
+        },
+        "gov.irs.income.bracket.thresholds.5.SINGLE": {
+            "2026-01-01.2026-12-31": 256450,
+        },
+        "gov.irs.income.bracket.thresholds.6.SINGLE": {
+            "2026-01-01.2026-12-31": 643950,
+        },
+        "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 208300,
+        },
+        "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 397650,
+        },
+        "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 512950,
+        },
+        "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 772750,
+        },
+    }
 
 
+@reform_factory
 def hr1_sd_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.standard.amount.JOINT": {
-                "2026-01-01.2026-12-31": 32300,
-            },
-            "gov.irs.deductions.standard.amount.SINGLE": {
-                "2026-01-01.2026-12-31": 16150,
-            },
-            "gov.irs.deductions.standard.amount.SEPARATE": {
-                "2026-01-01.2026-12-31": 16150,
-            },
-            "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 32300,
-            },
-            "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 24400,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.standard.amount.JOINT": {
+            "2026-01-01.2026-12-31": 32300,
+        },
+        "gov.irs.deductions.standard.amount.SINGLE": {
+            "2026-01-01.2026-12-31": 16150,
+        },
+        "gov.irs.deductions.standard.amount.SEPARATE": {
+            "2026-01-01.2026-12-31": 16150,
+        },
+        "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 32300,
+        },
+        "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 24400,
+        },
+    }
 
 
+@reform_factory
 def hr1_exemption_reform():
-    return Reform.from_dict(
-        {"gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0}},
-        country_id="us",
-    )
+    return {"gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0}}
 
 
+@reform_factory
 def hr1_ctc_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.ctc.in_effect": {"2025-01-01.2100-12-31": True},
-            "gov.irs.credits.ctc.amount.base[0].amount": {
-                "2025-01-01.2028-12-31": 2500
-            },
-            "gov.irs.credits.ctc.amount.adult_dependent": {
-                "2026-01-01.2100-12-31": 500
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.credits.ctc.refundable.individual_max": {
-                "2026-01-01.2026-12-31": 1700
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.credits.ctc.refundable.phase_in.threshold": {
-                "2026-01-01.2100-12-31": 2500
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 200000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.ctc.in_effect": {"2025-01-01.2100-12-31": True},
+        "gov.irs.credits.ctc.amount.base[0].amount": {"2025-01-01.2028-12-31": 2500},
+        "gov.irs.credits.ctc.amount.adult_dependent": {"2026-01-01.2100-12-31": 500},
+        "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.credits.ctc.refundable.individual_max": {
+            "2026-01-01.2026-12-31": 1700
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.credits.ctc.refundable.phase_in.threshold": {
+            "2026-01-01.2100-12-31": 2500
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 200000
+        },
+    }
 
 
+@reform_factory
 def hr1_qbi_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.23},
-            "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
-            "gov.contrib.reconciliation.qbid.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-            "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {
-                "2026-01-01.2035-12-31": 0.25
-            },
-            "gov.irs.deductions.qbi.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 400600,
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 200300,
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 200300,
-            },
-            "gov.irs.deductions.qbi.max.business_property.rate": {
-                "2026-01-01.2100-12-31": 0.025
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 400600,
-            },
-            "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 200300,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.23},
+        "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
+        "gov.contrib.reconciliation.qbid.in_effect": {"2026-01-01.2100-12-31": True},
+        "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {"2026-01-01.2035-12-31": 0.25},
+        "gov.irs.deductions.qbi.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 400600,
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 200300,
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 200300,
+        },
+        "gov.irs.deductions.qbi.max.business_property.rate": {
+            "2026-01-01.2100-12-31": 0.025
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 400600,
+        },
+        "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 200300,
+        },
+    }
 
 
+@reform_factory
 def hr1_estate_tax_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.credits.estate.base": {
-                "2026-01-01.2026-12-31": 15000000,
-            }
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.credits.estate.base": {
+            "2026-01-01.2026-12-31": 15000000,
+        }
+    }
 
 
+@reform_factory
 def hr1_amt_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.income.amt.exemption.amount.JOINT": {
-                "2026-01-01.2026-12-31": 109400,
-            },
-            "gov.irs.income.amt.exemption.amount.SINGLE": {
-                "2026-01-01.2026-12-31": 70300,
-            },
-            "gov.irs.income.amt.exemption.separate_limit": {
-                "2026-01-01.2026-12-31": 718800,
-            },
-            "gov.irs.income.amt.exemption.amount.SEPARATE": {
-                "2026-01-01.2026-12-31": 54700,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 1000000,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 500000,
-            },
-            "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 109400,
-            },
-            "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 70300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 500000,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 1000000,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.income.amt.exemption.amount.JOINT": {
+            "2026-01-01.2026-12-31": 109400,
+        },
+        "gov.irs.income.amt.exemption.amount.SINGLE": {
+            "2026-01-01.2026-12-31": 70300,
+        },
+        "gov.irs.income.amt.exemption.separate_limit": {
+            "2026-01-01.2026-12-31": 718800,
+        },
+        "gov.irs.income.amt.exemption.amount.SEPARATE": {
+            "2026-01-01.2026-12-31": 54700,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 1000000,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 500000,
+        },
+        "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 109400,
+        },
+        "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 70300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 500000,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 1000000,
+        },
+    }
 
 
+@reform_factory
 def hr1_misc_reform():
-    return Reform.from_dict(
-        {"gov.irs.deductions.itemized.misc.applies": {"2026-01-01.2100-12-31": False}},
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.itemized.misc.applies": {"2026-01-01.2100-12-31": False}
+    }
 
 
+@reform_factory
 def hr1_other_item_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.itemized.interest.mortgage.cap.JOINT": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SINGLE": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SEPARATE": {
-                "2026-01-01.2100-12-31": 375000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.JOINT": {
-                "2025-01-01.2028-12-31": 300
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SINGLE": {
-                "2025-01-01.2028-12-31": 150
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SEPARATE": {
-                "2025-01-01.2028-12-31": 150
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.interest.mortgage.cap.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 750000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SURVIVING_SPOUSE": {
-                "2025-01-01.2028-12-31": 150
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2028-12-31": 150
-            },
-            "gov.irs.deductions.itemized.casualty.active": {
-                "2026-01-01.2100-12-31": False
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.itemized.interest.mortgage.cap.JOINT": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SINGLE": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SEPARATE": {
+            "2026-01-01.2100-12-31": 375000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.JOINT": {
+            "2025-01-01.2028-12-31": 300
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SINGLE": {
+            "2025-01-01.2028-12-31": 150
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SEPARATE": {
+            "2025-01-01.2028-12-31": 150
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.interest.mortgage.cap.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 750000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SURVIVING_SPOUSE": {
+            "2025-01-01.2028-12-31": 150
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2028-12-31": 150
+        },
+        "gov.irs.deductions.itemized.casualty.active": {"2026-01-01.2100-12-31": False},
+    }
 
 
+@reform_factory
 def hr1_limitation_on_itemized_deductions_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.pease.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-            "gov.contrib.reconciliation.pease.amended_structure.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.pease.in_effect": {"2026-01-01.2100-12-31": True},
+        "gov.contrib.reconciliation.pease.amended_structure.in_effect": {
+            "2026-01-01.2100-12-31": True
+        },
+    }
 
 
+@reform_factory
 def hr1_tip_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.tip_income_exempt.in_effect": {
-                "2025-01-01.2028-12-31": True
-            }
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.tip_income_exempt.in_effect": {
+            "2025-01-01.2028-12-31": True
+        }
+    }
 
 
+@reform_factory
 def hr1_overtime_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.overtime_income_exempt.in_effect": {
-                "2025-01-01.2028-12-31": True
-            }
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.overtime_income_exempt.in_effect": {
+            "2025-01-01.2028-12-31": True
+        }
+    }
 
 
+@reform_factory
 def hr1_senior_deduction_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.additional_senior_standard_deduction.in_effect": {
-                "2025-01-01.2028-12-31": True
-            },
+    return {
+        "gov.contrib.reconciliation.additional_senior_standard_deduction.in_effect": {
+            "2025-01-01.2028-12-31": True
         },
-        country_id="us",
-    )
+    }
 
 
+@reform_factory
 def hr1_auto_loan_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.auto_loan_interest_ald.in_effect": {
-                "2025-01-01.2028-12-31": True
-            }
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.auto_loan_interest_ald.in_effect": {
+            "2025-01-01.2028-12-31": True
+        }
+    }
 
 
+@reform_factory
 def hr1_salt_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.salt_phase_out.rate": {"2025-01-01.2100-12-31": 0.3},
-            "gov.contrib.salt_phase_out.in_effect": {"2025-01-01.2100-12-31": True},
-            "gov.contrib.salt_phase_out.floor.applies": {"2025-01-01.2100-12-31": True},
-            "gov.contrib.salt_phase_out.threshold.JOINT": {
-                "2026-01-01.2026-12-31": 505000,
-            },
-            "gov.contrib.salt_phase_out.threshold.SINGLE": {
-                "2026-01-01.2026-12-31": 505000,
-            },
-            "gov.contrib.salt_phase_out.threshold.SEPARATE": {
-                "2026-01-01.2026-12-31": 252500,
-            },
-            "gov.contrib.salt_phase_out.threshold.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 505000,
-            },
-            "gov.contrib.salt_phase_out.threshold.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 505000,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
-                "2026-01-01.2026-12-31": 40400,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
-                "2026-01-01.2026-12-31": 40400,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
-                "2026-01-01.2026-12-31": 20200,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 40400,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 40400,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.salt_phase_out.rate": {"2025-01-01.2100-12-31": 0.3},
+        "gov.contrib.salt_phase_out.in_effect": {"2025-01-01.2100-12-31": True},
+        "gov.contrib.salt_phase_out.floor.applies": {"2025-01-01.2100-12-31": True},
+        "gov.contrib.salt_phase_out.threshold.JOINT": {
+            "2026-01-01.2026-12-31": 505000,
+        },
+        "gov.contrib.salt_phase_out.threshold.SINGLE": {
+            "2026-01-01.2026-12-31": 505000,
+        },
+        "gov.contrib.salt_phase_out.threshold.SEPARATE": {
+            "2026-01-01.2026-12-31": 252500,
+        },
+        "gov.contrib.salt_phase_out.threshold.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 505000,
+        },
+        "gov.contrib.salt_phase_out.threshold.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 505000,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
+            "2026-01-01.2026-12-31": 40400,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
+            "2026-01-01.2026-12-31": 40400,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
+            "2026-01-01.2026-12-31": 20200,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 40400,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 40400,
+        },
+    }
 
 
+@reform_factory
 def snap_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.usda.snap.takeup_rate": {"2026-01-01.2028-12-31": 0.775},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.usda.snap.takeup_rate": {"2026-01-01.2028-12-31": 0.775},
+    }
 
 
+@reform_factory
 def aca_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.aca.takeup_rate": {"2026-01-01.2028-12-31": 0.63},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.aca.takeup_rate": {"2026-01-01.2028-12-31": 0.63},
+    }
 
 
+@reform_factory
 def medicaid_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.hhs.medicaid.takeup_rate": {"2026-01-01.2028-12-31": 0.92},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.hhs.medicaid.takeup_rate": {"2026-01-01.2028-12-31": 0.92},
+    }
+
+
+# House reform components, in stacking order
+HOUSE_REFORMS = ReformRegistry(
+    {
+        "Tax Rate Reform": hr1_tax_rate_reform,
+        "Standard Deduction Reform": hr1_sd_reform,
+        "Exemption Reform": hr1_exemption_reform,
+        "CTC Reform": hr1_ctc_reform,
+        "QBID Reform": hr1_qbi_reform,
+        "AMT Reform": hr1_amt_reform,
+        "Miscellaneous Reform": hr1_misc_reform,
+        "Other Itemized Deductions Reform": hr1_other_item_reform,
+        "Limitation on Itemized Deductions Reform": hr1_limitation_on_itemized_deductions_reform,
+        "Estate Tax Reform": hr1_estate_tax_reform,
+        "Senior Deduction Reform": hr1_senior_deduction_reform,
+        "Tip Income Exempt": hr1_tip_reform,
+        "Overtime Income Exempt": hr1_overtime_reform,
+        "Auto Loan Interest ALD": hr1_auto_loan_reform,
+        "SALT Reform": hr1_salt_reform,
+        "SNAP Takeup Reform": snap_takeup_reform,
+        "ACA Takeup Reform": aca_takeup_reform,
+        "Medicaid Takeup Reform": medicaid_takeup_reform,
+    },
+)
 
 
 def get_all_reforms():
-    """Get dictionary of all reform components."""
-    return {
-        "Tax Rate Reform": hr1_tax_rate_reform(),
-        "Standard Deduction Reform": hr1_sd_reform(),
-        "Exemption Reform": hr1_exemption_reform(),
-        "CTC Reform": hr1_ctc_reform(),
-        "QBID Reform": hr1_qbi_reform(),
-        "AMT Reform": hr1_amt_reform(),
-        "Miscellaneous Reform": hr1_misc_reform(),
-        "Other Itemized Deductions Reform": hr1_other_item_reform(),
-        "Limitation on Itemized Deductions Reform": hr1_limitation_on_itemized_deductions_reform(),
-        "Estate Tax Reform": hr1_estate_tax_reform(),
-        "Senior Deduction Reform": hr1_senior_deduction_reform(),
-        "Tip Income Exempt": hr1_tip_reform(),
-        "Overtime Income Exempt": hr1_overtime_reform(),
-        "Auto Loan Interest ALD": hr1_auto_loan_reform(),
-        "SALT Reform": hr1_salt_reform(),
-        "SNAP Takeup Reform": snap_takeup_reform(),
-        "ACA Takeup Reform": aca_takeup_reform(),
-        "Medicaid Takeup Reform": medicaid_takeup_reform(),
-    }
+    """Get the registry of all House reform components."""
+    return HOUSE_REFORMS
 
 
+@reform_factory
 def senate_finance_tax_rate_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
-            "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
-            "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
-            "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
-            "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
-            "gov.irs.income.bracket.thresholds.1.JOINT": {
-                "2026-01-01.2100-12-31": 23850
-            },
-            "gov.irs.income.bracket.thresholds.2.JOINT": {
-                "2026-01-01.2100-12-31": 96950
-            },
-            "gov.irs.income.bracket.thresholds.3.JOINT": {
-                "2026-01-01.2026-12-31": 208300,
-                "2027-01-01.2027-12-31": 213400,
-                "2028-01-01.2028-12-31": 217850,
-                "2029-01-01.2029-12-31": 222200,
-                "2030-01-01.2030-12-31": 226650,
-                "2031-01-01.2031-12-31": 231100,
-                "2032-01-01.2032-12-31": 235650,
-                "2033-01-01.2033-12-31": 240300,
-                "2034-01-01.2034-12-31": 245100,
-                "2035-01-01.2036-12-31": 249950,
-            },
-            "gov.irs.income.bracket.thresholds.4.JOINT": {
-                "2026-01-01.2026-12-31": 397650,
-                "2027-01-01.2027-12-31": 407450,
-                "2028-01-01.2028-12-31": 415900,
-                "2029-01-01.2029-12-31": 424250,
-                "2030-01-01.2030-12-31": 432700,
-                "2031-01-01.2031-12-31": 441250,
-                "2032-01-01.2032-12-31": 449900,
-                "2033-01-01.2033-12-31": 458800,
-                "2034-01-01.2034-12-31": 467950,
-                "2035-01-01.2036-12-31": 477150,
-            },
-            "gov.irs.income.bracket.thresholds.5.JOINT": {
-                "2026-01-01.2026-12-31": 512950,
-                "2027-01-01.2027-12-31": 525600,
-                "2028-01-01.2028-12-31": 536500,
-                "2029-01-01.2029-12-31": 547200,
-                "2030-01-01.2030-12-31": 558100,
-                "2031-01-01.2031-12-31": 569150,
-                "2032-01-01.2032-12-31": 580350,
-                "2033-01-01.2033-12-31": 591800,
-                "2034-01-01.2034-12-31": 603550,
-                "2035-01-01.2037-12-31": 615500,
-            },
-            "gov.irs.income.bracket.thresholds.6.JOINT": {
-                "2026-01-01.2026-12-31": 772750,
-                "2027-01-01.2027-12-31": 791800,
-                "2028-01-01.2028-12-31": 808200,
-                "2029-01-01.2029-12-31": 824400,
-                "2030-01-01.2030-12-31": 840800,
-                "2031-01-01.2031-12-31": 857400,
-                "2032-01-01.2032-12-31": 874250,
-                "2033-01-01.2033-12-31": 891550,
-                "2034-01-01.2034-12-31": 909300,
-                "2035-01-01.2036-12-31": 927250,
-            },
-            "gov.irs.income.bracket.thresholds.1.SINGLE": {
-                "2026-01-01.2100-12-31": 11925
-            },
-            "gov.irs.income.bracket.thresholds.2.SINGLE": {
-                "2026-01-01.2100-12-31": 48475
-            },
-            "gov.irs.income.bracket.thresholds.3.SINGLE": {
-                "2026-01-01.2026-12-31": 104900,
-                "2027-01-01.2027-12-31": 107500,
-                "2028-01-01.2028-12-31": 109700,
-                "2029-01-01.2029-12-31": 111900,
-                "2030-01-01.2030-12-31": 114150,
-                "2031-01-01.2031-12-31": 116400,
-                "2032-01-01.2032-12-31": 118700,
-                "2033-01-01.2033-12-31": 121050,
-                "2034-01-01.2034-12-31": 123450,
-                "2035-01-01.2036-12-31": 125900,
-            },
-            "gov.irs.income.bracket.thresholds.4.SINGLE": {
-                "2026-01-01.2026-12-31": 198800,
-                "2027-01-01.2027-12-31": 203700,
-                "2028-01-01.2028-12-31": 207950,
-                "2029-01-01.2029-12-31": 212100,
-                "2030-01-01.2030-12-31": 216350,
-                "2031-01-01.2031-12-31": 220600,
-                "2032-01-01.2032-12-31": 224950,
-                "2033-01-01.2033-12-31": 229400,
-                "2034-01-01.2034-12-31": 233950,
-                "2035-01-01.2036-12-31": 238550,
-            },
-            "gov.irs.income.bracket.thresholds.5.SINGLE": {
-                "2026-01-01.2026-12-31": 256450,
-                "2027-01-01.2027-12-31": 262800,
-                "2028-01-01.2028-12-31": 268250,
-                "2029-01-01.2029-12-31": 273600,
-                "2030-01-01.2030-12-31": 279050,
-                "2031-01-01.2031-12-31": 284550,
-                "2032-01-01.2032-12-31": 290150,
-                "2033-01-01.2033-12-31": 295900,
-                "2034-01-01.2034-12-31": 301750,
-                "2035-01-01.2100-12-31": 307750,
-            },
-            "gov.irs.income.bracket.thresholds.6.SINGLE": {
-                "2026-01-01.2026-12-31": 643950,
-                "2027-01-01.2027-12-31": 659800,
-                "2028-01-01.2028-12-31": 673500,
-                "2029-01-01.2029-12-31": 687000,
-                "2030-01-01.2030-12-31": 700650,
-                "2031-01-01.2031-12-31": 714500,
-                "2032-01-01.2032-12-31": 728550,
-                "2033-01-01.2033-12-31": 742950,
-                "2034-01-01.2034-12-31": 757750,
-                "2035-01-01.2036-12-31": 772700,
-            },
-            "gov.irs.income.bracket.thresholds.1.SEPARATE": {
-                "2026-01-01.2100-12-31": 11925
-            },
-            "gov.irs.income.bracket.thresholds.2.SEPARATE": {
-                "2026-01-01.2100-12-31": 48475
-            },
-            "gov.irs.income.bracket.thresholds.3.SEPARATE": {
-                "2026-01-01.2026-12-31": 104900,
-                "2027-01-01.2027-12-31": 107500,
-                "2028-01-01.2028-12-31": 109700,
-                "2029-01-01.2029-12-31": 111900,
-                "2030-01-01.2030-12-31": 114150,
-                "2031-01-01.2031-12-31": 116400,
-                "2032-01-01.2032-12-31": 118700,
-                "2033-01-01.2033-12-31": 121050,
-                "2034-01-01.2034-12-31": 123450,
-                "2035-01-01.2036-12-31": 125900,
-            },
-            "gov.irs.income.bracket.thresholds.4.SEPARATE": {
-                "2026-01-01.2026-12-31": 198800,
-                "2027-01-01.2027-12-31": 203700,
-                "2028-01-01.2028-12-31": 207950,
-                "2029-01-01.2029-12-31": 212100,
-                "2030-01-01.2030-12-31": 216350,
-                "2031-01-01.2031-12-31": 220600,
-                "2032-01-01.2032-12-31": 224950,
-                "2033-01-01.2033-12-31": 229400,
-                "2034-01-01.2034-12-31": 233950,
-                "2035-01-01.2036-12-31": 238550,
-            },
-            "gov.irs.income.bracket.thresholds.5.SEPARATE": {
-                "2026-01-01.2026-12-31": 256450,
-                "2027-01-01.2027-12-31": 262800,
-                "2028-01-01.2028-12-31": 268250,
-                "2029-01-01.2029-12-31": 273600,
-                "2030-01-01.2030-12-31": 279050,
-                "2031-01-01.2031-12-31": 284550,
-                "2032-01-01.2032-12-31": 290150,
-                "2033-01-01.2033-12-31": 295900,
-                "2034-01-01.2034-12-31": 301750,
-                "2035-01-01.2100-12-31": 307750,
-            },
-            "gov.irs.income.bracket.thresholds.6.SEPARATE": {
-                "2026-01-01.2026-12-31": 386350,
-                "2027-01-01.2027-12-31": 395900,
-                "2028-01-01.2028-12-31": 404100,
-                "2029-01-01.2029-12-31": 412200,
-                "2030-01-01.2030-12-31": 420400,
-                "2031-01-01.2031-12-31": 428700,
-                "2032-01-01.2032-12-31": 437100,
-                "2033-01-01.2033-12-31": 445750,
-                "2034-01-01.2034-12-31": 454650,
-                "2035-01-01.2036-12-31": 463600,
-            },
-            "gov.irs.income.bracket.thresholds.1.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 23850
-            },
-            "gov.irs.income.bracket.thresholds.2.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 96950
-            },
-            "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 208300,
-                "2027-01-01.2027-12-31": 213400,
-                "2028-01-01.2028-12-31": 217850,
-                "2029-01-01.2029-12-31": 222200,
-                "2030-01-01.2030-12-31": 226650,
-                "2031-01-01.2031-12-31": 231100,
-                "2032-01-01.2032-12-31": 235650,
-                "2033-01-01.2033-12-31": 240300,
-                "2034-01-01.2034-12-31": 245100,
-                "2035-01-01.2036-12-31": 249950,
-            },
-            "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 397650,
-                "2027-01-01.2027-12-31": 407450,
-                "2028-01-01.2028-12-31": 415900,
-                "2029-01-01.2029-12-31": 424250,
-                "2030-01-01.2030-12-31": 432700,
-                "2031-01-01.2031-12-31": 441250,
-                "2032-01-01.2032-12-31": 449900,
-                "2033-01-01.2033-12-31": 458800,
-                "2034-01-01.2034-12-31": 467950,
-                "2035-01-01.2036-12-31": 477150,
-            },
-            "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 512950,
-                "2027-01-01.2027-12-31": 525600,
-                "2028-01-01.2028-12-31": 536500,
-                "2029-01-01.2029-12-31": 547200,
-                "2030-01-01.2030-12-31": 558100,
-                "2031-01-01.2031-12-31": 569150,
-                "2032-01-01.2032-12-31": 580350,
-                "2033-01-01.2033-12-31": 591800,
-                "2034-01-01.2034-12-31": 603550,
-                "2035-01-01.2037-12-31": 615500,
-            },
-            "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 772750,
-                "2027-01-01.2027-12-31": 791800,
-                "2028-01-01.2028-12-31": 808200,
-                "2029-01-01.2029-12-31": 824400,
-                "2030-01-01.2030-12-31": 840800,
-                "2031-01-01.2031-12-31": 857400,
-                "2032-01-01.2032-12-31": 874250,
-                "2033-01-01.2033-12-31": 891550,
-                "2034-01-01.2034-12-31": 909300,
-                "2035-01-01.2036-12-31": 927300,
-            },
-            "gov.irs.income.bracket.thresholds.1.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 17000
-            },
-            "gov.irs.income.bracket.thresholds.2.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 64850
-            },
-            "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 104900,
-                "2027-01-01.2027-12-31": 107500,
-                "2028-01-01.2028-12-31": 109700,
-                "2029-01-01.2029-12-31": 111900,
-                "2030-01-01.2030-12-31": 114150,
-                "2031-01-01.2031-12-31": 116400,
-                "2032-01-01.2032-12-31": 118700,
-                "2033-01-01.2033-12-31": 121050,
-                "2034-01-01.2034-12-31": 123450,
-                "2035-01-01.2036-12-31": 125900,
-            },
-            "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 198800,
-                "2027-01-01.2027-12-31": 203700,
-                "2028-01-01.2028-12-31": 207950,
-                "2029-01-01.2029-12-31": 212100,
-                "2030-01-01.2030-12-31": 216350,
-                "2031-01-01.2031-12-31": 220600,
-                "2032-01-01.2032-12-31": 224950,
-                "2033-01-01.2033-12-31": 229400,
-                "2034-01-01.2034-12-31": 233950,
-                "2035-01-01.2036-12-31": 238550,
-            },
-            "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 256486,
-                "2027-01-01.2027-12-31": 262806,
-                "2028-01-01.2028-12-31": 268250,
-                "2029-01-01.2029-12-31": 273621,
-                "2030-01-01.2030-12-31": 279065,
-                "2031-01-01.2031-12-31": 284584,
-                "2032-01-01.2032-12-31": 290175,
-                "2033-01-01.2033-12-31": 295914,
-                "2034-01-01.2034-12-31": 301800,
-                "2035-01-01.2036-12-31": 307759,
-            },
-            "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 643950,
-                "2027-01-01.2027-12-31": 659800,
-                "2028-01-01.2028-12-31": 673500,
-                "2029-01-01.2029-12-31": 687000,
-                "2030-01-01.2030-12-31": 700650,
-                "2031-01-01.2031-12-31": 714500,
-                "2032-01-01.2032-12-31": 728550,
-                "2033-01-01.2033-12-31": 742950,
-                "2034-01-01.2034-12-31": 757750,
-                "2035-01-01.2036-12-31": 772700,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.income.bracket.rates.2": {"2026-01-01.2100-12-31": 0.12},
+        "gov.irs.income.bracket.rates.3": {"2026-01-01.2100-12-31": 0.22},
+        "gov.irs.income.bracket.rates.4": {"2026-01-01.2100-12-31": 0.24},
+        "gov.irs.income.bracket.rates.5": {"2026-01-01.2100-12-31": 0.32},
+        "gov.irs.income.bracket.rates.7": {"2026-01-01.2100-12-31": 0.37},
+        "gov.irs.income.bracket.thresholds.1.JOINT": {"2026-01-01.2100-12-31": 23850},
+        "gov.irs.income.bracket.thresholds.2.JOINT": {"2026-01-01.2100-12-31": 96950},
+        "gov.irs.income.bracket.thresholds.3.JOINT": {
+            "2026-01-01.2026-12-31": 208300,
+            "2027-01-01.2027-12-31": 213400,
+            "2028-01-01.2028-12-31": 217850,
+            "2029-01-01.2029-12-31": 222200,
+            "2030-01-01.2030-12-31": 226650,
+            "2031-01-01.2031-12-31": 231100,
+            "2032-01-01.2032-12-31": 235650,
+            "2033-01-01.2033-12-31": 240300,
+            "2034-01-01.2034-12-31": 245100,
+            "2035-01-01.2036-12-31": 249950,
+        },
+        "gov.irs.income.bracket.thresholds.4.JOINT": {
+            "2026-01-01.2026-12-31": 397650,
+            "2027-01-01.2027-12-31": 407450,
+            "2028-01-01.2028-12-31": 415900,
+            "2029-01-01.2029-12-31": 424250,
+            "2030-01-01.2030-12-31": 432700,
+            "2031-01-01.2031-12-31": 441250,
+            "2032-01-01.2032-12-31": 449900,
+            "2033-01-01.2033-12-31": 458800,
+            "2034-01-01.2034-12-31": 467950,
+            "2035-01-01.2036-12-31": 477150,
+        },
+        "gov.irs.income.bracket.thresholds.5.JOINT": {
+            "2026-01-01.2026-12-31": 512950,
+            "2027-01-01.2027-12-31": 525600,
+            "2028-01-01.2028-12-31": 536500,
+            "2029-01-01.2029-12-31": 547200,
+            "2030-01-01.2030-12-31": 558100,
+            "2031-01-01.2031-12-31": 569150,
+            "2032-01-01.2032-12-31": 580350,
+            "2033-01-01.2033-12-31": 591800,
+            "2034-01-01.2034-12-31": 603550,
+            "2035-01-01.2037-12-31": 615500,
+        },
+        "gov.irs.income.bracket.thresholds.6.JOINT": {
+            "2026-01-01.2026-12-31": 772750,
+            "2027-01-01.2027-12-31": 791800,
+            "2028-01-01.2028-12-31": 808200,
+            "2029-01-01.2029-12-31": 824400,
+            "2030-01-01.2030-12-31": 840800,
+            "2031-01-01.2031-12-31": 857400,
+            "2032-01-01.2032-12-31": 874250,
+            "2033-01-01.2033-12-31": 891550,
+            "2034-01-01.2034-12-31": 909300,
+            "2035-01-01.2036-12-31": 927250,
+        },
+        "gov.irs.income.bracket.thresholds.1.SINGLE": {"2026-01-01.2100-12-31": 11925},
+        "gov.irs.income.bracket.thresholds.2.SINGLE": {"2026-01-01.2100-12-31": 48475},
+        "gov.irs.income.bracket.thresholds.3.SINGLE": {
+            "2026-01-01.2026-12-31": 104900,
+            "2027-01-01.2027-12-31": 107500,
+            "2028-01-01.2028-12-31": 109700,
+            "2029-01-01.2029-12-31": 111900,
+            "2030-01-01.2030-12-31": 114150,
+            "2031-01-01.2031-12-31": 116400,
+            "2032-01-01.2032-12-31": 118700,
+            "2033-01-01.2033-12-31": 121050,
+            "2034-01-01.2034-12-31": 123450,
+            "2035-01-01.2036-12-31": 125900,
+        },
+        "gov.irs.income.bracket.thresholds.4.SINGLE": {
+            "2026-01-01.2026-12-31": 198800,
+            "2027-01-01.2027-12-31": 203700,
+            "2028-01-01.2028-12-31": 207950,
+            "2029-01-01.2029-12-31": 212100,
+            "2030-01-01.2030-12-31": 216350,
+            "2031-01-01.2031-12-31": 220600,
+            "2032-01-01.2032-12-31": 224950,
+            "2033-01-01.2033-12-31": 229400,
+            "2034-01-01.2034-12-31": 233950,
+            "2035-01-01.2036-12-31": 238550,
+        },
+        "gov.irs.income.bracket.thresholds.5.SINGLE": {
+            "2026-01-01.2026-12-31": 256450,
+            "2027-01-01.2027-12-31": 262800,
+            "2028-01-01.2028-12-31": 268250,
+            "2029-01-01.2029-12-31": 273600,
+            "2030-01-01.2030-12-31": 279050,
+            "2031-01-01.2031-12-31": 284550,
+            "2032-01-01.2032-12-31": 290150,
+            "2033-01-01.2033-12-31": 295900,
+            "2034-01-01.2034-12-31": 301750,
+            "2035-01-01.2100-12-31": 307750,
+        },
+        "gov.irs.income.bracket.thresholds.6.SINGLE": {
+            "2026-01-01.2026-12-31": 643950,
+            "2027-01-01.2027-12-31": 659800,
+            "2028-01-01.2028-12-31": 673500,
+            "2029-01-01.2029-12-31": 687000,
+            "2030-01-01.2030-12-31": 700650,
+            "2031-01-01.2031-12-31": 714500,
+            "2032-01-01.2032-12-31": 728550,
+            "2033-01-01.2033-12-31": 742950,
+            "2034-01-01.2034-12-31": 757750,
+            "2035-01-01.2036-12-31": 772700,
+        },
+        "gov.irs.income.bracket.thresholds.1.SEPARATE": {
+            "2026-01-01.2100-12-31": 11925
+        },
+        "gov.irs.income.bracket.thresholds.2.SEPARATE": {
+            "2026-01-01.2100-12-31": 48475
+        },
+        "gov.irs.income.bracket.thresholds.3.SEPARATE": {
+            "2026-01-01.2026-12-31": 104900,
+            "2027-01-01.2027-12-31": 107500,
+            "2028-01-01.2028-12-31": 109700,
+            "2029-01-01.2029-12-31": 111900,
+            "2030-01-01.2030-12-31": 114150,
+            "2031-01-01.2031-12-31": 116400,
+            "2032-01-01.2032-12-31": 118700,
+            "2033-01-01.2033-12-31": 121050,
+            "2034-01-01.2034-12-31": 123450,
+            "2035-01-01.2036-12-31": 125900,
+        },
+        "gov.irs.income.bracket.thresholds.4.SEPARATE": {
+            "2026-01-01.2026-12-31": 198800,
+            "2027-01-01.2027-12-31": 203700,
+            "2028-01-01.2028-12-31": 207950,
+            "2029-01-01.2029-12-31": 212100,
+            "2030-01-01.2030-12-31": 216350,
+            "2031-01-01.2031-12-31": 220600,
+            "2032-01-01.2032-12-31": 224950,
+            "2033-01-01.2033-12-31": 229400,
+            "2034-01-01.2034-12-31": 233950,
+            "2035-01-01.2036-12-31": 238550,
+        },
+        "gov.irs.income.bracket.thresholds.5.SEPARATE": {
+            "2026-01-01.2026-12-31": 256450,
+            "2027-01-01.2027-12-31": 262800,
+            "2028-01-01.2028-12-31": 268250,
+            "2029-01-01.2029-12-31": 273600,
+            "2030-01-01.2030-12-31": 279050,
+            "2031-01-01.2031-12-31": 284550,
+            "2032-01-01.2032-12-31": 290150,
+            "2033-01-01.2033-12-31": 295900,
+            "2034-01-01.2034-12-31": 301750,
+            "2035-01-01.2100-12-31": 307750,
+        },
+        "gov.irs.income.bracket.thresholds.6.SEPARATE": {
+            "2026-01-01.2026-12-31": 386350,
+            "2027-01-01.2027-12-31": 395900,
+            "2028-01-01.2028-12-31": 404100,
+            "2029-01-01.2029-12-31": 412200,
+            "2030-01-01.2030-12-31": 420400,
+            "2031-01-01.2031-12-31": 428700,
+            "2032-01-01.2032-12-31": 437100,
+            "2033-01-01.2033-12-31": 445750,
+            "2034-01-01.2034-12-31": 454650,
+            "2035-01-01.2036-12-31": 463600,
+        },
+        "gov.irs.income.bracket.thresholds.1.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 23850
+        },
+        "gov.irs.income.bracket.thresholds.2.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 96950
+        },
+        "gov.irs.income.bracket.thresholds.3.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 208300,
+            "2027-01-01.2027-12-31": 213400,
+            "2028-01-01.2028-12-31": 217850,
+            "2029-01-01.2029-12-31": 222200,
+            "2030-01-01.2030-12-31": 226650,
+            "2031-01-01.2031-12-31": 231100,
+            "2032-01-01.2032-12-31": 235650,
+            "2033-01-01.2033-12-31": 240300,
+            "2034-01-01.2034-12-31": 245100,
+            "2035-01-01.2036-12-31": 249950,
+        },
+        "gov.irs.income.bracket.thresholds.4.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 397650,
+            "2027-01-01.2027-12-31": 407450,
+            "2028-01-01.2028-12-31": 415900,
+            "2029-01-01.2029-12-31": 424250,
+            "2030-01-01.2030-12-31": 432700,
+            "2031-01-01.2031-12-31": 441250,
+            "2032-01-01.2032-12-31": 449900,
+            "2033-01-01.2033-12-31": 458800,
+            "2034-01-01.2034-12-31": 467950,
+            "2035-01-01.2036-12-31": 477150,
+        },
+        "gov.irs.income.bracket.thresholds.5.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 512950,
+            "2027-01-01.2027-12-31": 525600,
+            "2028-01-01.2028-12-31": 536500,
+            "2029-01-01.2029-12-31": 547200,
+            "2030-01-01.2030-12-31": 558100,
+            "2031-01-01.2031-12-31": 569150,
+            "2032-01-01.2032-12-31": 580350,
+            "2033-01-01.2033-12-31": 591800,
+            "2034-01-01.2034-12-31": 603550,
+            "2035-01-01.2037-12-31": 615500,
+        },
+        "gov.irs.income.bracket.thresholds.6.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 772750,
+            "2027-01-01.2027-12-31": 791800,
+            "2028-01-01.2028-12-31": 808200,
+            "2029-01-01.2029-12-31": 824400,
+            "2030-01-01.2030-12-31": 840800,
+            "2031-01-01.2031-12-31": 857400,
+            "2032-01-01.2032-12-31": 874250,
+            "2033-01-01.2033-12-31": 891550,
+            "2034-01-01.2034-12-31": 909300,
+            "2035-01-01.2036-12-31": 927300,
+        },
+        "gov.irs.income.bracket.thresholds.1.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 17000
+        },
+        "gov.irs.income.bracket.thresholds.2.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 64850
+        },
+        "gov.irs.income.bracket.thresholds.3.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 104900,
+            "2027-01-01.2027-12-31": 107500,
+            "2028-01-01.2028-12-31": 109700,
+            "2029-01-01.2029-12-31": 111900,
+            "2030-01-01.2030-12-31": 114150,
+            "2031-01-01.2031-12-31": 116400,
+            "2032-01-01.2032-12-31": 118700,
+            "2033-01-01.2033-12-31": 121050,
+            "2034-01-01.2034-12-31": 123450,
+            "2035-01-01.2036-12-31": 125900,
+        },
+        "gov.irs.income.bracket.thresholds.4.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 198800,
+            "2027-01-01.2027-12-31": 203700,
+            "2028-01-01.2028-12-31": 207950,
+            "2029-01-01.2029-12-31": 212100,
+            "2030-01-01.2030-12-31": 216350,
+            "2031-01-01.2031-12-31": 220600,
+            "2032-01-01.2032-12-31": 224950,
+            "2033-01-01.2033-12-31": 229400,
+            "2034-01-01.2034-12-31": 233950,
+            "2035-01-01.2036-12-31": 238550,
+        },
+        "gov.irs.income.bracket.thresholds.5.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 256486,
+            "2027-01-01.2027-12-31": 262806,
+            "2028-01-01.2028-12-31": 268250,
+            "2029-01-01.2029-12-31": 273621,
+            "2030-01-01.2030-12-31": 279065,
+            "2031-01-01.2031-12-31": 284584,
+            "2032-01-01.2032-12-31": 290175,
+            "2033-01-01.2033-12-31": 295914,
+            "2034-01-01.2034-12-31": 301800,
+            "2035-01-01.2036-12-31": 307759,
+        },
+        "gov.irs.income.bracket.thresholds.6.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 643950,
+            "2027-01-01.2027-12-31": 659800,
+            "2028-01-01.2028-12-31": 673500,
+            "2029-01-01.2029-12-31": 687000,
+            "2030-01-01.2030-12-31": 700650,
+            "2031-01-01.2031-12-31": 714500,
+            "2032-01-01.2032-12-31": 728550,
+            "2033-01-01.2033-12-31": 742950,
+            "2034-01-01.2034-12-31": 757750,
+            "2035-01-01.2036-12-31": 772700,
+        },
+    }
 
 
+@reform_factory
 def senate_finance_sd_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.standard.amount.JOINT": {
-                "2025-01-01.2025-12-31": 31500,
-                "2026-01-01.2026-12-31": 32600,
-                "2027-01-01.2027-12-31": 33400,
-                "2028-01-01.2028-12-31": 34100,
-                "2029-01-01.2029-12-31": 34800,
-                "2030-01-01.2030-12-31": 35500,
-                "2031-01-01.2031-12-31": 36200,
-                "2032-01-01.2032-12-31": 36900,
-                "2033-01-01.2033-12-31": 37700,
-                "2034-01-01.2034-12-31": 38400,
-                "2035-01-01.2100-12-31": 39200,
-            },
-            "gov.irs.deductions.standard.amount.SINGLE": {
-                "2025-01-01.2025-12-31": 15750,
-                "2026-01-01.2026-12-31": 16300,
-                "2027-01-01.2027-12-31": 16700,
-                "2028-01-01.2028-12-31": 17050,
-                "2029-01-01.2029-12-31": 17400,
-                "2030-01-01.2030-12-31": 17750,
-                "2031-01-01.2031-12-31": 18100,
-                "2032-01-01.2032-12-31": 18450,
-                "2033-01-01.2033-12-31": 18850,
-                "2034-01-01.2034-12-31": 19200,
-                "2035-01-01.2100-12-31": 19600,
-            },
-            "gov.irs.deductions.standard.amount.SEPARATE": {
-                "2025-01-01.2025-12-31": 15750,
-                "2026-01-01.2026-12-31": 16300,
-                "2027-01-01.2027-12-31": 16700,
-                "2028-01-01.2028-12-31": 17050,
-                "2029-01-01.2029-12-31": 17400,
-                "2030-01-01.2030-12-31": 17750,
-                "2031-01-01.2031-12-31": 18100,
-                "2032-01-01.2032-12-31": 18450,
-                "2033-01-01.2033-12-31": 18850,
-                "2034-01-01.2034-12-31": 19200,
-                "2035-01-01.2100-12-31": 19600,
-            },
-            "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
-                "2025-01-01.2025-12-31": 31500,
-                "2026-01-01.2026-12-31": 32600,
-                "2027-01-01.2027-12-31": 33400,
-                "2028-01-01.2028-12-31": 34100,
-                "2029-01-01.2029-12-31": 34800,
-                "2030-01-01.2030-12-31": 35500,
-                "2031-01-01.2031-12-31": 36200,
-                "2032-01-01.2032-12-31": 36900,
-                "2033-01-01.2033-12-31": 37700,
-                "2034-01-01.2034-12-31": 38400,
-                "2035-01-01.2100-12-31": 39200,
-            },
-            "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2025-12-31": 23625,
-                "2026-01-01.2026-12-31": 24500,
-                "2027-01-01.2027-12-31": 25100,
-                "2028-01-01.2028-12-31": 25600,
-                "2029-01-01.2029-12-31": 26150,
-                "2030-01-01.2030-12-31": 26650,
-                "2031-01-01.2031-12-31": 27200,
-                "2032-01-01.2032-12-31": 27700,
-                "2033-01-01.2033-12-31": 28250,
-                "2034-01-01.2034-12-31": 28800,
-                "2035-01-01.2100-12-31": 29400,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.standard.amount.JOINT": {
+            "2025-01-01.2025-12-31": 31500,
+            "2026-01-01.2026-12-31": 32600,
+            "2027-01-01.2027-12-31": 33400,
+            "2028-01-01.2028-12-31": 34100,
+            "2029-01-01.2029-12-31": 34800,
+            "2030-01-01.2030-12-31": 35500,
+            "2031-01-01.2031-12-31": 36200,
+            "2032-01-01.2032-12-31": 36900,
+            "2033-01-01.2033-12-31": 37700,
+            "2034-01-01.2034-12-31": 38400,
+            "2035-01-01.2100-12-31": 39200,
+        },
+        "gov.irs.deductions.standard.amount.SINGLE": {
+            "2025-01-01.2025-12-31": 15750,
+            "2026-01-01.2026-12-31": 16300,
+            "2027-01-01.2027-12-31": 16700,
+            "2028-01-01.2028-12-31": 17050,
+            "2029-01-01.2029-12-31": 17400,
+            "2030-01-01.2030-12-31": 17750,
+            "2031-01-01.2031-12-31": 18100,
+            "2032-01-01.2032-12-31": 18450,
+            "2033-01-01.2033-12-31": 18850,
+            "2034-01-01.2034-12-31": 19200,
+            "2035-01-01.2100-12-31": 19600,
+        },
+        "gov.irs.deductions.standard.amount.SEPARATE": {
+            "2025-01-01.2025-12-31": 15750,
+            "2026-01-01.2026-12-31": 16300,
+            "2027-01-01.2027-12-31": 16700,
+            "2028-01-01.2028-12-31": 17050,
+            "2029-01-01.2029-12-31": 17400,
+            "2030-01-01.2030-12-31": 17750,
+            "2031-01-01.2031-12-31": 18100,
+            "2032-01-01.2032-12-31": 18450,
+            "2033-01-01.2033-12-31": 18850,
+            "2034-01-01.2034-12-31": 19200,
+            "2035-01-01.2100-12-31": 19600,
+        },
+        "gov.irs.deductions.standard.amount.SURVIVING_SPOUSE": {
+            "2025-01-01.2025-12-31": 31500,
+            "2026-01-01.2026-12-31": 32600,
+            "2027-01-01.2027-12-31": 33400,
+            "2028-01-01.2028-12-31": 34100,
+            "2029-01-01.2029-12-31": 34800,
+            "2030-01-01.2030-12-31": 35500,
+            "2031-01-01.2031-12-31": 36200,
+            "2032-01-01.2032-12-31": 36900,
+            "2033-01-01.2033-12-31": 37700,
+            "2034-01-01.2034-12-31": 38400,
+            "2035-01-01.2100-12-31": 39200,
+        },
+        "gov.irs.deductions.standard.amount.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2025-12-31": 23625,
+            "2026-01-01.2026-12-31": 24500,
+            "2027-01-01.2027-12-31": 25100,
+            "2028-01-01.2028-12-31": 25600,
+            "2029-01-01.2029-12-31": 26150,
+            "2030-01-01.2030-12-31": 26650,
+            "2031-01-01.2031-12-31": 27200,
+            "2032-01-01.2032-12-31": 27700,
+            "2033-01-01.2033-12-31": 28250,
+            "2034-01-01.2034-12-31": 28800,
+            "2035-01-01.2100-12-31": 29400,
+        },
+    }
 
 
+@reform_factory
 def senate_finance_amt_reform():
-    return Reform.from_dict(
-        {
-            "gov.irs.income.amt.exemption.amount.JOINT": {
-                "2026-01-01.2026-12-31": 139000,
-                "2027-01-01.2027-12-31": 142500,
-                "2028-01-01.2028-12-31": 145500,
-                "2029-01-01.2029-12-31": 148400,
-                "2030-01-01.2030-12-31": 151300,
-                "2031-01-01.2031-12-31": 154300,
-                "2032-01-01.2032-12-31": 157400,
-                "2033-01-01.2033-12-31": 160500,
-                "2034-01-01.2034-12-31": 163700,
-                "2035-01-01.2100-12-31": 166900,
-            },
-            "gov.irs.income.amt.exemption.amount.SINGLE": {
-                "2026-01-01.2026-12-31": 89400,
-                "2027-01-01.2027-12-31": 91700,
-                "2028-01-01.2028-12-31": 93500,
-                "2029-01-01.2029-12-31": 95400,
-                "2030-01-01.2030-12-31": 97300,
-                "2031-01-01.2031-12-31": 99200,
-                "2032-01-01.2032-12-31": 101200,
-                "2033-01-01.2033-12-31": 103200,
-                "2034-01-01.2034-12-31": 105300,
-                "2035-01-01.2100-12-31": 107300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.rate": {
-                "2026-01-01.2100-12-31": 0.5
-            },
-            "gov.irs.income.amt.exemption.separate_limit": {
-                "2026-01-01.2026-12-31": 639200,
-                "2027-01-01.2027-12-31": 662750,
-                "2028-01-01.2028-12-31": 676350,
-                "2029-01-01.2029-12-31": 689950,
-                "2030-01-01.2030-12-31": 703750,
-                "2031-01-01.2031-12-31": 717650,
-                "2032-01-01.2032-12-31": 731700,
-                "2033-01-01.2033-12-31": 746100,
-                "2034-01-01.2034-12-31": 760950,
-                "2035-01-01.2100-12-31": 776150,
-            },
-            "gov.irs.income.amt.exemption.amount.SEPARATE": {
-                "2026-01-01.2026-12-31": 69600,
-                "2027-01-01.2027-12-31": 71300,
-                "2028-01-01.2028-12-31": 72700,
-                "2029-01-01.2029-12-31": 74200,
-                "2030-01-01.2030-12-31": 75700,
-                "2031-01-01.2031-12-31": 77200,
-                "2032-01-01.2032-12-31": 78700,
-                "2033-01-01.2033-12-31": 80200,
-                "2034-01-01.2034-12-31": 81800,
-                "2035-01-01.2100-12-31": 83500,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 1000000,
-                "2027-01-01.2027-12-31": 1040300,
-                "2028-01-01.2028-12-31": 1061900,
-                "2029-01-01.2029-12-31": 1083100,
-                "2030-01-01.2030-12-31": 1104700,
-                "2031-01-01.2031-12-31": 1126500,
-                "2032-01-01.2032-12-31": 1148600,
-                "2033-01-01.2033-12-31": 1171400,
-                "2034-01-01.2034-12-31": 1194700,
-                "2035-01-01.2100-12-31": 1218300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 500000,
-                "2027-01-01.2027-12-31": 520150,
-                "2028-01-01.2028-12-31": 530950,
-                "2029-01-01.2029-12-31": 541550,
-                "2030-01-01.2030-12-31": 552350,
-                "2031-01-01.2031-12-31": 563250,
-                "2032-01-01.2032-12-31": 574300,
-                "2033-01-01.2033-12-31": 585700,
-                "2034-01-01.2034-12-31": 597350,
-                "2035-01-01.2100-12-31": 609150,
-            },
-            "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 139100,
-                "2027-01-01.2027-12-31": 142500,
-                "2028-01-01.2028-12-31": 145500,
-                "2029-01-01.2029-12-31": 148400,
-                "2030-01-01.2030-12-31": 151300,
-                "2031-01-01.2031-12-31": 154300,
-                "2032-01-01.2032-12-31": 157400,
-                "2033-01-01.2033-12-31": 160500,
-                "2034-01-01.2034-12-31": 163700,
-                "2035-01-01.2100-12-31": 166900,
-            },
-            "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 89400,
-                "2027-01-01.2027-12-31": 91700,
-                "2028-01-01.2028-12-31": 93600,
-                "2029-01-01.2029-12-31": 95400,
-                "2030-01-01.2030-12-31": 97300,
-                "2031-01-01.2031-12-31": 99200,
-                "2032-01-01.2032-12-31": 101200,
-                "2033-01-01.2033-12-31": 103200,
-                "2034-01-01.2034-12-31": 105300,
-                "2035-01-01.2100-12-31": 107300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 500000,
-                "2027-01-01.2027-12-31": 520150,
-                "2028-01-01.2028-12-31": 530950,
-                "2029-01-01.2029-12-31": 541550,
-                "2030-01-01.2030-12-31": 552350,
-                "2031-01-01.2031-12-31": 563250,
-                "2032-01-01.2032-12-31": 574300,
-                "2033-01-01.2033-12-31": 585700,
-                "2034-01-01.2034-12-31": 597350,
-                "2035-01-01.2100-12-31": 609150,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 1000000,
-                "2027-01-01.2027-12-31": 1040300,
-                "2028-01-01.2028-12-31": 1061900,
-                "2029-01-01.2029-12-31": 1083100,
-                "2030-01-01.2030-12-31": 1104700,
-                "2031-01-01.2031-12-31": 1126500,
-                "2032-01-01.2032-12-31": 1148600,
-                "2033-01-01.2033-12-31": 1171400,
-                "2034-01-01.2034-12-31": 1194700,
-                "2035-01-01.2100-12-31": 1218300,
-            },
-            "gov.irs.income.amt.exemption.phase_out.start.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 500000,
-                "2027-01-01.2027-12-31": 520150,
-                "2028-01-01.2028-12-31": 530950,
-                "2029-01-01.2029-12-31": 541550,
-                "2030-01-01.2030-12-31": 552350,
-                "2031-01-01.2031-12-31": 563250,
-                "2032-01-01.2032-12-31": 574300,
-                "2033-01-01.2033-12-31": 585700,
-                "2034-01-01.2034-12-31": 597350,
-                "2035-01-01.2100-12-31": 609150,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.income.amt.exemption.amount.JOINT": {
+            "2026-01-01.2026-12-31": 139000,
+            "2027-01-01.2027-12-31": 142500,
+            "2028-01-01.2028-12-31": 145500,
+            "2029-01-01.2029-12-31": 148400,
+            "2030-01-01.2030-12-31": 151300,
+            "2031-01-01.2031-12-31": 154300,
+            "2032-01-01.2032-12-31": 157400,
+            "2033-01-01.2033-12-31": 160500,
+            "2034-01-01.2034-12-31": 163700,
+            "2035-01-01.2100-12-31": 166900,
+        },
+        "gov.irs.income.amt.exemption.amount.SINGLE": {
+            "2026-01-01.2026-12-31": 89400,
+            "2027-01-01.2027-12-31": 91700,
+            "2028-01-01.2028-12-31": 93500,
+            "2029-01-01.2029-12-31": 95400,
+            "2030-01-01.2030-12-31": 97300,
+            "2031-01-01.2031-12-31": 99200,
+            "2032-01-01.2032-12-31": 101200,
+            "2033-01-01.2033-12-31": 103200,
+            "2034-01-01.2034-12-31": 105300,
+            "2035-01-01.2100-12-31": 107300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.rate": {"2026-01-01.2100-12-31": 0.5},
+        "gov.irs.income.amt.exemption.separate_limit": {
+            "2026-01-01.2026-12-31": 639200,
+            "2027-01-01.2027-12-31": 662750,
+            "2028-01-01.2028-12-31": 676350,
+            "2029-01-01.2029-12-31": 689950,
+            "2030-01-01.2030-12-31": 703750,
+            "2031-01-01.2031-12-31": 717650,
+            "2032-01-01.2032-12-31": 731700,
+            "2033-01-01.2033-12-31": 746100,
+            "2034-01-01.2034-12-31": 760950,
+            "2035-01-01.2100-12-31": 776150,
+        },
+        "gov.irs.income.amt.exemption.amount.SEPARATE": {
+            "2026-01-01.2026-12-31": 69600,
+            "2027-01-01.2027-12-31": 71300,
+            "2028-01-01.2028-12-31": 72700,
+            "2029-01-01.2029-12-31": 74200,
+            "2030-01-01.2030-12-31": 75700,
+            "2031-01-01.2031-12-31": 77200,
+            "2032-01-01.2032-12-31": 78700,
+            "2033-01-01.2033-12-31": 80200,
+            "2034-01-01.2034-12-31": 81800,
+            "2035-01-01.2100-12-31": 83500,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 1000000,
+            "2027-01-01.2027-12-31": 1040300,
+            "2028-01-01.2028-12-31": 1061900,
+            "2029-01-01.2029-12-31": 1083100,
+            "2030-01-01.2030-12-31": 1104700,
+            "2031-01-01.2031-12-31": 1126500,
+            "2032-01-01.2032-12-31": 1148600,
+            "2033-01-01.2033-12-31": 1171400,
+            "2034-01-01.2034-12-31": 1194700,
+            "2035-01-01.2100-12-31": 1218300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 500000,
+            "2027-01-01.2027-12-31": 520150,
+            "2028-01-01.2028-12-31": 530950,
+            "2029-01-01.2029-12-31": 541550,
+            "2030-01-01.2030-12-31": 552350,
+            "2031-01-01.2031-12-31": 563250,
+            "2032-01-01.2032-12-31": 574300,
+            "2033-01-01.2033-12-31": 585700,
+            "2034-01-01.2034-12-31": 597350,
+            "2035-01-01.2100-12-31": 609150,
+        },
+        "gov.irs.income.amt.exemption.amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 139100,
+            "2027-01-01.2027-12-31": 142500,
+            "2028-01-01.2028-12-31": 145500,
+            "2029-01-01.2029-12-31": 148400,
+            "2030-01-01.2030-12-31": 151300,
+            "2031-01-01.2031-12-31": 154300,
+            "2032-01-01.2032-12-31": 157400,
+            "2033-01-01.2033-12-31": 160500,
+            "2034-01-01.2034-12-31": 163700,
+            "2035-01-01.2100-12-31": 166900,
+        },
+        "gov.irs.income.amt.exemption.amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 89400,
+            "2027-01-01.2027-12-31": 91700,
+            "2028-01-01.2028-12-31": 93600,
+            "2029-01-01.2029-12-31": 95400,
+            "2030-01-01.2030-12-31": 97300,
+            "2031-01-01.2031-12-31": 99200,
+            "2032-01-01.2032-12-31": 101200,
+            "2033-01-01.2033-12-31": 103200,
+            "2034-01-01.2034-12-31": 105300,
+            "2035-01-01.2100-12-31": 107300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 500000,
+            "2027-01-01.2027-12-31": 520150,
+            "2028-01-01.2028-12-31": 530950,
+            "2029-01-01.2029-12-31": 541550,
+            "2030-01-01.2030-12-31": 552350,
+            "2031-01-01.2031-12-31": 563250,
+            "2032-01-01.2032-12-31": 574300,
+            "2033-01-01.2033-12-31": 585700,
+            "2034-01-01.2034-12-31": 597350,
+            "2035-01-01.2100-12-31": 609150,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 1000000,
+            "2027-01-01.2027-12-31": 1040300,
+            "2028-01-01.2028-12-31": 1061900,
+            "2029-01-01.2029-12-31": 1083100,
+            "2030-01-01.2030-12-31": 1104700,
+            "2031-01-01.2031-12-31": 1126500,
+            "2032-01-01.2032-12-31": 1148600,
+            "2033-01-01.2033-12-31": 1171400,
+            "2034-01-01.2034-12-31": 1194700,
+            "2035-01-01.2100-12-31": 1218300,
+        },
+        "gov.irs.income.amt.exemption.phase_out.start.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 500000,
+            "2027-01-01.2027-12-31": 520150,
+            "2028-01-01.2028-12-31": 530950,
+            "2029-01-01.2029-12-31": 541550,
+            "2030-01-01.2030-12-31": 552350,
+            "2031-01-01.2031-12-31": 563250,
+            "2032-01-01.2032-12-31": 574300,
+            "2033-01-01.2033-12-31": 585700,
+            "2034-01-01.2034-12-31": 597350,
+            "2035-01-01.2100-12-31": 609150,
+        },
+    }
 
 
+@reform_factory
 def senate_finance_salt_reform():
-    return Reform.from_dict(
-        {
-            "gov.contrib.salt_phase_out.rate": {"2025-01-01.2100-12-31": 0.3},
-            "gov.contrib.salt_phase_out.in_effect": {"2025-01-01.2029-12-31": True},
-            "gov.contrib.salt_phase_out.floor.applies": {"2025-01-01.2029-12-31": True},
-            "gov.contrib.salt_phase_out.threshold.JOINT": {
-                "2025-01-01.2025-12-31": 500000,
-                "2026-01-01.2026-12-31": 505000,
-                "2027-01-01.2027-12-31": 510050,
-                "2028-01-01.2028-12-31": 515151,
-                "2029-01-01.2029-12-31": 520302,
-                "2030-01-01.2030-12-31": 525505,
-                "2031-01-01.2031-12-31": 530760,
-                "2032-01-01.2032-12-31": 536069,
-                "2033-01-01.2100-12-31": 541428,
-            },
-            "gov.contrib.salt_phase_out.threshold.SINGLE": {
-                "2025-01-01.2025-12-31": 500000,
-                "2026-01-01.2026-12-31": 505000,
-                "2027-01-01.2027-12-31": 510050,
-                "2028-01-01.2028-12-31": 515151,
-                "2029-01-01.2029-12-31": 520302,
-                "2030-01-01.2030-12-31": 525505,
-                "2031-01-01.2031-12-31": 530760,
-                "2032-01-01.2032-12-31": 536068,
-                "2033-01-01.2100-12-31": 541428,
-            },
-            "gov.contrib.salt_phase_out.threshold.SEPARATE": {
-                "2025-01-01.2025-12-31": 250000,
-                "2026-01-01.2026-12-31": 252500,
-                "2027-01-01.2027-12-31": 255025,
-                "2028-01-01.2028-12-31": 257575,
-                "2029-01-01.2029-12-31": 260151,
-                "2030-01-01.2030-12-31": 262753,
-                "2031-01-01.2031-12-31": 265380,
-                "2032-01-01.2032-12-31": 268034,
-                "2033-01-01.2100-12-31": 270714,
-            },
-            "gov.contrib.salt_phase_out.threshold.SURVIVING_SPOUSE": {
-                "2025-01-01.2025-12-31": 500000,
-                "2026-01-01.2026-12-31": 505000,
-                "2027-01-01.2027-12-31": 510050,
-                "2028-01-01.2028-12-31": 515151,
-                "2029-01-01.2029-12-31": 520302,
-                "2030-01-01.2030-12-31": 525505,
-                "2031-01-01.2031-12-31": 530760,
-                "2032-01-01.2032-12-31": 536068,
-                "2033-01-01.2100-12-31": 541428,
-            },
-            "gov.contrib.salt_phase_out.threshold.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2025-12-31": 500000,
-                "2026-01-01.2026-12-31": 505000,
-                "2027-01-01.2027-12-31": 510050,
-                "2028-01-01.2028-12-31": 515151,
-                "2029-01-01.2029-12-31": 520302,
-                "2030-01-01.2030-12-31": 525505,
-                "2031-01-01.2031-12-31": 530760,
-                "2032-01-01.2032-12-31": 536068,
-                "2033-01-01.2100-12-31": 541428,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
-                "2025-01-01.2025-12-31": 40000,
-                "2026-01-01.2026-12-31": 40400,
-                "2027-01-01.2027-12-31": 40804,
-                "2028-01-01.2028-12-31": 41212,
-                "2029-01-01.2029-12-31": 41624,
-                "2030-01-01.2100-12-31": 10000,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
-                "2025-01-01.2025-12-31": 40000,
-                "2026-01-01.2026-12-31": 40400,
-                "2027-01-01.2027-12-31": 40804,
-                "2028-01-01.2028-12-31": 41212,
-                "2029-01-01.2029-12-31": 41624,
-                "2030-01-01.2100-12-31": 10000,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
-                "2025-01-01.2025-12-31": 20000,
-                "2026-01-01.2026-12-31": 20200,
-                "2027-01-01.2027-12-31": 20402,
-                "2028-01-01.2028-12-31": 20606,
-                "2029-01-01.2029-12-31": 20812,
-                "2030-01-01.2100-12-31": 5000,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
-                "2025-01-01.2025-12-31": 40000,
-                "2026-01-01.2026-12-31": 40400,
-                "2027-01-01.2027-12-31": 40804,
-                "2028-01-01.2028-12-31": 41212,
-                "2029-01-01.2029-12-31": 41624,
-                "2030-01-01.2100-12-31": 10000,
-            },
-            "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2025-12-31": 40000,
-                "2026-01-01.2026-12-31": 40400,
-                "2027-01-01.2027-12-31": 40804,
-                "2028-01-01.2028-12-31": 41212,
-                "2029-01-01.2029-12-31": 41624,
-                "2030-01-01.2100-12-31": 10000,
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.salt_phase_out.rate": {"2025-01-01.2100-12-31": 0.3},
+        "gov.contrib.salt_phase_out.in_effect": {"2025-01-01.2029-12-31": True},
+        "gov.contrib.salt_phase_out.floor.applies": {"2025-01-01.2029-12-31": True},
+        "gov.contrib.salt_phase_out.threshold.JOINT": {
+            "2025-01-01.2025-12-31": 500000,
+            "2026-01-01.2026-12-31": 505000,
+            "2027-01-01.2027-12-31": 510050,
+            "2028-01-01.2028-12-31": 515151,
+            "2029-01-01.2029-12-31": 520302,
+            "2030-01-01.2030-12-31": 525505,
+            "2031-01-01.2031-12-31": 530760,
+            "2032-01-01.2032-12-31": 536069,
+            "2033-01-01.2100-12-31": 541428,
+        },
+        "gov.contrib.salt_phase_out.threshold.SINGLE": {
+            "2025-01-01.2025-12-31": 500000,
+            "2026-01-01.2026-12-31": 505000,
+            "2027-01-01.2027-12-31": 510050,
+            "2028-01-01.2028-12-31": 515151,
+            "2029-01-01.2029-12-31": 520302,
+            "2030-01-01.2030-12-31": 525505,
+            "2031-01-01.2031-12-31": 530760,
+            "2032-01-01.2032-12-31": 536068,
+            "2033-01-01.2100-12-31": 541428,
+        },
+        "gov.contrib.salt_phase_out.threshold.SEPARATE": {
+            "2025-01-01.2025-12-31": 250000,
+            "2026-01-01.2026-12-31": 252500,
+            "2027-01-01.2027-12-31": 255025,
+            "2028-01-01.2028-12-31": 257575,
+            "2029-01-01.2029-12-31": 260151,
+            "2030-01-01.2030-12-31": 262753,
+            "2031-01-01.2031-12-31": 265380,
+            "2032-01-01.2032-12-31": 268034,
+            "2033-01-01.2100-12-31": 270714,
+        },
+        "gov.contrib.salt_phase_out.threshold.SURVIVING_SPOUSE": {
+            "2025-01-01.2025-12-31": 500000,
+            "2026-01-01.2026-12-31": 505000,
+            "2027-01-01.2027-12-31": 510050,
+            "2028-01-01.2028-12-31": 515151,
+            "2029-01-01.2029-12-31": 520302,
+            "2030-01-01.2030-12-31": 525505,
+            "2031-01-01.2031-12-31": 530760,
+            "2032-01-01.2032-12-31": 536068,
+            "2033-01-01.2100-12-31": 541428,
+        },
+        "gov.contrib.salt_phase_out.threshold.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2025-12-31": 500000,
+            "2026-01-01.2026-12-31": 505000,
+            "2027-01-01.2027-12-31": 510050,
+            "2028-01-01.2028-12-31": 515151,
+            "2029-01-01.2029-12-31": 520302,
+            "2030-01-01.2030-12-31": 525505,
+            "2031-01-01.2031-12-31": 530760,
+            "2032-01-01.2032-12-31": 536068,
+            "2033-01-01.2100-12-31": 541428,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.JOINT": {
+            "2025-01-01.2025-12-31": 40000,
+            "2026-01-01.2026-12-31": 40400,
+            "2027-01-01.2027-12-31": 40804,
+            "2028-01-01.2028-12-31": 41212,
+            "2029-01-01.2029-12-31": 41624,
+            "2030-01-01.2100-12-31": 10000,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SINGLE": {
+            "2025-01-01.2025-12-31": 40000,
+            "2026-01-01.2026-12-31": 40400,
+            "2027-01-01.2027-12-31": 40804,
+            "2028-01-01.2028-12-31": 41212,
+            "2029-01-01.2029-12-31": 41624,
+            "2030-01-01.2100-12-31": 10000,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SEPARATE": {
+            "2025-01-01.2025-12-31": 20000,
+            "2026-01-01.2026-12-31": 20200,
+            "2027-01-01.2027-12-31": 20402,
+            "2028-01-01.2028-12-31": 20606,
+            "2029-01-01.2029-12-31": 20812,
+            "2030-01-01.2100-12-31": 5000,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.SURVIVING_SPOUSE": {
+            "2025-01-01.2025-12-31": 40000,
+            "2026-01-01.2026-12-31": 40400,
+            "2027-01-01.2027-12-31": 40804,
+            "2028-01-01.2028-12-31": 41212,
+            "2029-01-01.2029-12-31": 41624,
+            "2030-01-01.2100-12-31": 10000,
+        },
+        "gov.irs.deductions.itemized.salt_and_real_estate.cap.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2025-12-31": 40000,
+            "2026-01-01.2026-12-31": 40400,
+            "2027-01-01.2027-12-31": 40804,
+            "2028-01-01.2028-12-31": 41212,
+            "2029-01-01.2029-12-31": 41624,
+            "2030-01-01.2100-12-31": 10000,
+        },
+    }
 
 
+@reform_factory
 def senate_finance_exemption_reform():
     """Personal exemption reform from Senate Finance package."""
-    return Reform.from_dict(
-        {"gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0}},
-        country_id="us",
-    )
+    return {"gov.irs.income.exemption.amount": {"2026-01-01.2100-12-31": 0}}
 
 
+@reform_factory
 def senate_finance_ctc_ssn_reform():
     """Child Tax Credit reforms from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.ctc.in_effect": {"2025-01-01.2100-12-31": True},
-            "gov.contrib.reconciliation.ctc.one_person_ssn_req": {
-                "2025-01-01.2100-12-31": True
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.ctc.in_effect": {"2025-01-01.2100-12-31": True},
+        "gov.contrib.reconciliation.ctc.one_person_ssn_req": {
+            "2025-01-01.2100-12-31": True
+        },
+    }
 
 
+@reform_factory
 def senate_finance_ctc_expansion_reform():
     """Child Tax Credit reforms from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.credits.ctc.amount.base[0].amount": {
-                "2025-01-01.2026-12-31": 2200,
-                "2027-01-01.2028-12-31": 2300,
-                "2029-01-01.2030-12-31": 2400,
-                "2031-01-01.2032-12-31": 2500,
-                "2033-01-01.2034-12-31": 2600,
-                "2035-01-01.2100-12-31": 2700,
-            },
-            "gov.irs.credits.ctc.amount.adult_dependent": {
-                "2026-01-01.2100-12-31": 500
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.credits.ctc.refundable.individual_max": {
-                "2026-01-01.2026-12-31": 1700,
-                "2027-01-01.2028-12-31": 1800,
-                "2029-01-01.2031-12-31": 1900,
-                "2032-01-01.2033-12-31": 2000,
-                "2034-01-01.2100-12-31": 2100,
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
-                "2026-01-01.2100-12-31": 200000
-            },
-            "gov.irs.credits.ctc.refundable.phase_in.threshold": {
-                "2026-01-01.2100-12-31": 2500
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 400000
-            },
-            "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 200000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.credits.ctc.amount.base[0].amount": {
+            "2025-01-01.2026-12-31": 2200,
+            "2027-01-01.2028-12-31": 2300,
+            "2029-01-01.2030-12-31": 2400,
+            "2031-01-01.2032-12-31": 2500,
+            "2033-01-01.2034-12-31": 2600,
+            "2035-01-01.2100-12-31": 2700,
+        },
+        "gov.irs.credits.ctc.amount.adult_dependent": {"2026-01-01.2100-12-31": 500},
+        "gov.irs.credits.ctc.phase_out.threshold.JOINT": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.credits.ctc.refundable.individual_max": {
+            "2026-01-01.2026-12-31": 1700,
+            "2027-01-01.2028-12-31": 1800,
+            "2029-01-01.2031-12-31": 1900,
+            "2032-01-01.2033-12-31": 2000,
+            "2034-01-01.2100-12-31": 2100,
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SINGLE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SEPARATE": {
+            "2026-01-01.2100-12-31": 200000
+        },
+        "gov.irs.credits.ctc.refundable.phase_in.threshold": {
+            "2026-01-01.2100-12-31": 2500
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 400000
+        },
+        "gov.irs.credits.ctc.phase_out.threshold.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 200000
+        },
+    }
+
 
+@reform_factory
 def senate_finance_qbid_reform():
     """Qualified Business Income Deduction reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.2},
-            "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
-            "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {
-                "2026-01-01.2100-12-31": 0.25
-            },
-            "gov.irs.deductions.qbi.phase_out.start.JOINT": {
-                "2026-01-01.2026-12-31": 400600
-            },
-            "gov.irs.deductions.qbi.phase_out.length.JOINT": {
-                "2026-01-01.2026-12-31": 150000
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
-                "2026-01-01.2026-12-31": 200300
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SINGLE": {
-                "2026-01-01.2026-12-31": 75000
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
-                "2026-01-01.2026-12-31": 200300
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SEPARATE": {
-                "2026-01-01.2026-12-31": 75000
-            },
-            "gov.irs.deductions.qbi.max.business_property.rate": {
-                "2026-01-01.2100-12-31": 0.025
-            },
-            "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 400600
-            },
-            "gov.irs.deductions.qbi.phase_out.length.SURVIVING_SPOUSE": {
-                "2026-01-01.2026-12-31": 150000
-            },
-            "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 200300
-            },
-            "gov.contrib.reconciliation.qbid.deduction_floor.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-            "gov.irs.deductions.qbi.phase_out.length.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2026-12-31": 75000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.qbi.max.rate": {"2026-01-01.2100-12-31": 0.2},
+        "gov.irs.deductions.qbi.max.w2_wages.rate": {"2026-01-01.2100-12-31": 0.5},
+        "gov.irs.deductions.qbi.max.w2_wages.alt_rate": {"2026-01-01.2100-12-31": 0.25},
+        "gov.irs.deductions.qbi.phase_out.start.JOINT": {
+            "2026-01-01.2026-12-31": 400600
+        },
+        "gov.irs.deductions.qbi.phase_out.length.JOINT": {
+            "2026-01-01.2026-12-31": 150000
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SINGLE": {
+            "2026-01-01.2026-12-31": 200300
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SINGLE": {
+            "2026-01-01.2026-12-31": 75000
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SEPARATE": {
+            "2026-01-01.2026-12-31": 200300
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SEPARATE": {
+            "2026-01-01.2026-12-31": 75000
+        },
+        "gov.irs.deductions.qbi.max.business_property.rate": {
+            "2026-01-01.2100-12-31": 0.025
+        },
+        "gov.irs.deductions.qbi.phase_out.start.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 400600
+        },
+        "gov.irs.deductions.qbi.phase_out.length.SURVIVING_SPOUSE": {
+            "2026-01-01.2026-12-31": 150000
+        },
+        "gov.irs.deductions.qbi.phase_out.start.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 200300
+        },
+        "gov.contrib.reconciliation.qbid.deduction_floor.in_effect": {
+            "2026-01-01.2100-12-31": True
+        },
+        "gov.irs.deductions.qbi.phase_out.length.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2026-12-31": 75000
+        },
+    }
 
 
+@reform_factory
 def senate_finance_estate_tax_reform():
     """Estate tax reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.credits.estate.base": {
-                "2026-01-01.2026-12-31": 15000000,
-                "2027-01-01.2027-12-31": 15600000,
-                "2028-01-01.2028-12-31": 15930000,
-                "2029-01-01.2029-12-31": 16250000,
-                "2030-01-01.2030-12-31": 16570000,
-                "2031-01-01.2031-12-31": 16900000,
-                "2032-01-01.2032-12-31": 17230000,
-                "2033-01-01.2033-12-31": 17570000,
-                "2034-01-01.2034-12-31": 17920000,
-                "2035-01-01.2100-12-31": 18270000,
-            }
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.credits.estate.base": {
+            "2026-01-01.2026-12-31": 15000000,
+            "2027-01-01.2027-12-31": 15600000,
+            "2028-01-01.2028-12-31": 15930000,
+            "2029-01-01.2029-12-31": 16250000,
+            "2030-01-01.2030-12-31": 16570000,
+            "2031-01-01.2031-12-31": 16900000,
+            "2032-01-01.2032-12-31": 17230000,
+            "2033-01-01.2033-12-31": 17570000,
+            "2034-01-01.2034-12-31": 17920000,
+            "2035-01-01.2100-12-31": 18270000,
+        }
+    }
 
 
+@reform_factory
 def senate_finance_misc_reform():
     """Miscellaneous itemized deduction reform from Senate Finance package."""
-    return Reform.from_dict(
-        {"gov.irs.deductions.itemized.misc.applies": {"2026-01-01.2100-12-31": False}},
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.itemized.misc.applies": {"2026-01-01.2100-12-31": False}
+    }
+
 
+@reform_factory
 def senate_finance_charitable_ded_reform():
     """Other itemized deductions reforms from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.JOINT": {
-                "2026-01-01.2100-12-31": 2000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SINGLE": {
-                "2026-01-01.2100-12-31": 1000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SEPARATE": {
-                "2026-01-01.2100-12-31": 1000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.SURVIVING_SPOUSE": {
-                "2026-01-01.2100-12-31": 1000
-            },
-            "gov.irs.deductions.itemized.charity.non_itemizers_amount.HEAD_OF_HOUSEHOLD": {
-                "2026-01-01.2100-12-31": 1000
-            },
-            "gov.irs.deductions.itemized.charity.ceiling.all": {
-                "2026-01-01.2100-12-31": 0.6
-            },
-            "gov.irs.deductions.itemized.charity.ceiling.non_cash": {
-                "2026-01-01.2100-12-31": 0.5
-            },
-            "gov.contrib.reconciliation.charitable_donations.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.JOINT": {
+            "2026-01-01.2100-12-31": 2000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SINGLE": {
+            "2026-01-01.2100-12-31": 1000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SEPARATE": {
+            "2026-01-01.2100-12-31": 1000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.SURVIVING_SPOUSE": {
+            "2026-01-01.2100-12-31": 1000
+        },
+        "gov.irs.deductions.itemized.charity.non_itemizers_amount.HEAD_OF_HOUSEHOLD": {
+            "2026-01-01.2100-12-31": 1000
+        },
+        "gov.irs.deductions.itemized.charity.ceiling.all": {
+            "2026-01-01.2100-12-31": 0.6
+        },
+        "gov.irs.deductions.itemized.charity.ceiling.non_cash": {
+            "2026-01-01.2100-12-31": 0.5
+        },
+        "gov.contrib.reconciliation.charitable_donations.in_effect": {
+            "2026-01-01.2100-12-31": True
+        },
+    }
+
 
+@reform_factory
 def senate_finance_casualty_loss_reform():
     """Other itemized deductions reforms from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.deductions.itemized.casualty.active": {
-                "2026-01-01.2100-12-31": False
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.deductions.itemized.casualty.active": {"2026-01-01.2100-12-31": False},
+    }
+
 
+@reform_factory
 def senate_finance_pease_repeal_reform():
     """PEASE repeal reform from Senate Finance package."""
-    return Reform.from_dict(
-        {"gov.irs.deductions.itemized.reduction.applies": {"2026-01-01.2100-12-31": False}},
-        country_id="us",
-    )
-
-
+    return {
+        "gov.irs.deductions.itemized.reduction.applies": {
+            "2026-01-01.2100-12-31": False
+        }
+    }
 
 
+@reform_factory
 def senate_finance_limitation_on_itemized_deductions_reform():
     """Limitation on itemized deductions reform from Senate Finance package."""
-    return Reform.from_dict(
-        {"gov.contrib.reconciliation.pease.in_effect": {"2026-01-01.2100-12-31": True}},
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.pease.in_effect": {"2026-01-01.2100-12-31": True}
+    }
 
 
+@reform_factory
 def senate_finance_tip_reform():
     """Tip income exemption reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.tip_income_exempt.cap.JOINT": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.in_effect": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.cap.SINGLE": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.cap.SEPARATE": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.phase_out.applies": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.cap.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.cap.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.tip_income_exempt.phase_out.start.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 150000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.tip_income_exempt.cap.JOINT": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.in_effect": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.cap.SINGLE": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.cap.SEPARATE": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.phase_out.applies": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.cap.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.cap.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.tip_income_exempt.phase_out.start.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 150000
+        },
+    }
 
 
+@reform_factory
 def senate_finance_overtime_reform():
     """Overtime income exemption reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.overtime_income_exempt.cap.JOINT": {
-                "2025-01-01.2100-12-31": 25000
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.in_effect": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.cap.SINGLE": {
-                "2025-01-01.2100-12-31": 12500
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.cap.SEPARATE": {
-                "2025-01-01.2100-12-31": 12500
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.phase_out.applies": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.cap.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 12500
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.cap.HEAD_OF_HOUSEHOLD": {
-                "2025-01-01.2100-12-31": 12500
-            },
-            "gov.contrib.reconciliation.overtime_income_exempt.phase_out.start.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 150000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.overtime_income_exempt.cap.JOINT": {
+            "2025-01-01.2100-12-31": 25000
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.in_effect": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.cap.SINGLE": {
+            "2025-01-01.2100-12-31": 12500
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.cap.SEPARATE": {
+            "2025-01-01.2100-12-31": 12500
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.phase_out.applies": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.cap.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 12500
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.cap.HEAD_OF_HOUSEHOLD": {
+            "2025-01-01.2100-12-31": 12500
+        },
+        "gov.contrib.reconciliation.overtime_income_exempt.phase_out.start.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 150000
+        },
+    }
 
 
+@reform_factory
 def senate_finance_senior_deduction_reform():
     """Additional senior standard deduction reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.additional_senior_standard_deduction.amount": {
-                "2025-01-01.2100-12-31": 6000
-            },
-            "gov.contrib.reconciliation.additional_senior_standard_deduction.in_effect": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.additional_senior_standard_deduction.rate.joint[1].rate": {
-                "2025-01-01.2100-12-31": 0.06
-            },
-            "gov.contrib.reconciliation.additional_senior_standard_deduction.rate.other[1].rate": {
-                "2025-01-01.2100-12-31": 0.06
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.additional_senior_standard_deduction.amount": {
+            "2025-01-01.2100-12-31": 6000
+        },
+        "gov.contrib.reconciliation.additional_senior_standard_deduction.in_effect": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.additional_senior_standard_deduction.rate.joint[1].rate": {
+            "2025-01-01.2100-12-31": 0.06
+        },
+        "gov.contrib.reconciliation.additional_senior_standard_deduction.rate.other[1].rate": {
+            "2025-01-01.2100-12-31": 0.06
+        },
+    }
 
 
+@reform_factory
 def senate_finance_auto_loan_reform():
     """Auto loan interest deduction reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.contrib.reconciliation.auto_loan_interest_ald.in_effect": {
-                "2025-01-01.2028-12-31": True
-            },
-            "gov.contrib.reconciliation.auto_loan_interest_ald.senate_version.applies": {
-                "2025-01-01.2100-12-31": True
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.contrib.reconciliation.auto_loan_interest_ald.in_effect": {
+            "2025-01-01.2028-12-31": True
+        },
+        "gov.contrib.reconciliation.auto_loan_interest_ald.senate_version.applies": {
+            "2025-01-01.2100-12-31": True
+        },
+    }
 
 
+@reform_factory
 def senate_finance_cdcc_reform():
     """Child and Dependent Care Credit reform from Senate Finance package."""
-    return Reform.from_dict(
-        {
-            "gov.irs.credits.cdcc.phase_out.max": {"2026-01-01.2100-12-31": 0.5},
-            "gov.irs.credits.cdcc.phase_out.min": {"2026-01-01.2100-12-31": 0.35},
-            "gov.contrib.reconciliation.cdcc.in_effect": {
-                "2026-01-01.2100-12-31": True
-            },
-            "gov.contrib.reconciliation.cdcc.phase_out.second_start.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 75000
-            },
-            "gov.contrib.reconciliation.cdcc.phase_out.second_increment.SURVIVING_SPOUSE": {
-                "2025-01-01.2100-12-31": 2000
-            },
-        },
-        country_id="us",
-    )
+    return {
+        "gov.irs.credits.cdcc.phase_out.max": {"2026-01-01.2100-12-31": 0.5},
+        "gov.irs.credits.cdcc.phase_out.min": {"2026-01-01.2100-12-31": 0.35},
+        "gov.contrib.reconciliation.cdcc.in_effect": {"2026-01-01.2100-12-31": True},
+        "gov.contrib.reconciliation.cdcc.phase_out.second_start.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 75000
+        },
+        "gov.contrib.reconciliation.cdcc.phase_out.second_increment.SURVIVING_SPOUSE": {
+            "2025-01-01.2100-12-31": 2000
+        },
+    }
 
 
+@reform_factory
 def senate_finance_snap_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.usda.snap.takeup_rate": {"2026-01-01.2028-12-31": 0.775},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.usda.snap.takeup_rate": {"2026-01-01.2028-12-31": 0.775},
+    }
 
 
+@reform_factory
 def senate_finance_aca_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.aca.takeup_rate": {"2026-01-01.2028-12-31": 0.655},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.aca.takeup_rate": {"2026-01-01.2028-12-31": 0.655},
+    }
 
 
+@reform_factory
 def senate_finance_medicaid_takeup_reform():
-    return Reform.from_dict(
-        {
-            "gov.hhs.medicaid.takeup_rate": {"2026-01-01.2028-12-31": 0.92},
-        },
-        country_id="us",
-    )
+    return {
+        "gov.hhs.medicaid.takeup_rate": {"2026-01-01.2028-12-31": 0.92},
+    }
+
+
+# Senate Finance reform components, in stacking order
+SENATE_FINANCE_REFORMS = ReformRegistry(
+    {
+        "Tax Rate Reform": senate_finance_tax_rate_reform,
+        "Standard Deduction Reform": senate_finance_sd_reform,
+        "Exemption Reform": senate_finance_exemption_reform,
+        "Child tax credit social security number requirement": senate_finance_ctc_ssn_reform,
+        "Child tax credit expansion": senate_finance_ctc_expansion_reform,
+        "Qualified business interest deduction reform": senate_finance_qbid_reform,
+        "Alternative minimum tax reform": senate_finance_amt_reform,
+        "Miscellaneous deduction reform": senate_finance_misc_reform,
+        "Charitable deductions reform": senate_finance_charitable_ded_reform,
+        "Casualty loss deduction repeal": senate_finance_casualty_loss_reform,
+        "Pease repeal": senate_finance_pease_repeal_reform,
+        "Limitation on itemized deductions reform": senate_finance_limitation_on_itemized_deductions_reform,
+        "Estate tax reform": senate_finance_estate_tax_reform,
+        "New senior deduction": senate_finance_senior_deduction_reform,
+        "Tip exemption": senate_finance_tip_reform,
+        "Overtime exemption": senate_finance_overtime_reform,
+        "Auto loan interest deduction": senate_finance_auto_loan_reform,
+        "Cap on state and local tax deduction": senate_finance_salt_reform,
+        "Child and dependent care credit reform": senate_finance_cdcc_reform,
+        "SNAP reform": senate_finance_snap_takeup_reform,
+        "ACA reform": senate_finance_aca_takeup_reform,
+        "Medicaid reform": senate_finance_medicaid_takeup_reform,
+    },
+)
 
 
 def get_all_senate_finance_reforms():
-    """Get dictionary of all Senate Finance reform components."""
+    """Get the registry of all Senate Finance reform components."""
+    return SENATE_FINANCE_REFORMS
+
+
+# Reform packages and baselines by the names used on the command line
+PACKAGES = {"house": get_all_reforms, "senate": get_all_senate_finance_reforms}
+BASELINES = {"current_law": current_law_baseline, "tcja": tcja_reform}
+
+
+def select_reforms(reforms, names=None, through=None):
+    """
+    Select part of a reform stack, keeping the stacking order.
+
+    Parameters:
+    -----------
+    reforms : dict or ReformRegistry
+        Dictionary of reform names to Reform objects
+    names : list, optional
+        Keep only these reforms. Names not in reforms are ignored.
+    through : str, optional
+        Keep the stack up to and including this reform
+
+    Returns:
+    --------
+    dict
+        The selected reforms. Only these are built from a registry.
+    """
+    selected = list(reforms)
+    if through is not None:
+        if through not in selected:
+            raise ValueError(f"No reform named '{through}' in {list(reforms)}")
+        selected = selected[: selected.index(through) + 1]
+    if names is not None:
+        selected = [name for name in selected if name in names]
+    return {name: reforms[name] for name in selected}
+
+
+def reform_parameter_dicts(reform):
+    """
+    List the parameter dictionaries applied by a reform, in application order.
+
+    Stacked reforms are nested tuples such as ((baseline, reform_1), reform_2),
+    which are flattened depth-first.
+    """
+    if isinstance(reform, (tuple, list)):
+        return [
+            parameters for part in reform for parameters in reform_parameter_dicts(part)
+        ]
+    return [reform.parameter_values]
+
+
+def _period_interval(period_key):
+    """
+    Parse a Reform.from_dict period key into an inclusive (start, stop) date
+    interval. Ranges such as "2026-01-01.2026-12-31" are bounded; bare
+    instants such as "2026-01-01" apply from that date onward (stop is None).
+    """
+    try:
+        if "." in period_key:
+            start, stop = period_key.split(".")
+            return date.fromisoformat(start), date.fromisoformat(stop)
+        parts = period_key.split("-") + ["01", "01"]
+        return date(*map(int, parts[:3])), None
+    except ValueError:
+        raise ValueError(f"Cannot merge reform period key '{period_key}'")
+
+
+def _period_key(start, stop):
+    if stop is None:
+        return start.isoformat()
+    return f"{start.isoformat()}.{stop.isoformat()}"
+
+
+def merge_parameter_dicts(parameter_dicts):
+    """
+    Merge Reform.from_dict parameter dictionaries into one equivalent dictionary.
+
+    Dictionaries are taken in application order. Where a later value's date
+    range overlaps an earlier value of the same parameter, the later value
+    wins: the earlier range is trimmed to the dates it still governs, or
+    dropped if it is fully covered. The result applies the same values as
+    applying the dictionaries one after another.
+
+    Parameters:
+    -----------
+    parameter_dicts : list
+        Dictionaries of parameter path -> {period key: value}
+
+    Returns:
+    --------
+    dict
+        Merged dictionary with non-overlapping period keys per parameter
+    """
+    # Parameter path -> list of disjoint (start, stop, value) intervals
+    merged = {}
+    for parameter_values in parameter_dicts:
+        for path, period_values in parameter_values.items():
+            if not isinstance(period_values, dict):
+                raise ValueError(f"Cannot merge scalar reform value for '{path}'")
+            # Reform.from_dict applies a parameter's entries by start date
+            updates = sorted(
+                (
+                    _period_interval(str(key)) + (value,)
+                    for key, value in period_values.items()
+                ),
+                key=lambda update: update[0],
+            )
+            intervals = merged.setdefault(path, [])
+            for start, stop, value in updates:
+                remaining = []
+                for old_start, old_stop, old_value in intervals:
+                    overlaps = (stop is None or old_start <= stop) and (
+                        old_stop is None or start <= old_stop
+                    )
+                    if not overlaps:
+                        remaining.append((old_start, old_stop, old_value))
+                        continue
+                    if old_start < start:
+                        remaining.append(
+                            (old_start, start - timedelta(days=1), old_value)
+                        )
+                    if stop is not None and (old_stop is None or stop < old_stop):
+                        remaining.append(
+                            (stop + timedelta(days=1), old_stop, old_value)
+                        )
+                remaining.append((start, stop, value))
+                intervals[:] = remaining
+
     return {
-        "Tax Rate Reform": senate_finance_tax_rate_reform(),
-        "Standard Deduction Reform": senate_finance_sd_reform(),
-        "Exemption Reform": senate_finance_exemption_reform(),
-        "Child tax credit social security number requirement": senate_finance_ctc_ssn_reform(),
-        "Child tax credit expansion": senate_finance_ctc_expansion_reform(),
-        "Qualified business interest deduction reform": senate_finance_qbid_reform(),
-        "Alternative minimum tax reform": senate_finance_amt_reform(),
-        "Miscellaneous deduction reform": senate_finance_misc_reform(),
-        "Charitable deductions reform": senate_finance_charitable_ded_reform(),
-        "Casualty loss deduction repeal": senate_finance_casualty_loss_reform(),
-        "Pease repeal": senate_finance_pease_repeal_reform(),
-        "Limitation on itemized deductions reform": senate_finance_limitation_on_itemized_deductions_reform(),
-        "Estate tax reform": senate_finance_estate_tax_reform(),
-        "New senior deduction": senate_finance_senior_deduction_reform(),
-        "Tip exemption": senate_finance_tip_reform(),
-        "Overtime exemption": senate_finance_overtime_reform(),
-        "Auto loan interest deduction": senate_finance_auto_loan_reform(),
-        "Cap on state and local tax deduction": senate_finance_salt_reform(),
-        "Child and dependent care credit reform": senate_finance_cdcc_reform(),
-        "SNAP reform": senate_finance_snap_takeup_reform(),
-        "ACA reform": senate_finance_aca_takeup_reform(),
-        "Medicaid reform": senate_finance_medicaid_takeup_reform(),
+        path: {
+            _period_key(start, stop): value
+            for start, stop, value in sorted(intervals, key=lambda i: i[0])
+        }
+        for path, intervals in merged.items()
+        if intervals
     }
+
+
+def merge_reforms(*reforms):
+    """
+    Combine stacked reforms into a single flat reform.
+
+    Applying the merged reform gives the same parameters as applying the
+    reforms one after another, but builds the tax-benefit system in one pass
+    instead of once per stacked layer.
+
+    Parameters:
+    -----------
+    *reforms : Reform or tuple
+        Reforms in application order. Nested tuples of stacked reforms are
+        flattened.
+
+    Returns:
+    --------
+    Reform
+        One reform applying every parameter change
+    """
+    return reform_class().from_dict(
+        merge_parameter_dicts(reform_parameter_dicts(reforms)), country_id="us"
+    )
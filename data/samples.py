@@ -0,0 +1,129 @@
+"""
+Sample tiers of household results for the web app's progressive loader.
+
+The loader first fetches small samples of each result set from
+static/samples/ and then the full CSV. All tiers are drawn in one pass over
+the results: every household gets one weighted random key (Efraimidis-
+Spirakis reservoir sampling, where a household of weight w is kept with
+key u ** (1 / w)), and each tier takes the households with the largest keys
+within each Market Income bracket. Samples are therefore weight-aware,
+nested (every micro household is also in the small sample, and so on) and
+reproducible from the seed.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "static", "samples")
+
+# Households per tier, matching the loader's sample files
+SAMPLE_SIZES = {"micro": 200, "small": 1_000, "medium": 5_000, "large": 20_000}
+
+# Upper edges of the Market Income brackets, each given an equal share of
+# every tier. Negative incomes fall in the lowest bracket.
+INCOME_BRACKETS = [25_000, 50_000, 100_000, 200_000]
+
+SEED = 0
+
+
+def reservoir_keys(weights, seed=SEED):
+    """
+    Weighted reservoir sampling keys, in log space for numerical stability.
+
+    Taking the k largest keys gives a weighted sample without replacement.
+    Households with no weight get -inf and are only taken once every
+    weighted household of their bracket is.
+    """
+    rng = np.random.default_rng(seed)
+    u = rng.random(len(weights))
+    with np.errstate(divide="ignore"):
+        return np.log(u) / np.asarray(weights, dtype=np.float64)
+
+
+def sample_tier_rows(market_income, weights, sizes=SAMPLE_SIZES, seed=SEED):
+    """
+    Choose the rows of every sample tier.
+
+    Parameters:
+    -----------
+    market_income : np.ndarray
+        Market Income of each household, used for stratification
+    weights : np.ndarray
+        Household weights
+    sizes : dict
+        Tier names to sample sizes
+    seed : int
+        Seed of the random keys
+
+    Returns:
+    --------
+    dict
+        Tier names to sorted row positions
+    """
+    market_income = np.nan_to_num(np.asarray(market_income, dtype=np.float64))
+    keys = reservoir_keys(np.clip(np.nan_to_num(weights), 0, None), seed)
+    brackets = np.digitize(market_income, INCOME_BRACKETS)
+    n_brackets = len(INCOME_BRACKETS) + 1
+
+    # Rows ordered by bracket, then by descending key, so the best rows of
+    # each bracket are one contiguous slice
+    order = np.lexsort((-keys, brackets))
+    starts = np.searchsorted(brackets[order], np.arange(n_brackets))
+    ends = np.append(starts[1:], len(order))
+
+    tiers = {}
+    for tier, size in sizes.items():
+        per_bracket = size // n_brackets
+        rows = np.concatenate(
+            [
+                order[start : min(start + per_bracket, end)]
+                for start, end in zip(starts, ends)
+            ]
+        )
+        tiers[tier] = np.sort(rows)
+    return tiers
+
+
+def write_sample_tiers(
+    results, output_name, directory=SAMPLES_DIR, sizes=SAMPLE_SIZES, seed=SEED
+):
+    """
+    Write every sample tier of a result set as CSV.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+    output_name : str
+        Name of the full results file, without extension
+    directory : str
+        Directory to write the samples to
+    sizes : dict
+        Tier names to sample sizes
+    seed : int
+        Seed of the random keys
+
+    Returns:
+    --------
+    list
+        Paths of the written files
+    """
+    os.makedirs(directory, exist_ok=True)
+    tiers = sample_tier_rows(
+        results["Market Income"], results["Household Weight"], sizes, seed
+    )
+    # Tiers are nested, so the largest one holds every row needed
+    all_rows = np.unique(np.concatenate(list(tiers.values())))
+    sampled = pd.DataFrame(
+        {column: np.asarray(results[column])[all_rows] for column in results.columns}
+    )
+
+    paths = []
+    basename = os.path.basename(output_name)
+    for tier, rows in tiers.items():
+        path = os.path.join(directory, f"{basename}_sample_{tier}.csv")
+        sampled.iloc[np.searchsorted(all_rows, rows)].to_csv(path, index=False)
+        paths.append(path)
+    return paths
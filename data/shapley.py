@@ -0,0 +1,275 @@
+"""
+Order-independent attribution of reform impacts with sampled Shapley values.
+
+The stacked analysis credits each reform with the change it makes on top of
+the reforms before it in the package, so its impact depends on its
+position. The Shapley value instead averages a reform's marginal change
+over every order the reforms could be stacked in. With 20+ reforms that is
+too many orders, so they are sampled: the estimate for each household is
+the mean marginal change over random permutations, and its standard error
+shows how far it has converged.
+
+Every permutation of n reforms visits n + 1 reform subsets (its prefixes).
+A subset is simulated once and memoized under its canonical key, the sorted
+positions of its reforms in the package, whichever permutation reached it.
+Permutations are processed in lexicographic order, so consecutive ones
+share prefixes, and each subset is dropped from memory after the last
+permutation that uses it. The order bounds how many subsets are held at
+once; every subset is simulated once whatever the order.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from analysis import DATASET, calculate_baseline_snapshot, simulate_step
+from output import write_results
+from reforms import merge_reforms
+
+# Measures attributed to each reform, as (output label, subset value key)
+MEASURES = {
+    "federal tax liability": "income_tax",
+    "state tax liability": "state_income_tax",
+    "benefits": "total_benefits",
+    "net income": "net_income",
+}
+
+
+@dataclass
+class ShapleyAttribution:
+    """
+    Sampled Shapley attributions of a reform package.
+
+    households has the baseline household columns, then for every reform
+    and measure the estimated "Shapley change in <measure> from <reform>",
+    the "Standard error of Shapley change in net income from <reform>", and
+    the total changes. The attributions of each household add up exactly to
+    its total change.
+
+    diagnostics has one row per reform with the weighted total attribution
+    of each measure, the standard error of the net income total across
+    permutations, and the mean household standard error.
+
+    convergence has the running estimate of each reform's weighted total
+    net income attribution after each permutation.
+    """
+
+    households: pd.DataFrame
+    diagnostics: pd.DataFrame
+    convergence: pd.DataFrame
+    permutations: int
+    subsets_simulated: int
+    subsets_reused: int
+
+
+def sample_permutations(n_reforms, n_permutations, seed=0):
+    """
+    Draw random reform orders, sorted lexicographically so consecutive
+    orders share the longest possible prefixes and memoized subsets can be
+    dropped soon after their last use.
+    """
+    rng = np.random.default_rng(seed)
+    permutations = [tuple(rng.permutation(n_reforms)) for _ in range(n_permutations)]
+    return sorted(permutations)
+
+
+def _subset_key(reforms):
+    return tuple(sorted(reforms))
+
+
+def _last_uses(permutations):
+    """Index of the last permutation each subset is needed by."""
+    last_use = {}
+    for index, permutation in enumerate(permutations):
+        for size in range(len(permutation) + 1):
+            last_use[_subset_key(permutation[:size])] = index
+    return last_use
+
+
+def _subset_values(values):
+    """The measures of one simulation, as household arrays."""
+    return {
+        "income_tax": values["income_tax"],
+        "state_income_tax": values["state_income_tax"],
+        "total_benefits": values["medicaid"]
+        + values["aca_ptc"]
+        + values["chip"]
+        + values["household_benefits"],
+        "net_income": values["household_net_income_including_health_benefits"],
+    }
+
+
+def calculate_shapley_household_impacts(
+    reforms,
+    baseline_reform,
+    year,
+    n_permutations=32,
+    seed=0,
+    baseline=None,
+    dataset=DATASET,
+    cache=None,
+):
+    """
+    Attribute each household's total change to the reforms by sampled
+    Shapley values.
+
+    A subset of reforms is simulated as the baseline plus its reforms
+    merged in package order, so reforms that set the same parameter keep
+    the precedence they have in the full stack.
+
+    Parameters:
+    -----------
+    reforms : dict
+        Dictionary of reform names to Reform objects
+    baseline_reform : Reform
+        The baseline reform to compare against
+    year : int
+        Tax year to analyze
+    n_permutations : int
+        Number of random reform orders to average over
+    seed : int
+        Seed of the random orders
+    baseline : BaselineSnapshot, optional
+        Precomputed baseline for year, e.g. shared with stacked analyses
+    dataset : str or SyntheticDataset
+        Dataset to simulate
+    cache : SimulationCache, optional
+        On-disk cache of simulation outputs, shared with stacked runs
+
+    Returns:
+    --------
+    ShapleyAttribution
+        Household attributions and convergence diagnostics
+    """
+    if n_permutations < 1:
+        raise ValueError(f"Need at least 1 permutation, not {n_permutations}")
+    if baseline is None:
+        baseline = calculate_baseline_snapshot(baseline_reform, year, dataset)
+    reform_names = list(reforms)
+    reform_list = list(reforms.values())
+    n_reforms = len(reform_list)
+    n_households = len(baseline.income_tax)
+    weights = np.asarray(baseline.household_columns["Household Weight"])
+
+    permutations = sample_permutations(n_reforms, n_permutations, seed)
+    last_use = _last_uses(permutations)
+    memo = {
+        (): {
+            "income_tax": baseline.income_tax,
+            "state_income_tax": baseline.state_income_tax,
+            "total_benefits": baseline.total_benefits,
+            "net_income": baseline.net_income,
+        }
+    }
+    simulated = 0
+    reused = 0
+
+    def subset_value(subset):
+        nonlocal simulated, reused
+        key = _subset_key(subset)
+        if key in memo:
+            reused += 1
+        else:
+            simulated += 1
+            print(
+                f"Simulating {len(key)} of {n_reforms} reforms "
+                f"({simulated} subsets so far)..."
+            )
+            merged = merge_reforms(baseline_reform, *(reform_list[i] for i in key))
+            memo[key] = _subset_values(simulate_step(merged, year, dataset, cache))
+        return memo[key]
+
+    # Running sums of marginal changes, per reform, measure and household
+    sums = {
+        measure: np.zeros((n_reforms, n_households)) for measure in MEASURES.values()
+    }
+    net_income_squares = np.zeros((n_reforms, n_households))
+    # Weighted total net income marginal of each reform in each permutation
+    weighted_marginals = np.zeros((n_permutations, n_reforms))
+
+    for index, permutation in enumerate(permutations):
+        previous = memo[()]
+        for size, reform in enumerate(permutation, 1):
+            current = subset_value(permutation[:size])
+            for measure in MEASURES.values():
+                sums[measure][reform] += current[measure] - previous[measure]
+            marginal = current["net_income"] - previous["net_income"]
+            net_income_squares[reform] += marginal**2
+            weighted_marginals[index, reform] = weights @ marginal
+            previous = current
+        # Drop subsets no later permutation visits; the baseline stays
+        for size in range(1, n_reforms + 1):
+            key = _subset_key(permutation[:size])
+            if key in memo and last_use[key] == index:
+                del memo[key]
+
+    means = {measure: sums[measure] / n_permutations for measure in MEASURES.values()}
+    # Standard error of each household's mean net income marginal
+    if n_permutations > 1:
+        variance = (net_income_squares - n_permutations * means["net_income"] ** 2) / (
+            n_permutations - 1
+        )
+        household_se = np.sqrt(np.maximum(variance, 0) / n_permutations)
+        total_se = weighted_marginals.std(axis=0, ddof=1) / np.sqrt(n_permutations)
+    else:
+        household_se = np.full((n_reforms, n_households), np.nan)
+        total_se = np.full(n_reforms, np.nan)
+
+    results = dict(baseline.household_columns)
+    for i, reform_name in enumerate(reform_names):
+        for label, measure in MEASURES.items():
+            results[f"Shapley change in {label} from {reform_name}"] = means[measure][i]
+        results[
+            f"Standard error of Shapley change in net income from {reform_name}"
+        ] = household_se[i]
+    # Every permutation ends with the full stack
+    full = previous
+    for label, measure in MEASURES.items():
+        results[f"Total change in {label}"] = full[measure] - memo[()][measure]
+
+    diagnostics = pd.DataFrame({"Reform": reform_names})
+    for label, measure in MEASURES.items():
+        diagnostics[f"Weighted total change in {label}"] = weights @ means[measure].T
+    diagnostics["Standard error of weighted total change in net income"] = total_se
+    diagnostics["Mean household standard error of net income change"] = (
+        household_se.mean(axis=1)
+    )
+
+    running = (
+        np.cumsum(weighted_marginals, axis=0)
+        / np.arange(1, n_permutations + 1)[:, None]
+    )
+    convergence = pd.DataFrame(running, columns=reform_names)
+    convergence.insert(0, "Permutations", np.arange(1, n_permutations + 1))
+
+    print(
+        f"Simulated {simulated} reform subsets for {n_permutations} permutations, "
+        f"reusing memoized subsets {reused} times"
+    )
+    return ShapleyAttribution(
+        households=pd.DataFrame(results),
+        diagnostics=diagnostics,
+        convergence=convergence,
+        permutations=n_permutations,
+        subsets_simulated=simulated,
+        subsets_reused=reused,
+    )
+
+
+def write_shapley(attribution, output_name, formats=("csv",)):
+    """
+    Write Shapley attributions, with their diagnostics and convergence
+    tables as CSV.
+
+    Returns:
+    --------
+    list
+        Paths of the written files
+    """
+    paths = write_results(attribution.households, output_name + "_shapley", formats)
+    for table in ["diagnostics", "convergence"]:
+        path = f"{output_name}_shapley_{table}.csv"
+        getattr(attribution, table).to_csv(path, index=False)
+        paths.append(path)
+    return paths
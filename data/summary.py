@@ -0,0 +1,230 @@
+"""
+Weighted distributional summaries of household results.
+
+For every stacked reform step, and for the total change from the baseline,
+each measure (federal tax, state tax, benefits and net income) is
+summarized over all households, by Market Income decile and by State: the
+weighted number of households, the weighted total and average change, and
+the weighted shares of households whose value rises or falls. For net
+income those shares are the winners and losers.
+
+Rows are sorted by group once per grouping, and every step is then reduced
+with one np.add.reduceat over a weighted value matrix, instead of a groupby
+per column.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+MEASURES = [
+    "federal tax liability",
+    "state tax liability",
+    "benefits",
+    "net income",
+]
+
+# Reform name given to the total change from the baseline
+TOTAL = "Total"
+
+# Summary format -> file suffix
+SUMMARY_FORMATS = {"json": "_summary.json", "parquet": "_summary.parquet"}
+
+
+def reform_steps(columns):
+    """
+    Find the reform steps of a result set.
+
+    Returns:
+    --------
+    dict
+        Reform names, in stacking order and ending with TOTAL, to the change
+        column of each measure
+    """
+    steps = {}
+    prefix = f"Change in {MEASURES[0]} after "
+    for column in columns:
+        if column.startswith(prefix):
+            reform_name = column[len(prefix) :]
+            steps[reform_name] = [
+                f"Change in {measure} after {reform_name}" for measure in MEASURES
+            ]
+    steps[TOTAL] = [f"Total change in {measure}" for measure in MEASURES]
+    return steps
+
+
+def weighted_deciles(values, weights):
+    """
+    Zero-based weighted decile of each value, so each decile holds a tenth
+    of the total weight.
+    """
+    order = np.argsort(values, kind="stable")
+    cumulative = np.cumsum(weights[order])
+    total = cumulative[-1] if len(cumulative) else 0
+    deciles = np.zeros(len(values), dtype=np.int64)
+    if total > 0:
+        # Decile of the midpoint of each household's weight
+        midpoint = (cumulative - weights[order] / 2) / total
+        deciles[order] = np.minimum((midpoint * 10).astype(np.int64), 9)
+    return deciles
+
+
+class Grouping:
+    """
+    Households sorted once by group, for reducing any number of columns.
+
+    Parameters:
+    -----------
+    groups : np.ndarray
+        Zero-based group of each household
+    labels : list
+        Label of each group
+    """
+
+    def __init__(self, groups, labels):
+        self.labels = list(labels)
+        self.order = np.argsort(groups, kind="stable")
+        sorted_groups = groups[self.order]
+        self.present, self.starts = np.unique(sorted_groups, return_index=True)
+
+    def sums(self, values):
+        """Sum each column of a (households, columns) matrix within groups."""
+        sums = np.zeros((len(self.labels), values.shape[1]))
+        if len(self.starts):
+            sums[self.present] = np.add.reduceat(
+                values[self.order], self.starts, axis=0
+            )
+        return sums
+
+
+def summarize_household_impacts(results):
+    """
+    Summarize every reform step of a result set.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per reform, measure and group, with columns reform, measure,
+        grouping ("all", "decile" or "state"), group, households,
+        total_change, average_change, share_increase and share_decrease
+    """
+    weights = np.nan_to_num(np.asarray(results["Household Weight"], np.float64))
+    market_income = np.nan_to_num(np.asarray(results["Market Income"], np.float64))
+    states, state_groups = np.unique(
+        np.asarray(results["State"]).astype(str), return_inverse=True
+    )
+    groupings = {
+        "all": Grouping(np.zeros(len(weights), dtype=np.int64), ["all"]),
+        "decile": Grouping(
+            weighted_deciles(market_income, weights), [str(i) for i in range(1, 11)]
+        ),
+        "state": Grouping(state_groups.ravel(), states),
+    }
+
+    grouped_weights = {
+        name: grouping.sums(weights[:, None]) for name, grouping in groupings.items()
+    }
+    frames = []
+    for reform_name, columns in reform_steps(results.columns).items():
+        changes = np.column_stack(
+            [np.asarray(results[column], np.float64) for column in columns]
+        )
+        # Weighted change, increase and decrease indicators side by side, so
+        # each grouping needs one reduction per step
+        weighted = np.hstack(
+            [
+                weights[:, None] * changes,
+                weights[:, None] * (changes > 0),
+                weights[:, None] * (changes < 0),
+            ]
+        )
+        n_measures = len(MEASURES)
+        for name, grouping in groupings.items():
+            sums = grouping.sums(weighted)
+            households = grouped_weights[name]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                shares = np.where(households > 0, sums / households, 0)
+            n_groups = len(grouping.labels)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "reform": reform_name,
+                        "measure": np.tile(MEASURES, n_groups),
+                        "grouping": name,
+                        "group": np.repeat(grouping.labels, n_measures),
+                        "households": np.repeat(households[:, 0], n_measures),
+                        "total_change": sums[:, :n_measures].ravel(),
+                        "average_change": shares[:, :n_measures].ravel(),
+                        "share_increase": shares[
+                            :, n_measures : 2 * n_measures
+                        ].ravel(),
+                        "share_decrease": shares[:, 2 * n_measures :].ravel(),
+                    }
+                )
+            )
+    return pd.concat(frames, ignore_index=True)
+
+
+def summary_json(summary):
+    """
+    Nest a summary table as reform -> measure -> grouping -> group -> values.
+    """
+    values = ["households", "total_change", "average_change"]
+    values += ["share_increase", "share_decrease"]
+    nested = {}
+    for row in summary.itertuples(index=False):
+        reform = nested.setdefault(row.reform, {})
+        measure = reform.setdefault(row.measure, {})
+        group_values = {value: round(float(getattr(row, value)), 4) for value in values}
+        if row.grouping == "all":
+            measure.update(group_values)
+        else:
+            measure.setdefault(f"by_{row.grouping}", {})[row.group] = group_values
+    return nested
+
+
+def write_summary(results, output_name, formats=("json",)):
+    """
+    Summarize a result set and write the summary in one or more formats.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame or ColumnSink
+        Household results from calculate_stacked_household_impacts
+    output_name : str
+        Output path of the results, without extension
+    formats : list
+        Names from SUMMARY_FORMATS to write
+
+    Returns:
+    --------
+    list
+        Paths of the written files
+    """
+    if not formats:
+        return []
+    summary = summarize_household_impacts(results)
+    paths = []
+    for summary_format in formats:
+        path = output_name + SUMMARY_FORMATS[summary_format]
+        if summary_format == "json":
+            with open(path, "w") as f:
+                json.dump(summary_json(summary), f, separators=(",", ":"))
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError(
+                    f"Writing {summary_format} requires pyarrow: pip install pyarrow"
+                )
+            table = pa.Table.from_pandas(summary, preserve_index=False)
+            pq.write_table(table, path, compression="zstd")
+        paths.append(path)
+    return paths
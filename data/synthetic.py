@@ -0,0 +1,348 @@
+"""
+Synthetic stand-in for policyengine_us.Microsimulation.
+
+SyntheticDataset generates a population of households, tax units and
+persons in process, at any scale, so the analysis can be benchmarked and
+exercised without downloading the Enhanced CPS or running the real model.
+Pass it wherever the analysis functions take a dataset:
+
+    calculate_stacked_household_impacts(reforms, baseline, 2026,
+                                        dataset=SyntheticDataset(100_000))
+
+Every value is a hash of the seed and the household's position, so
+household i is the same whatever the number of households, or whichever
+subset of households it is simulated in (see datasets.py), and a reform
+shifts taxes and benefits by an amount derived from its parameter values.
+The numbers are plausible in shape only; they are not tax calculations.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from reforms import reform_parameter_dicts
+
+# Rough shares of US households by state
+STATE_SHARES = {
+    "AL": 1.5, "AK": 0.2, "AZ": 2.2, "AR": 0.9, "CA": 10.5, "CO": 1.8,
+    "CT": 1.1, "DE": 0.3, "DC": 0.2, "FL": 6.7, "GA": 3.1, "HI": 0.4,
+    "ID": 0.5, "IL": 3.8, "IN": 2.0, "IA": 1.0, "KS": 0.9, "KY": 1.4,
+    "LA": 1.4, "ME": 0.4, "MD": 1.8, "MA": 2.1, "MI": 3.1, "MN": 1.7,
+    "MS": 0.9, "MO": 1.9, "MT": 0.3, "NE": 0.6, "NV": 0.9, "NH": 0.4,
+    "NJ": 2.6, "NM": 0.6, "NY": 5.8, "NC": 3.2, "ND": 0.2, "OH": 3.6,
+    "OK": 1.2, "OR": 1.3, "PA": 4.0, "RI": 0.3, "SC": 1.6, "SD": 0.3,
+    "TN": 2.1, "TX": 8.1, "UT": 0.8, "VT": 0.2, "VA": 2.5, "WA": 2.3,
+    "WV": 0.6, "WI": 1.8, "WY": 0.2,
+}  # fmt: skip
+
+SSN_CARD_TYPES = {
+    "CITIZEN": 0.90,
+    "NON_CITIZEN_VALID_EAD": 0.04,
+    "OTHER_NON_CITIZEN": 0.03,
+    "NONE": 0.03,
+}
+
+# Income variables: share of households with any, and their median amount
+INCOME_SOURCES = {
+    "irs_employment_income": (0.70, 52_000),
+    "self_employment_income": (0.10, 18_000),
+    "capital_gains": (0.08, 6_000),
+    "dividend_income": (0.15, 2_000),
+    "farm_income": (0.01, 10_000),
+    "taxable_interest_income": (0.30, 500),
+    "rental_income": (0.05, 9_000),
+    "taxable_unemployment_compensation": (0.03, 5_000),
+    "miscellaneous_income": (0.05, 1_000),
+    "taxable_retirement_distributions": (0.10, 12_000),
+    "taxable_pension_income": (0.12, 18_000),
+    "social_security": (0.28, 21_000),
+    "tip_income": (0.03, 6_000),
+    "fsla_overtime_premium": (0.08, 3_000),
+    "auto_loan_interest": (0.20, 1_500),
+    "real_estate_taxes": (0.45, 3_500),
+}
+
+# Yearly uprating of monetary values from 2024
+UPRATING = 0.03
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _uniform(keys, stream, seed):
+    """
+    Uniform [0, 1) values from a SplitMix64 hash of each key, independent
+    across streams and seeds.
+    """
+    x = np.asarray(keys, dtype=np.uint64) * _MIX
+    x += np.uint64((seed * 0x1000193 + stream * 0x9E37) & 0xFFFFFFFFFFFFFFFF)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return (x >> np.uint64(11)).astype(np.float64) / 2.0**53
+
+
+def _choice(options, u):
+    """Pick positions in a dict of option shares with uniform values u."""
+    shares = np.array(list(options.values()), dtype=np.float64)
+    cumulative = np.cumsum(shares) / shares.sum()
+    return np.minimum(np.searchsorted(cumulative, u, side="right"), len(shares) - 1)
+
+
+def _lognormal(u1, u2, median, sigma=1.0):
+    """Lognormal values from two uniforms, by the Box-Muller transform."""
+    normal = np.sqrt(-2 * np.log1p(-u1)) * np.cos(2 * np.pi * u2)
+    return median * np.exp(sigma * normal)
+
+
+@lru_cache(maxsize=2)
+def _population(n_households, seed):
+    """Household, tax unit and person arrays of a synthetic dataset."""
+    households = np.arange(n_households, dtype=np.uint64)
+
+    # Tax units: most households have one, some two or three
+    u = _uniform(households, 0, seed)
+    units_per_household = 1 + (u < 0.15) + (u < 0.03)
+    unit_household = np.repeat(np.arange(n_households), units_per_household)
+    unit_rank = np.arange(len(unit_household)) - np.repeat(
+        np.cumsum(units_per_household) - units_per_household, units_per_household
+    )
+    unit_keys = unit_household.astype(np.uint64) * np.uint64(4) + unit_rank.astype(
+        np.uint64
+    )
+    first_unit = unit_rank == 0
+    married = _uniform(unit_keys, 1, seed) < np.where(first_unit, 0.45, 0.05)
+    u = _uniform(unit_keys, 2, seed)
+    dependents = np.where(
+        first_unit,
+        np.searchsorted([0.6, 0.75, 0.9, 0.97, 0.99], u, side="right"),
+        u < 0.1,
+    ).astype(np.int64)
+    unit_size = 1 + married + dependents
+
+    # Persons: head, then spouse, then dependents of each tax unit
+    person_unit = np.repeat(np.arange(len(unit_household)), unit_size)
+    role = np.arange(len(person_unit)) - np.repeat(
+        np.cumsum(unit_size) - unit_size, unit_size
+    )
+    is_head = role == 0
+    is_spouse = (role == 1) & married[person_unit]
+    is_dependent = ~is_head & ~is_spouse
+    person_household = unit_household[person_unit]
+    household_size = np.bincount(person_household, minlength=n_households)
+    person_rank = np.arange(len(person_unit)) - np.repeat(
+        np.cumsum(household_size) - household_size, household_size
+    )
+    person_keys = person_household.astype(np.uint64) * np.uint64(64) + (
+        person_rank.astype(np.uint64)
+    )
+
+    head_age = np.floor(18 + 67 * _uniform(unit_keys, 3, seed) ** 1.2)
+    u = _uniform(person_keys, 4, seed)
+    age = np.where(
+        is_dependent,
+        np.floor(18 * u),
+        np.clip(
+            head_age[person_unit] + np.where(is_spouse, np.round(10 * u - 5), 0), 18, 90
+        ),
+    )
+
+    person = {
+        "household_id": person_household + 1,
+        "tax_unit_id": person_unit + 1,
+        "age": age,
+        "is_tax_unit_head": is_head,
+        "is_tax_unit_spouse": is_spouse,
+        "is_tax_unit_dependent": is_dependent,
+        "is_married": married[person_unit] & ~is_dependent,
+        "ssn_card_type": np.array(list(SSN_CARD_TYPES), dtype=object)[
+            _choice(SSN_CARD_TYPES, _uniform(person_keys, 5, seed))
+        ],
+    }
+
+    state = _choice(STATE_SHARES, _uniform(households, 6, seed))
+    household = {
+        "household_id": np.arange(1, n_households + 1),
+        "state_code": np.array(list(STATE_SHARES), dtype=object)[state],
+        # State income tax rates from 0% to 6%
+        "state_tax_rate": 0.01 * (state % 7),
+        "household_size": household_size,
+        "tax_unit_dependents": np.bincount(
+            person_household[is_dependent], minlength=n_households
+        ),
+        "household_weight": 50 + 3_000 * _uniform(households, 7, seed),
+    }
+    for stream, (variable, (share, median)) in enumerate(INCOME_SOURCES.items(), 8):
+        has_income = _uniform(households, 2 * stream, seed) < share
+        amount = _lognormal(
+            _uniform(households, 2 * stream + 1, seed),
+            _uniform(households, 2 * stream + 100, seed),
+            median,
+        )
+        household[variable] = np.where(has_income, np.round(amount, 2), 0.0)
+    return household, person
+
+
+def _reform_effect(reform):
+    """Deterministic size, between -0.1 and 0.1, of a reform's effect."""
+    if reform is None:
+        return 0.0
+    parameter_values = json.dumps(
+        reform_parameter_dicts(reform), sort_keys=True, default=str
+    )
+    digest = hashlib.sha256(parameter_values.encode()).digest()
+    return int.from_bytes(digest[:4], "little") / 2**32 * 0.2 - 0.1
+
+
+@lru_cache(maxsize=2)
+def dataset_population(dataset):
+    """Household and person arrays of the households a dataset keeps."""
+    household, person = _population(dataset.n_households, dataset.seed)
+    if dataset.households is None:
+        return household, person
+    rows = np.asarray(dataset.households, dtype=np.int64)
+    # Persons are generated household by household, in household order
+    persons = np.isin(person["household_id"], household["household_id"][rows])
+    return (
+        {variable: values[rows] for variable, values in household.items()},
+        {variable: values[persons] for variable, values in person.items()},
+    )
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    """
+    Synthetic population of households for SyntheticMicrosimulation.
+
+    Parameters:
+    -----------
+    n_households : int
+        Number of households
+    seed : int
+        Seed of every generated value
+    calculate_seconds : float
+        Minimum time each calculate call takes per million households, to
+        mimic the cost of the real model. 0 returns as soon as possible.
+    households : tuple, optional
+        Positions of the households to keep, in increasing order, with
+        their persons. All n_households if None.
+    subset : str, optional
+        Name of the households kept, e.g. "shard 1 of 4", shown instead of
+        their positions
+    """
+
+    n_households: int = 10_000
+    seed: int = 0
+    calculate_seconds: float = 0.0
+    households: tuple = field(default=None, repr=False)
+    subset: str = None
+
+    def simulation(self, reform=None):
+        """Create a simulation of reform on this dataset."""
+        return SyntheticMicrosimulation(reform=reform, dataset=self)
+
+
+class SyntheticMicrosimulation:
+    """
+    Microsimulation-like interface over a SyntheticDataset.
+
+    calculate always returns plain arrays, as Microsimulation.calculate
+    does with use_weights=False, and caches them like the real model.
+    """
+
+    def __init__(self, reform=None, dataset=None):
+        self.dataset = dataset if dataset is not None else SyntheticDataset()
+        self.effect = _reform_effect(reform)
+        self._household, self._person = dataset_population(self.dataset)
+        self._calculated = {}
+
+    def calculate(
+        self, variable, period=None, map_to=None, use_weights=True, decode_enums=True
+    ):
+        start = time.perf_counter()
+        year = int(period) if period is not None else 2024
+        if map_to == "person":
+            values = self._person[variable]
+        else:
+            values = self._household_value(variable, year)
+        n_households = len(self._household["household_id"])
+        delay = self.dataset.calculate_seconds * n_households / 1e6
+        remaining = delay - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        return values
+
+    def _household_value(self, variable, year):
+        key = (variable, year)
+        if key not in self._calculated:
+            self._calculated[key] = self._household_formula(variable, year)
+        return self._calculated[key]
+
+    def _household_formula(self, variable, year):
+        household = self._household
+        uprating = (1 + UPRATING) ** (year - 2024)
+        if variable in INCOME_SOURCES:
+            return household[variable] * uprating
+        if variable in household:
+            return household[variable]
+
+        def calculate(name):
+            return self._household_value(name, year)
+
+        market_income = sum(
+            calculate(name)
+            for name in INCOME_SOURCES
+            if name
+            not in ("social_security", "auto_loan_interest", "real_estate_taxes")
+        )
+        size = household["household_size"]
+        dependents = household["tax_unit_dependents"]
+
+        if variable == "household_market_income":
+            return market_income
+        if variable == "taxable_social_security":
+            return 0.5 * calculate("social_security")
+        if variable == "irs_gross_income":
+            return market_income + calculate("taxable_social_security")
+        if variable == "adjusted_gross_income":
+            return 0.95 * calculate("irs_gross_income")
+        if variable == "income_tax":
+            agi = calculate("adjusted_gross_income")
+            deduction = 15_000 * uprating * (1 + (size > 1))
+            taxable = np.maximum(agi - deduction, 0)
+            tax = 0.12 * taxable + 0.1 * np.maximum(taxable - 100_000 * uprating, 0)
+            tax -= 2_000 * dependents
+            return np.round(tax * (1 + self.effect), 2)
+        if variable == "state_income_tax":
+            agi = calculate("adjusted_gross_income")
+            rate = household["state_tax_rate"]
+            return np.round(rate * agi * (1 + self.effect / 2), 2)
+        low_income = market_income < 30_000 * size * uprating
+        if variable == "household_benefits":
+            benefits = np.where(low_income, 3_000 * size, 0) + calculate(
+                "social_security"
+            )
+            return np.round(benefits * uprating * (1 - self.effect / 4), 2)
+        if variable == "medicaid":
+            return np.where(low_income, 7_000.0 * size * uprating, 0)
+        if variable == "aca_ptc":
+            middle_income = ~low_income & (market_income < 60_000 * size * uprating)
+            return np.where(middle_income, 4_000.0 * uprating * (1 + self.effect), 0)
+        if variable == "chip":
+            return np.where(low_income, 2_500.0 * dependents * uprating, 0)
+        if variable == "household_net_income_including_health_benefits":
+            return (
+                market_income
+                + calculate("household_benefits")
+                + calculate("medicaid")
+                + calculate("aca_ptc")
+                + calculate("chip")
+                - calculate("income_tax")
+                - calculate("state_income_tax")
+            )
+        raise ValueError(f"Variable {variable} is not in the synthetic dataset")